@@ -0,0 +1,35 @@
+"""세그먼트 임베딩
+
+Revision ID: 0a01cb98c8f8
+Revises: 6b349d118961
+Create Date: 2026-10-19 13:21:44.902317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector.sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a01cb98c8f8'
+down_revision: Union[str, Sequence[str], None] = '6b349d118961'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.add_column('transcript_segments', sa.Column('embedding', pgvector.sqlalchemy.Vector(dim=768), nullable=True))
+    op.create_index(
+        'ix_transcript_segments_embedding', 'transcript_segments', ['embedding'],
+        unique=False, postgresql_using='hnsw', postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transcript_segments_embedding', table_name='transcript_segments', postgresql_using='hnsw')
+    op.drop_column('transcript_segments', 'embedding')
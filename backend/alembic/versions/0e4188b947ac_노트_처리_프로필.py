@@ -0,0 +1,29 @@
+"""노트 처리 프로필
+
+Revision ID: 0e4188b947ac
+Revises: 7010cc0dbfa9
+Create Date: 2026-10-19 11:33:50.308861
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0e4188b947ac'
+down_revision: Union[str, Sequence[str], None] = '7010cc0dbfa9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('notes', sa.Column('processing_profile', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('notes', 'processing_profile')
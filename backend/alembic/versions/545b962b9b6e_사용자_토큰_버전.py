@@ -0,0 +1,28 @@
+"""사용자 토큰 버전
+
+Revision ID: 545b962b9b6e
+Revises: 842c310ba5a9
+Create Date: 2026-10-19 14:47:30.118264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '545b962b9b6e'
+down_revision: Union[str, Sequence[str], None] = '842c310ba5a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
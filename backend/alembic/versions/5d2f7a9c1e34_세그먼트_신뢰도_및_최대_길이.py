@@ -0,0 +1,54 @@
+"""세그먼트 신뢰도 및 최대 길이
+
+Revision ID: 5d2f7a9c1e34
+Revises: c43d0b85e23b
+Create Date: 2026-10-19 14:10:42.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.triggers import (
+    SEGMENT_SPAN_FUNCTION,
+    SEGMENT_SPAN_TRIGGER,
+    SEGMENTS_SYNC_FUNCTION,
+    SEGMENTS_SYNC_FUNCTION_V1,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f7a9c1e34'
+down_revision: Union[str, Sequence[str], None] = 'c43d0b85e23b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('transcript_segments', sa.Column('confidence', sa.Float(), nullable=True))
+    op.add_column('transcripts', sa.Column('max_segment_seconds', sa.Float(), nullable=True))
+
+    for ddl in (SEGMENTS_SYNC_FUNCTION, SEGMENT_SPAN_FUNCTION, SEGMENT_SPAN_TRIGGER):
+        op.execute(ddl)
+
+    # 기존 행 백필 (트리거를 거치지 않고 세그먼트 행을 다시 만들지 않음)
+    op.execute("""
+    UPDATE transcript_segments s SET confidence = (t.segments->s.seq->>'confidence')::float
+    FROM transcripts t WHERE t.note_id = s.note_id
+    """)
+    op.execute("""
+    UPDATE transcripts t SET max_segment_seconds = (
+        SELECT max((seg->>'end')::float - (seg->>'start')::float)
+        FROM jsonb_array_elements(coalesce(t.segments, '[]'::jsonb)) AS seg
+    )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS transcripts_segment_span ON transcripts")
+    op.execute("DROP FUNCTION IF EXISTS transcripts_segment_span_trigger()")
+    op.execute(SEGMENTS_SYNC_FUNCTION_V1)
+    op.drop_column('transcripts', 'max_segment_seconds')
+    op.drop_column('transcript_segments', 'confidence')
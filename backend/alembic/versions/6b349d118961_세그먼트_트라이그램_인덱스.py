@@ -0,0 +1,33 @@
+"""세그먼트 트라이그램 인덱스
+
+Revision ID: 6b349d118961
+Revises: a6d8cbb1b1b0
+Create Date: 2026-10-19 11:48:05.377120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b349d118961'
+down_revision: Union[str, Sequence[str], None] = 'a6d8cbb1b1b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # docker/postgres/init.sql에서도 생성하지만 기존 DB를 위해 보장
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_transcript_segments_text_trgm', 'transcript_segments', ['text'],
+        unique=False, postgresql_using='gin', postgresql_ops={'text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transcript_segments_text_trgm', table_name='transcript_segments', postgresql_using='gin')
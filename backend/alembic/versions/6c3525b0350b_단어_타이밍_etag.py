@@ -0,0 +1,33 @@
+"""단어 타이밍 ETag
+
+Revision ID: 6c3525b0350b
+Revises: 5d2f7a9c1e34
+Create Date: 2026-10-19 15:02:37.604918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c3525b0350b'
+down_revision: Union[str, Sequence[str], None] = '5d2f7a9c1e34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('transcripts', sa.Column('word_timings_etag', sa.String(length=64), nullable=True))
+    # 기존 행 백필 (app.services.word_timings.word_timings_etag와 같은 식)
+    op.execute("""
+    UPDATE transcripts SET word_timings_etag = left(encode(sha256(word_timings), 'hex'), 32)
+    WHERE word_timings IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('transcripts', 'word_timings_etag')
@@ -0,0 +1,30 @@
+"""결과 ETag
+
+Revision ID: 7010cc0dbfa9
+Revises: e96f8185c3fb
+Create Date: 2026-10-19 11:04:05.345840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7010cc0dbfa9'
+down_revision: Union[str, Sequence[str], None] = 'e96f8185c3fb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('analyses', sa.Column('etag', sa.String(length=64), nullable=True))
+    op.add_column('transcripts', sa.Column('etag', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('transcripts', 'etag')
+    op.drop_column('analyses', 'etag')
@@ -0,0 +1,30 @@
+"""목록 키셋 인덱스
+
+Revision ID: 842c310ba5a9
+Revises: 0a01cb98c8f8
+Create Date: 2026-10-19 14:05:12.661390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '842c310ba5a9'
+down_revision: Union[str, Sequence[str], None] = '0a01cb98c8f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_projects_user_created', 'projects', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notes_project_created', 'notes', ['project_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notes_project_created', table_name='notes')
+    op.drop_index('ix_projects_user_created', table_name='projects')
@@ -0,0 +1,47 @@
+"""검색 인덱스 및 가중치 벡터
+
+Revision ID: 8cd1bed14154
+Revises: 712de47eec91
+Create Date: 2026-10-19 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.triggers import SEARCH_VECTOR_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8cd1bed14154'
+down_revision: Union[str, Sequence[str], None] = '712de47eec91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for ddl in SEARCH_VECTOR_DDL:
+        op.execute(ddl)
+
+    # 기존 데이터 가중치 벡터로 재계산
+    op.execute("UPDATE transcripts SET search_vector = note_search_document(note_id, full_text)")
+
+    op.create_index(
+        'ix_transcripts_search_vector', 'transcripts', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transcripts_search_vector', table_name='transcripts', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS notes_search_vector_refresh ON notes")
+    op.execute("DROP TRIGGER IF EXISTS analyses_search_vector_refresh ON analyses")
+    op.execute("DROP TRIGGER IF EXISTS transcripts_search_vector_update ON transcripts")
+    op.execute("DROP FUNCTION IF EXISTS notes_search_vector_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS analyses_search_vector_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS transcripts_search_vector_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS note_search_document(uuid, text)")
+    op.execute("UPDATE transcripts SET search_vector = to_tsvector('simple', coalesce(full_text, ''))")
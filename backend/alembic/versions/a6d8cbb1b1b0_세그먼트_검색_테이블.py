@@ -0,0 +1,57 @@
+"""세그먼트 검색 테이블
+
+Revision ID: a6d8cbb1b1b0
+Revises: 8cd1bed14154
+Create Date: 2026-10-19 11:02:17.204411
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.triggers import SEGMENTS_SYNC_FUNCTION_V1, SEGMENTS_SYNC_TRIGGER
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d8cbb1b1b0'
+down_revision: Union[str, Sequence[str], None] = '8cd1bed14154'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transcript_segments',
+    sa.Column('note_id', sa.UUID(), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('speaker', sa.String(length=50), nullable=True),
+    sa.Column('start_seconds', sa.Float(), nullable=False),
+    sa.Column('end_seconds', sa.Float(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('simple', text)", persisted=True), nullable=False),
+    sa.ForeignKeyConstraint(['note_id'], ['notes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('note_id', 'seq')
+    )
+    op.create_index('ix_transcript_segments_note_start', 'transcript_segments', ['note_id', 'start_seconds'], unique=False)
+    op.create_index('ix_transcript_segments_search_vector', 'transcript_segments', ['search_vector'], unique=False, postgresql_using='gin')
+
+    for ddl in (SEGMENTS_SYNC_FUNCTION_V1, SEGMENTS_SYNC_TRIGGER):
+        op.execute(ddl)
+
+    # 기존 트랜스크립트 세그먼트 백필
+    op.execute("""
+    INSERT INTO transcript_segments (note_id, seq, speaker, start_seconds, end_seconds, text)
+    SELECT t.note_id, e.ord - 1, e.seg->>'speaker',
+           (e.seg->>'start')::float, (e.seg->>'end')::float, coalesce(e.seg->>'text', '')
+    FROM transcripts t, jsonb_array_elements(t.segments) WITH ORDINALITY AS e(seg, ord)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS transcripts_segments_sync ON transcripts")
+    op.execute("DROP FUNCTION IF EXISTS transcripts_segments_sync_trigger()")
+    op.drop_index('ix_transcript_segments_search_vector', table_name='transcript_segments', postgresql_using='gin')
+    op.drop_index('ix_transcript_segments_note_start', table_name='transcript_segments')
+    op.drop_table('transcript_segments')
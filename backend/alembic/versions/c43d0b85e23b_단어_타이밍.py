@@ -0,0 +1,28 @@
+"""단어 타이밍
+
+Revision ID: c43d0b85e23b
+Revises: 0e4188b947ac
+Create Date: 2026-10-19 12:04:17.512390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c43d0b85e23b'
+down_revision: Union[str, Sequence[str], None] = '0e4188b947ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('transcripts', sa.Column('word_timings', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('transcripts', 'word_timings')
@@ -0,0 +1,30 @@
+"""직렬화 페이로드
+
+Revision ID: e96f8185c3fb
+Revises: 2e9b75a36ed7
+Create Date: 2026-10-19 11:01:55.231635
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e96f8185c3fb'
+down_revision: Union[str, Sequence[str], None] = '2e9b75a36ed7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('analyses', sa.Column('payload', sa.LargeBinary(), nullable=True))
+    op.add_column('transcripts', sa.Column('payload', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('transcripts', 'payload')
+    op.drop_column('analyses', 'payload')
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
+from app.services.auth_cache import auth_cache
 
 security = HTTPBearer()
 
@@ -21,13 +22,21 @@ async def get_current_user(
     try:
         payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=[settings.algorithm])
         user_id = uuid.UUID(payload["sub"])
-    except (JWTError, KeyError, ValueError):
+        token_version = int(payload.get("ver", 0))
+    except (JWTError, KeyError, TypeError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다")
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="사용자를 찾을 수 없습니다")
+    user = await auth_cache.get_cached_user(user_id)
+    # 버전이 다르면 캐시가 오래되었을 수 있으므로 (다른 프로세스의 재로그인 등) DB로 다시 확인
+    if user is None or user.token_version != token_version:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="사용자를 찾을 수 없습니다")
+        await auth_cache.cache_user(user)
+
+    if token_version != user.token_version:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="만료된 토큰입니다")
     return user
 
 
@@ -0,0 +1,67 @@
+# backend/app/api/pagination.py
+"""키셋(커서) 페이지네이션 헬퍼.
+
+커서는 마지막 항목의 정렬 키를 JSON으로 직렬화한 뒤 base64url로 인코딩한
+불투명 문자열입니다. 다음 페이지 커서는 `X-Next-Cursor` 응답 헤더로 전달합니다.
+"""
+
+import base64
+import json
+
+from fastapi import HTTPException, Query, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class PageParams:
+    """`limit`/`cursor` 쿼리 파라미터 의존성."""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: str | None = None,
+    ):
+        self.limit = limit
+        self.cursor = cursor
+
+    def decode(self, *types) -> tuple | None:
+        """커서를 디코딩하고 각 값을 주어진 타입으로 변환합니다."""
+        if self.cursor is None:
+            return None
+        values = decode_cursor(self.cursor)
+        if len(values) != len(types):
+            raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+        try:
+            return tuple(t(v) for t, v in zip(types, values))
+        # 조작된 커서의 값 타입이 다르면 변환 함수마다 다른 예외 (예: uuid.UUID(정수) → AttributeError)
+        except (TypeError, ValueError, AttributeError):
+            raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps([str(v) if not isinstance(v, (int, float)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+    if not isinstance(values, list):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+    return values
+
+
+def paginate(rows: list, page: PageParams, response: Response, key) -> list:
+    """limit+1개로 조회한 결과를 잘라내고 다음 커서를 헤더에 설정합니다.
+
+    key: 마지막 행에서 커서 값 튜플을 꺼내는 함수
+    """
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(rows[-1]))
+    return rows
@@ -1,23 +1,43 @@
 # backend/app/api/routes/auth.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.deps import get_current_user
 from app.core.database import get_db
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import (
+    PasswordHasherBusy,
+    create_access_token,
+    hash_password_async,
+    verify_password_async,
+)
 from app.models.user import User
 from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse, UserResponse
+from app.services.auth_cache import auth_cache
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(req: RegisterRequest, db: AsyncSession = Depends(get_db)):
     existing = await db.execute(select(User).where(User.email == req.email))
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
 
-    user = User(email=req.email, name=req.name, password_hash=hash_password(req.password))
+    try:
+        password_hash = await hash_password_async(req.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+    user = User(email=req.email, name=req.name, password_hash=password_hash)
     db.add(user)
     await db.commit()
     await db.refresh(user)
@@ -28,8 +48,25 @@ async def register(req: RegisterRequest, db: AsyncSession = Depends(get_db)):
 async def login(req: LoginRequest, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == req.email))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(req.password, user.password_hash):
+    try:
+        valid = user is not None and await verify_password_async(req.password, user.password_hash)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+    if not valid:
         raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다")
 
-    token = create_access_token({"sub": str(user.id)})
+    token = create_access_token({"sub": str(user.id), "ver": user.token_version})
     return TokenResponse(access_token=token)
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """토큰 버전을 올려 이 사용자에게 발급된 모든 토큰을 무효화합니다."""
+    await db.execute(
+        update(User).where(User.id == user.id).values(token_version=User.token_version + 1)
+    )
+    await db.commit()
+    await auth_cache.invalidate_user(user.id)
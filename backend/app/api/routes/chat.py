@@ -8,14 +8,20 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.core.metrics import observe_ollama
 from app.models.note import Analysis, ChatSession, Note, Project, Transcript
 from app.models.user import User
 from app.schemas.chat import ChatHistoryResponse, ChatRequest, ChatResponse
+from app.services import note_cache
 
 router = APIRouter(prefix="/api/notes", tags=["chat"])
 
-OLLAMA_URL = "http://voice-ollama:11434"
+CHAT_MODEL = "llama3.2"
+
+# 프롬프트에 넣는 트랜스크립트 앞부분 길이 (워커의 캐시 기록과 동일해야 함)
+CHAT_CONTEXT_CHARS = 4000
 
 
 @router.post("/{note_id}/chat", response_model=ChatResponse)
@@ -26,21 +32,26 @@ async def chat_with_note(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    # 노트 소유권 확인
-    result = await db.execute(
-        select(Note).join(Project).where(Note.id == note_id, Project.user_id == user.id)
-    )
-    note = result.scalar_one_or_none()
-    if not note:
-        raise HTTPException(status_code=404, detail="노트를 찾을 수 없습니다")
-
-    # 트랜스크립트 로드
-    t_result = await db.execute(select(Transcript).where(Transcript.note_id == note_id))
-    transcript = t_result.scalar_one_or_none()
-
-    # 분석 결과 로드
-    a_result = await db.execute(select(Analysis).where(Analysis.note_id == note_id))
-    analysis = a_result.scalar_one_or_none()
+    # 노트 소유권 확인 + 프롬프트 컨텍스트 로드 (완료된 노트는 Redis 캐시에서)
+    context = await note_cache.get_chat_context(note_id, user.id)
+    if context is None:
+        result = await db.execute(
+            select(Note.status, Transcript.full_text, Analysis.summary, Analysis.keywords)
+            .join(Project, Project.id == Note.project_id)
+            .outerjoin(Transcript, Transcript.note_id == Note.id)
+            .outerjoin(Analysis, Analysis.note_id == Note.id)
+            .where(Note.id == note_id, Project.user_id == user.id)
+        )
+        row = result.one_or_none()
+        if not row:
+            raise HTTPException(status_code=404, detail="노트를 찾을 수 없습니다")
+        context = {
+            "full_text": (row.full_text or "")[:CHAT_CONTEXT_CHARS],
+            "summary": row.summary,
+            "keywords": row.keywords,
+        }
+        if row.status == "completed":
+            await note_cache.fill_chat_context(note_id, user.id, context)
 
     # 세션 로드 또는 생성
     if session_id:
@@ -56,12 +67,12 @@ async def chat_with_note(
 
     # 시스템 프롬프트 구성
     context_parts = []
-    if transcript and transcript.full_text:
-        context_parts.append(f"[트랜스크립트]\n{transcript.full_text[:4000]}")
-    if analysis and analysis.summary:
-        context_parts.append(f"[요약]\n{analysis.summary}")
-    if analysis and analysis.keywords:
-        context_parts.append(f"[키워드]\n{', '.join(analysis.keywords)}")
+    if context["full_text"]:
+        context_parts.append(f"[트랜스크립트]\n{context['full_text']}")
+    if context["summary"]:
+        context_parts.append(f"[요약]\n{context['summary']}")
+    if context["keywords"]:
+        context_parts.append(f"[키워드]\n{', '.join(context['keywords'])}")
 
     system_prompt = (
         "당신은 음성 녹음 내용을 분석하는 AI 어시스턴트입니다. "
@@ -79,14 +90,16 @@ async def chat_with_note(
 
     async with httpx.AsyncClient(timeout=60.0) as client:
         resp = await client.post(
-            f"{OLLAMA_URL}/api/chat",
-            json={"model": "llama3.2", "messages": ollama_messages, "stream": False},
+            f"{settings.ollama_url}/api/chat",
+            json={"model": CHAT_MODEL, "messages": ollama_messages, "stream": False},
         )
 
     if resp.status_code != 200:
         raise HTTPException(status_code=502, detail="AI 서비스 응답 오류")
 
-    reply = resp.json()["message"]["content"]
+    body = resp.json()
+    observe_ollama(CHAT_MODEL, body)
+    reply = body["message"]["content"]
 
     # 어시스턴트 응답 추가
     messages.append({"role": "assistant", "content": reply, "timestamp": datetime.now(timezone.utc).isoformat()})
@@ -101,7 +114,7 @@ async def chat_with_note(
 async def chat_history(
     note_id: uuid.UUID,
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     result = await db.execute(
         select(ChatSession).join(Note).join(Project).where(
@@ -1,30 +1,91 @@
 # backend/app/api/routes/notes.py
+import hashlib
 import os
+import shutil
+import time
 import uuid
+from datetime import datetime
 
 import aiofiles
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import FileResponse
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
+from app.api.pagination import PageParams, paginate
 from app.core.config import settings
-from app.core.database import get_db
-from app.models.note import Analysis, Bookmark, Note, Project, Transcript
+from app.core.database import get_db, get_read_db
+from app.core.metrics import UPLOAD_BYTES, UPLOAD_DURATION
+from app.core.tracing import tracer
+from app.models.note import Analysis, Bookmark, Note, Project, Segment, Transcript
 from app.models.user import User
 from app.schemas.note import (
     AnalysisResponse,
     BookmarkCreate,
     BookmarkResponse,
+    NoteDetailResponse,
+    NoteListItem,
     NoteResponse,
+    ReanalysisResponse,
     TranscriptResponse,
+    TranscriptSegment,
+    WordTimingsResponse,
 )
-from app.services.queue import enqueue_job
+from app.services import note_cache
+from app.services.payloads import ARTIFACT_CACHE_CONTROL, artifact_response, etag_matches, not_modified
+from app.services.queue import enqueue_job, enqueue_reanalysis
+from app.services.word_timings import words_in_window
 
 router = APIRouter(prefix="/api/notes", tags=["notes"])
 
 ALLOWED_EXTENSIONS = {".mp3", ".wav", ".m4a", ".webm", ".ogg", ".flac"}
 
+# 업로드된 오디오 파일은 수정되지 않으므로 장기 캐시
+AUDIO_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+@router.get("", response_model=list[NoteListItem])
+async def list_notes(
+    response: Response,
+    project_id: uuid.UUID | None = None,
+    page: PageParams = Depends(),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """최신순 노트 목록 + 분석 요약/키워드.
+
+    목록 화면용 컬럼만 단일 조인 쿼리로 조회해 노트별 추가 요청(N+1)과
+    세그먼트 JSONB 로드를 피합니다. (created_at, id) 키셋 커서로 페이지를 나눕니다.
+    """
+    query = (
+        select(
+            Note.id,
+            Note.project_id,
+            Note.title,
+            Note.duration_seconds,
+            Note.language,
+            Note.status,
+            Note.created_at,
+            Analysis.summary,
+            Analysis.keywords,
+        )
+        .join(Project, Project.id == Note.project_id)
+        .outerjoin(Analysis, Analysis.note_id == Note.id)
+        .where(Project.user_id == user.id)
+        .order_by(Note.created_at.desc(), Note.id.desc())
+        .limit(page.limit + 1)
+    )
+    if project_id:
+        query = query.where(Note.project_id == project_id)
+
+    cursor = page.decode(datetime.fromisoformat, uuid.UUID)
+    if cursor:
+        query = query.where(tuple_(Note.created_at, Note.id) < tuple_(*cursor))
+
+    result = await db.execute(query)
+    return paginate(result.all(), page, response, key=lambda row: (row.created_at, row.id))
+
 
 @router.post("/upload", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
 async def upload_note(
@@ -49,9 +110,13 @@ async def upload_note(
     file_path = os.path.join(settings.upload_dir, f"{file_id}{ext}")
     os.makedirs(settings.upload_dir, exist_ok=True)
 
-    async with aiofiles.open(file_path, "wb") as f:
-        content = await file.read()
-        await f.write(content)
+    started = time.perf_counter()
+    with tracer.start_as_current_span("upload.save"):
+        async with aiofiles.open(file_path, "wb") as f:
+            content = await file.read()
+            await f.write(content)
+    UPLOAD_BYTES.labels("notes").inc(len(content))
+    UPLOAD_DURATION.labels("notes").observe(time.perf_counter() - started)
 
     # 노트 생성
     note = Note(
@@ -60,9 +125,10 @@ async def upload_note(
         audio_path=file_path,
         status="queued",
     )
-    db.add(note)
-    await db.commit()
-    await db.refresh(note)
+    with tracer.start_as_current_span("db.insert_note"):
+        db.add(note)
+        await db.commit()
+        await db.refresh(note)
 
     # AI 처리 큐에 등록
     await enqueue_job(str(note.id), file_path)
@@ -70,7 +136,7 @@ async def upload_note(
     return note
 
 
-@router.get("/{note_id}", response_model=NoteResponse)
+@router.get("/{note_id}", response_model=NoteDetailResponse)
 async def get_note(
     note_id: uuid.UUID,
     user: User = Depends(get_current_user),
@@ -100,43 +166,218 @@ async def delete_note(
 
     if os.path.exists(note.audio_path):
         os.remove(note.audio_path)
+    # 워커가 남긴 단계 체크포인트 (실패 후 재시도 대기 중이던 작업)
+    shutil.rmtree(os.path.join(settings.upload_dir, ".checkpoints", str(note.id)), ignore_errors=True)
 
     await db.delete(note)
     await db.commit()
+    await note_cache.invalidate(note_id)
+
+
+@router.post("/{note_id}/reanalyze", response_model=ReanalysisResponse, status_code=status.HTTP_202_ACCEPTED)
+async def reanalyze_note(
+    note_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """저장된 트랜스크립트로 분석(요약/키워드)만 다시 실행합니다. STT는 다시 하지 않습니다."""
+    result = await db.execute(
+        select(Note.id, Transcript.id)
+        .join(Project)
+        .outerjoin(Transcript, Transcript.note_id == Note.id)
+        .where(Note.id == note_id, Project.user_id == user.id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="노트를 찾을 수 없습니다")
+    if row[1] is None:
+        raise HTTPException(status_code=409, detail="트랜스크립트가 없어 다시 분석할 수 없습니다")
+
+    await enqueue_reanalysis([str(note_id)])
+    return ReanalysisResponse(queued=1)
+
+
+@router.get("/{note_id}/audio")
+async def get_audio(
+    request: Request,
+    note_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """원본 오디오 파일 (Range 요청 지원)."""
+    result = await db.execute(
+        select(Note.audio_path).join(Project).where(Note.id == note_id, Project.user_id == user.id)
+    )
+    audio_path = result.scalar_one_or_none()
+    if not audio_path or not os.path.isfile(audio_path):
+        raise HTTPException(status_code=404, detail="오디오 파일을 찾을 수 없습니다")
+
+    stat = os.stat(audio_path)
+    etag = hashlib.sha256(f"{note_id}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:32]
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return not_modified(f'"{etag}"', AUDIO_CACHE_CONTROL)
+    return FileResponse(
+        audio_path,
+        stat_result=stat,
+        headers={"ETag": f'"{etag}"', "Cache-Control": AUDIO_CACHE_CONTROL},
+    )
+
+
+MAX_TRANSCRIPT_SEGMENTS = 1000
 
 
 @router.get("/{note_id}/transcript", response_model=TranscriptResponse)
 async def get_transcript(
+    request: Request,
+    response: Response,
     note_id: uuid.UUID,
+    start: float | None = Query(default=None, ge=0),
+    end: float | None = Query(default=None, ge=0),
+    offset: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=MAX_TRANSCRIPT_SEGMENTS),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    """트랜스크립트 조회.
+
+    start/end(초)를 지정하면 해당 구간과 겹치는 세그먼트만, offset/limit을 지정하면
+    세그먼트 순번 기준 일부만 반환합니다. 이 경우 segments JSONB 전체를 읽지 않고
+    transcript_segments 인덱스에서 필요한 행만 조회하며, full_text는 반환된
+    세그먼트의 텍스트만 이어 붙인 값입니다.
+
+    전체 조회는 워커가 미리 직렬화해 둔 페이로드를 그대로 전송합니다.
+    Accept: application/msgpack이면 MessagePack으로 응답합니다.
+    구간 조회도 트랜스크립트 ETag로 조건부 요청(304)을 지원합니다.
+    """
+    windowed = start is not None or end is not None or offset > 0 or limit is not None
+    if not windowed:
+        query = select(Transcript.id, Transcript.etag).join(Note).join(Project).where(
+            Transcript.note_id == note_id, Project.user_id == user.id
+        )
+        response = await artifact_response(
+            request, db, query, Transcript, TranscriptResponse, "transcript", note_id, user.id
+        )
+        if response is None:
+            raise HTTPException(status_code=404, detail="트랜스크립트를 찾을 수 없습니다")
+        return response
+
     result = await db.execute(
-        select(Transcript).join(Note).join(Project).where(
+        select(Transcript.id, Transcript.etag, Transcript.max_segment_seconds).join(Note).join(Project).where(
             Transcript.note_id == note_id, Project.user_id == user.id
         )
     )
-    transcript = result.scalar_one_or_none()
+    transcript = result.one_or_none()
     if not transcript:
         raise HTTPException(status_code=404, detail="트랜스크립트를 찾을 수 없습니다")
-    return transcript
+    # 구간 응답은 URL(구간 파라미터)마다 다르지만 같은 트랜스크립트에서는 바뀌지 않음
+    if transcript.etag:
+        if etag_matches(request.headers.get("if-none-match", ""), transcript.etag):
+            return not_modified(f'"{transcript.etag}"')
+        response.headers["ETag"] = f'"{transcript.etag}"'
+        response.headers["Cache-Control"] = ARTIFACT_CACHE_CONTROL
+
+    query = (
+        select(Segment.speaker, Segment.start_seconds, Segment.end_seconds, Segment.text, Segment.confidence)
+        .where(Segment.note_id == note_id)
+        .order_by(Segment.seq)
+        .limit(limit)
+    )
+    if start is None and end is None:
+        # 순번이 0부터 연속이므로 OFFSET 대신 기본 키 범위 탐색
+        query = query.where(Segment.seq >= offset)
+    else:
+        if start is not None:
+            # end_seconds 조건만으로는 (note_id, start_seconds) 인덱스 범위가 정해지지 않으므로
+            # 가장 긴 세그먼트 길이만큼 앞에서부터 읽음
+            query = query.where(
+                Segment.start_seconds >= start - (transcript.max_segment_seconds or 0.0),
+                Segment.end_seconds > start,
+            )
+        if end is not None:
+            query = query.where(Segment.start_seconds < end)
+        query = query.offset(offset)
+
+    rows = (await db.execute(query)).all()
+    segments = [
+        TranscriptSegment(
+            speaker=row.speaker or "",
+            start=row.start_seconds,
+            end=row.end_seconds,
+            text=row.text,
+            confidence=row.confidence,
+        )
+        for row in rows
+    ]
+    return TranscriptResponse(
+        id=transcript.id,
+        note_id=note_id,
+        segments=segments,
+        full_text=" ".join(s.text for s in segments),
+    )
+
+
+# 단어 타이밍 한 번에 조회할 수 있는 최대 구간 (초)
+MAX_WORD_WINDOW_SECONDS = 300.0
+
+
+@router.get("/{note_id}/transcript/words", response_model=WordTimingsResponse)
+async def get_word_timings(
+    request: Request,
+    response: Response,
+    note_id: uuid.UUID,
+    start: float = Query(default=0.0, ge=0),
+    end: float | None = Query(default=None, ge=0),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """[start, end) 구간과 겹치는 단어의 시작/끝/신뢰도 (재생 위치 하이라이트용).
+
+    단어별 객체 대신 같은 길이의 배열(열 단위)로 반환하며, segments는 단어가 속한
+    세그먼트 순번입니다. 구간은 최대 MAX_WORD_WINDOW_SECONDS이고 넘으면 잘라서
+    실제 조회한 end를 반환합니다. 압축 저장본에서 해당 범위만 읽습니다.
+    저장본이 바뀌지 않으면 같은 구간의 응답도 같으므로 워커가 저장한 저장본 해시를 ETag로 쓰며,
+    조건부 요청이 맞으면 저장본을 읽지 않고 304를 반환합니다.
+    """
+    end = min(start + MAX_WORD_WINDOW_SECONDS, end if end is not None else float("inf"))
+    etag = await db.scalar(
+        select(Transcript.word_timings_etag).join(Note).join(Project).where(
+            Transcript.note_id == note_id, Project.user_id == user.id
+        )
+    )
+    if etag is None:
+        raise HTTPException(status_code=404, detail="단어 타이밍을 찾을 수 없습니다")
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return not_modified(f'"{etag}"')
+
+    # 두 조회 사이에 다시 처리됐을 수 있으므로 저장본과 해시를 함께 읽음
+    row = (await db.execute(
+        select(Transcript.word_timings, Transcript.word_timings_etag).where(Transcript.note_id == note_id)
+    )).one_or_none()
+    if row is None or row.word_timings is None:
+        raise HTTPException(status_code=404, detail="단어 타이밍을 찾을 수 없습니다")
+    response.headers["ETag"] = f'"{row.word_timings_etag}"'
+    response.headers["Cache-Control"] = ARTIFACT_CACHE_CONTROL
+    return WordTimingsResponse(
+        note_id=note_id, start=start, end=end, **words_in_window(row.word_timings, start, end)
+    )
 
 
 @router.get("/{note_id}/analysis", response_model=AnalysisResponse)
 async def get_analysis(
+    request: Request,
     note_id: uuid.UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Analysis).join(Note).join(Project).where(
-            Analysis.note_id == note_id, Project.user_id == user.id
-        )
+    query = select(Analysis.id, Analysis.etag).join(Note).join(Project).where(
+        Analysis.note_id == note_id, Project.user_id == user.id
+    )
+    response = await artifact_response(
+        request, db, query, Analysis, AnalysisResponse, "analysis", note_id, user.id
     )
-    analysis = result.scalar_one_or_none()
-    if not analysis:
+    if response is None:
         raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
-    return analysis
+    return response
 
 
 @router.post("/{note_id}/bookmarks", response_model=BookmarkResponse, status_code=status.HTTP_201_CREATED)
@@ -163,7 +404,7 @@ async def create_bookmark(
 async def list_bookmarks(
     note_id: uuid.UUID,
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     result = await db.execute(
         select(Bookmark).join(Note).join(Project).where(
@@ -1,24 +1,43 @@
 # backend/app/api/routes/projects.py
-from fastapi import APIRouter, Depends, status
-from sqlalchemy import select
+import uuid
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
-from app.core.database import get_db
-from app.models.note import Project
+from app.api.pagination import PageParams, paginate
+from app.core.database import get_db, get_read_db
+from app.models.note import Note, Project, Transcript
 from app.models.user import User
+from app.schemas.note import ReanalysisResponse
 from app.schemas.project import ProjectCreate, ProjectResponse
+from app.services.queue import enqueue_reanalysis
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
 
 @router.get("", response_model=list[ProjectResponse])
 async def list_projects(
+    response: Response,
+    page: PageParams = Depends(),
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    result = await db.execute(select(Project).where(Project.user_id == user.id))
-    return result.scalars().all()
+    """최신순 프로젝트 목록 ((created_at, id) 키셋 커서)."""
+    query = (
+        select(Project.id, Project.name, Project.description, Project.created_at)
+        .where(Project.user_id == user.id)
+        .order_by(Project.created_at.desc(), Project.id.desc())
+        .limit(page.limit + 1)
+    )
+    cursor = page.decode(datetime.fromisoformat, uuid.UUID)
+    if cursor:
+        query = query.where(tuple_(Project.created_at, Project.id) < tuple_(*cursor))
+
+    result = await db.execute(query)
+    return paginate(result.all(), page, response, key=lambda row: (row.created_at, row.id))
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
@@ -32,3 +51,29 @@ async def create_project(
     await db.commit()
     await db.refresh(project)
     return project
+
+
+@router.post("/{project_id}/reanalyze", response_model=ReanalysisResponse, status_code=status.HTTP_202_ACCEPTED)
+async def reanalyze_project(
+    project_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """프로젝트의 트랜스크립트가 있는 모든 노트를 다시 분석합니다.
+
+    작업은 저우선순위 큐에 단일 RPUSH로 등록되며, 워커가 새 업로드를 먼저 처리하고
+    남는 시간에 최소 간격을 두고 하나씩 처리합니다.
+    """
+    result = await db.execute(select(Project.id).where(Project.id == project_id, Project.user_id == user.id))
+    if not result.scalar_one_or_none():
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
+
+    result = await db.execute(
+        select(Note.id)
+        .join(Transcript, Transcript.note_id == Note.id)
+        .where(Note.project_id == project_id)
+        .order_by(Note.created_at)
+    )
+    note_ids = [str(note_id) for note_id in result.scalars()]
+    await enqueue_reanalysis(note_ids)
+    return ReanalysisResponse(queued=len(note_ids))
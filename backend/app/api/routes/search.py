@@ -1,31 +1,277 @@
 # backend/app/api/routes/search.py
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+import html
+import uuid
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import func, literal, or_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
-from app.core.database import get_db
-from app.models.note import Note, Project, Transcript
+from app.api.pagination import PageParams, paginate
+from app.core.config import settings
+from app.core.database import get_read_db
+from app.models.note import Note, Project, Segment, Transcript
 from app.models.user import User
-from app.schemas.note import NoteResponse
+from app.schemas.note import NoteResponse, NoteSearchResult, SegmentSearchResult
+from app.services.embedding import embed_query
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
+# 실제로 수행한 검색 방식 (semantic 요청이 임베딩 장애로 fulltext로 대체된 경우 표시)
+SEARCH_MODE_HEADER = "X-Search-Mode"
+
+# 하이라이트 경계 표시 (본문에 나오지 않는 사용자 영역 문자). 본문을 이스케이프한 뒤 <mark>로 바꿈
+MARK_START, MARK_END = "\ue000", "\ue001"
+HEADLINE_OPTIONS = f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=25, MinWords=8, MaxFragments=2"
+
+
+def _render_snippet(snippet: str) -> str:
+    """스니펫을 HTML로 안전하게: 본문은 이스케이프하고 하이라이트 경계만 <mark>로 바꿉니다."""
+    return html.escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
 
-@router.get("", response_model=list[NoteResponse])
+
+@router.get("", response_model=list[NoteSearchResult])
 async def search_notes(
+    response: Response,
     q: str = Query(..., min_length=1),
+    project_id: uuid.UUID | None = None,
+    page: PageParams = Depends(),
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
+    """가중치 검색 벡터(제목 > 요약/키워드 > 본문) 기반 랭킹 검색.
+
+    GIN 인덱스로 후보를 찾고 ts_rank 내림차순으로 정렬하며,
+    (rank, note_id) 키셋 커서로 페이지를 나눕니다.
+    """
+    ts_query = func.plainto_tsquery("simple", q)
+    rank = func.ts_rank(Transcript.search_vector, ts_query).label("rank")
+
     query = (
-        select(Note)
+        select(Note, rank)
         .join(Transcript, Transcript.note_id == Note.id)
         .join(Project, Project.id == Note.project_id)
         .where(
             Project.user_id == user.id,
-            Transcript.search_vector.op("@@")(func.plainto_tsquery("simple", q)),
+            Transcript.search_vector.op("@@")(ts_query),
+        )
+        .order_by(rank.desc(), Note.id.desc())
+        .limit(page.limit + 1)
+    )
+    if project_id:
+        query = query.where(Note.project_id == project_id)
+
+    cursor = page.decode(float, uuid.UUID)
+    if cursor:
+        query = query.where(tuple_(rank, Note.id) < tuple_(*cursor))
+
+    result = await db.execute(query)
+    rows = paginate(result.all(), page, response, key=lambda row: (row.rank, row.Note.id))
+    return [
+        NoteSearchResult(**NoteResponse.model_validate(note).model_dump(), rank=row_rank)
+        for note, row_rank in rows
+    ]
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# 트라이그램 인덱스는 3글자 이상이어야 후보를 좁힐 수 있으므로, 더 짧은 퍼지 검색어는
+# 세그먼트 tsvector 인덱스의 단어 접두 일치(예: 회의 → 회의록에서)로 처리
+FUZZY_MIN_LENGTH = 3
+
+
+def _prefix_tsquery(q: str) -> str:
+    """검색어의 각 단어를 접두 일치로 묶은 to_tsquery 문자열 (tsquery 연산자 문자는 제거)"""
+    terms = ["".join(c for c in word if c.isalnum()) for word in q.split()]
+    return " & ".join(f"{term}:*" for term in terms if term)
+
+
+def _mark_substring(text: str, q: str) -> str:
+    """부분 일치 구간을 <mark>로 감쌉니다 (ts_headline의 퍼지 모드 대용)."""
+    pos = text.lower().find(q.lower())
+    if pos >= 0:
+        end = pos + len(q)
+        text = f"{text[:pos]}{MARK_START}{text[pos:end]}{MARK_END}{text[end:]}"
+    return _render_snippet(text)
+
+
+@router.get("/segments", response_model=list[SegmentSearchResult])
+async def search_segments(
+    response: Response,
+    q: str = Query(..., min_length=1),
+    mode: Literal["fulltext", "fuzzy", "semantic"] = "fulltext",
+    project_id: uuid.UUID | None = None,
+    note_id: uuid.UUID | None = None,
+    page: PageParams = Depends(),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """세그먼트 단위 검색: 매칭 구간의 시각/화자와 하이라이트 스니펫을 반환합니다.
+
+    - fulltext: tsvector 단어 일치, ts_rank 정렬
+    - fuzzy: pg_trgm 트라이그램 인덱스로 부분 문자열(교착어 어간) 및 오타 허용 매칭,
+      word_similarity 정렬. FUZZY_MIN_LENGTH보다 짧은 검색어는 트라이그램 인덱스를 쓸 수 없어
+      단어 접두 일치로 처리합니다 (단어 중간 일치와 오타 허용 없음)
+    - semantic: 임베딩 최근접 이웃 검색, 코사인 유사도 정렬.
+      상위 limit개만 반환하며 커서를 발급하지 않습니다. 임베딩 서비스 장애 시 fulltext로
+      대체하고 X-Search-Mode 헤더로 알립니다.
+
+    스니펫 하이라이트는 비용이 크므로 페이지에 포함된 행에만 계산합니다.
+    """
+    if mode == "semantic":
+        query_vector = await embed_query(q)
+        if query_vector is not None:
+            return await _search_segments_semantic(query_vector, project_id, note_id, page.limit, user, db)
+        mode = "fulltext"
+        response.headers[SEARCH_MODE_HEADER] = mode
+
+    if mode == "fuzzy" and len(q.strip()) < FUZZY_MIN_LENGTH:
+        ts_query = func.to_tsquery("simple", _prefix_tsquery(q))
+        score = func.ts_rank(Segment.search_vector, ts_query)
+        match = Segment.search_vector.op("@@")(ts_query)
+    elif mode == "fuzzy":
+        score = func.word_similarity(q, Segment.text)
+        match = or_(
+            Segment.text.ilike(f"%{_escape_like(q)}%", escape="\\"),
+            literal(q).op("<%")(Segment.text),
         )
+    else:
+        ts_query = func.plainto_tsquery("simple", q)
+        score = func.ts_rank(Segment.search_vector, ts_query)
+        match = Segment.search_vector.op("@@")(ts_query)
+    rank = score.label("rank")
+
+    hits = (
+        select(
+            Segment.note_id,
+            Segment.seq,
+            Segment.speaker,
+            Segment.start_seconds,
+            Segment.end_seconds,
+            Segment.text,
+            Note.title,
+            rank,
+        )
+        .join(Note, Note.id == Segment.note_id)
+        .join(Project, Project.id == Note.project_id)
+        .where(Project.user_id == user.id, match)
+        .order_by(rank.desc(), Segment.note_id.desc(), Segment.seq.desc())
+        .limit(page.limit + 1)
     )
+    if project_id:
+        hits = hits.where(Note.project_id == project_id)
+    if note_id:
+        hits = hits.where(Segment.note_id == note_id)
+
+    cursor = page.decode(float, uuid.UUID, int)
+    if cursor:
+        hits = hits.where(tuple_(rank, Segment.note_id, Segment.seq) < tuple_(*cursor))
+
+    if mode == "fuzzy":
+        query = hits
+    else:
+        hits = hits.subquery()
+        query = select(
+            hits,
+            func.ts_headline("simple", hits.c.text, ts_query, HEADLINE_OPTIONS).label("snippet"),
+        ).order_by(hits.c.rank.desc(), hits.c.note_id.desc(), hits.c.seq.desc())
+
     result = await db.execute(query)
-    return result.scalars().all()
+    rows = paginate(result.all(), page, response, key=lambda row: (row.rank, row.note_id, row.seq))
+    return [
+        SegmentSearchResult(
+            note_id=row.note_id,
+            note_title=row.title,
+            seq=row.seq,
+            speaker=row.speaker,
+            start=row.start_seconds,
+            end=row.end_seconds,
+            snippet=_mark_substring(row.text, q) if mode == "fuzzy" else _render_snippet(row.snippet),
+            rank=row.rank,
+        )
+        for row in rows
+    ]
+
+
+# pgvector 0.8부터 HNSW 반복 스캔으로 필터 후 결과가 모자라면 인덱스를 더 읽음
+ITERATIVE_SCAN_VERSION = (0, 8)
+_pgvector_version: tuple[int, ...] | None = None
+
+
+async def _vector_version(db: AsyncSession) -> tuple[int, ...]:
+    """설치된 pgvector 확장 버전 (프로세스당 한 번 조회)"""
+    global _pgvector_version
+    if _pgvector_version is None:
+        result = await db.execute(text("SELECT extversion FROM pg_extension WHERE extname = 'vector'"))
+        version = result.scalar_one_or_none() or "0"
+        _pgvector_version = tuple(int(part) for part in version.split(".") if part.isdigit())
+    return _pgvector_version
+
+
+async def _search_segments_semantic(
+    query_vector: list[float],
+    project_id: uuid.UUID | None,
+    note_id: uuid.UUID | None,
+    limit: int,
+    user: User,
+    db: AsyncSession,
+) -> list[SegmentSearchResult]:
+    """사용자 필터를 적용한 코사인 유사도 상위 limit개 세그먼트.
+
+    HNSW 스캔은 인덱스에서 ef_search개 후보를 뽑은 뒤 필터를 적용하므로, 다른 사용자의
+    세그먼트가 후보를 채우면 결과가 비거나 모자랍니다. pgvector 0.8 이상에서는 반복 스캔
+    (relaxed_order)으로 모자란 만큼 인덱스를 더 읽고, 그 이전 버전에서는 사용자 세그먼트를
+    먼저 추린 뒤 정확한 거리로 정렬합니다.
+    """
+    candidates = (
+        select(
+            Segment.note_id,
+            Segment.seq,
+            Segment.speaker,
+            Segment.start_seconds,
+            Segment.end_seconds,
+            Segment.text,
+            Note.title,
+        )
+        .join(Note, Note.id == Segment.note_id)
+        .join(Project, Project.id == Note.project_id)
+        .where(Project.user_id == user.id, Segment.embedding.is_not(None))
+    )
+    if project_id:
+        candidates = candidates.where(Note.project_id == project_id)
+    if note_id:
+        candidates = candidates.where(Segment.note_id == note_id)
+
+    if await _vector_version(db) >= ITERATIVE_SCAN_VERSION:
+        await db.execute(select(func.set_config("hnsw.iterative_scan", "relaxed_order", True)))
+        await db.execute(
+            select(func.set_config("hnsw.ef_search", str(max(settings.semantic_ef_search, limit)), True))
+        )
+        distance = Segment.embedding.cosine_distance(query_vector)
+        # relaxed_order는 순서가 조금 어긋날 수 있으므로 상위 limit개를 다시 거리순 정렬
+        hits = candidates.add_columns(distance.label("distance")).order_by(distance).limit(limit).subquery()
+    else:
+        # 필터를 인덱스 스캔보다 먼저 적용 (MATERIALIZED로 HNSW 인덱스 사용을 막음)
+        filtered = candidates.add_columns(Segment.embedding).cte("filtered").prefix_with("MATERIALIZED")
+        distance = filtered.c.embedding.cosine_distance(query_vector)
+        hits = select(filtered, distance.label("distance")).order_by(distance).limit(limit).subquery()
+
+    result = await db.execute(
+        select(*(column for column in hits.c if column.name != "embedding")).order_by(hits.c.distance)
+    )
+    return [
+        SegmentSearchResult(
+            note_id=row.note_id,
+            note_title=row.title,
+            seq=row.seq,
+            speaker=row.speaker,
+            start=row.start_seconds,
+            end=row.end_seconds,
+            snippet=html.escape(row.text),
+            rank=1 - row.distance,
+        )
+        for row in result.all()
+    ]
@@ -5,21 +5,35 @@
 API Key만으로 음성 파일 업로드 및 결과 조회를 수행합니다.
 """
 
+import asyncio
 import os
+import time
 import uuid
+from urllib.parse import urlparse
 
 import aiofiles
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import verify_service_key
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.metrics import UPLOAD_BYTES, UPLOAD_DURATION
+from app.core.tracing import tracer
 from app.models.note import Analysis, Note, Project, Transcript
 from app.models.user import User
-from app.schemas.note import AnalysisResponse, NoteResponse, TranscriptResponse
-from app.services.queue import enqueue_job
+from app.schemas.note import (
+    AnalysisResponse,
+    NoteBatchItem,
+    NoteBatchRequest,
+    NoteBatchResponse,
+    NoteResponse,
+    TranscriptResponse,
+)
+from app.services.payloads import artifact_response
+from app.services.queue import enqueue_job, enqueue_jobs
+from app.services.status_watch import status_watcher
 
 router = APIRouter(
     prefix="/api/service",
@@ -34,6 +48,11 @@ SERVICE_USER_EMAIL = "service@internal"
 SERVICE_USER_NAME = "Service Account"
 SERVICE_PROJECT_NAME = "__service__"
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 서비스 프로젝트 ID 프로세스 캐시 (업로드마다 유저/프로젝트 조회 2회 생략)
+_service_project_id: uuid.UUID | None = None
+
 
 async def _get_or_create_service_project(db: AsyncSession) -> Project:
     """서비스 전용 유저와 프로젝트를 가져오거나 자동 생성합니다."""
@@ -72,44 +91,93 @@ async def _get_or_create_service_project(db: AsyncSession) -> Project:
     return service_project
 
 
+async def _get_service_project_id(db: AsyncSession) -> uuid.UUID:
+    global _service_project_id
+    if _service_project_id is None:
+        service_project = await _get_or_create_service_project(db)
+        await db.commit()
+        _service_project_id = service_project.id
+    return _service_project_id
+
+
+def _validate_extension(filename: str) -> str:
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in ALLOWED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다: {ext}")
+    return ext
+
+
+async def _save_upload(file: UploadFile, ext: str) -> str:
+    """업로드 파일을 청크 단위로 저장하고 경로를 반환합니다."""
+    file_path = os.path.join(settings.upload_dir, f"{uuid.uuid4()}{ext}")
+    os.makedirs(settings.upload_dir, exist_ok=True)
+    started = time.perf_counter()
+    size = 0
+    with tracer.start_as_current_span("upload.save"):
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
+                size += len(chunk)
+    UPLOAD_BYTES.labels("service").inc(size)
+    UPLOAD_DURATION.labels("service").observe(time.perf_counter() - started)
+    return file_path
+
+
+def _resolve_shared_path(path: str) -> str:
+    """공유 업로드 볼륨 내부의 기존 파일 경로만 허용합니다."""
+    upload_root = os.path.realpath(settings.upload_dir)
+    resolved = os.path.realpath(os.path.join(upload_root, path))
+    if os.path.commonpath([upload_root, resolved]) != upload_root or not os.path.isfile(resolved):
+        raise HTTPException(status_code=400, detail=f"업로드 디렉터리에서 파일을 찾을 수 없습니다: {path}")
+    return resolved
+
+
+def _resolve_webhook_url(webhook_url: str | None) -> str | None:
+    """요청별 웹훅 URL, 없으면 서비스 키 기본값(service_webhook_url)을 사용합니다."""
+    url = webhook_url or settings.service_webhook_url or None
+    if url is not None:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            raise HTTPException(status_code=400, detail="유효하지 않은 웹훅 URL입니다")
+        # 서명 없는 웹훅은 수신 측이 위조 여부를 확인할 수 없으므로 등록하지 않음
+        if not settings.webhook_secret:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="WEBHOOK_SECRET이 설정되지 않아 웹훅을 사용할 수 없습니다",
+            )
+    return url
+
+
 @router.post("/upload", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
 async def service_upload_note(
     file: UploadFile,
     title: str | None = None,
+    webhook_url: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
     """서비스용 음성 파일 업로드.
 
     프로젝트/유저 지정 없이 독립 노트를 생성합니다.
     서비스 전용 프로젝트(__service__)에 자동 배치됩니다.
+    webhook_url을 지정하면 처리 완료/실패 시 결과를 해당 URL로 POST합니다.
     """
-    # 파일 확장자 검증
-    ext = os.path.splitext(file.filename or "")[1].lower()
-    if ext not in ALLOWED_EXTENSIONS:
-        raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다: {ext}")
-
-    # 서비스 전용 프로젝트 확보
-    service_project = await _get_or_create_service_project(db)
-
-    # 파일 저장
-    file_id = str(uuid.uuid4())
-    file_path = os.path.join(settings.upload_dir, f"{file_id}{ext}")
-    os.makedirs(settings.upload_dir, exist_ok=True)
-
-    async with aiofiles.open(file_path, "wb") as f:
-        content = await file.read()
-        await f.write(content)
+    ext = _validate_extension(file.filename or "")
+    webhook_url = _resolve_webhook_url(webhook_url)
+    project_id = await _get_service_project_id(db)
+    file_path = await _save_upload(file, ext)
 
     # 노트 생성
     note = Note(
-        project_id=service_project.id,
+        project_id=project_id,
         title=title or file.filename or "제목 없음",
         audio_path=file_path,
         status="queued",
+        webhook_url=webhook_url,
     )
-    db.add(note)
-    await db.commit()
-    await db.refresh(note)
+    with tracer.start_as_current_span("db.insert_note"):
+        db.add(note)
+        await db.commit()
+        await db.refresh(note)
 
     # AI 처리 큐에 등록
     await enqueue_job(str(note.id), file_path)
@@ -117,34 +185,86 @@ async def service_upload_note(
     return note
 
 
+@router.post("/upload/bulk", response_model=list[NoteResponse], status_code=status.HTTP_201_CREATED)
+async def service_bulk_upload_notes(
+    files: list[UploadFile] = File(default=[]),
+    paths: list[str] = Form(default=[]),
+    webhook_url: str | None = Form(default=None),
+    db: AsyncSession = Depends(get_db),
+):
+    """서비스용 일괄 업로드.
+
+    multipart 파일(files)과 공유 업로드 볼륨에 이미 있는 파일의 상대 경로(paths)를
+    함께 받을 수 있습니다. 노트는 단일 INSERT로 생성하고 작업은 단일 RPUSH로 등록합니다.
+    webhook_url은 이번 요청의 모든 노트에 적용됩니다.
+    """
+    total = len(files) + len(paths)
+    if total == 0:
+        raise HTTPException(status_code=400, detail="업로드할 파일이 없습니다")
+    if total > settings.service_bulk_max_files:
+        raise HTTPException(
+            status_code=400, detail=f"한 번에 최대 {settings.service_bulk_max_files}개까지 업로드할 수 있습니다"
+        )
+
+    # 저장 전에 전체 입력을 검증해 부분 저장을 피함
+    file_exts = [_validate_extension(f.filename or "") for f in files]
+    shared_paths = [_resolve_shared_path(p) for p in paths]
+    for p in shared_paths:
+        _validate_extension(p)
+    webhook_url = _resolve_webhook_url(webhook_url)
+
+    project_id = await _get_service_project_id(db)
+
+    rows = []
+    for file, ext in zip(files, file_exts):
+        file_path = await _save_upload(file, ext)
+        rows.append({"title": file.filename or "제목 없음", "audio_path": file_path})
+    for file_path in shared_paths:
+        rows.append({"title": os.path.basename(file_path), "audio_path": file_path})
+
+    with tracer.start_as_current_span("db.insert_notes", attributes={"notes.count": len(rows)}):
+        # 응답은 요청 파일 순서와 위치로 대응하므로 executemany RETURNING도 입력 순서로 받음
+        result = await db.scalars(
+            insert(Note).returning(Note, sort_by_parameter_order=True),
+            [{"project_id": project_id, "status": "queued", "webhook_url": webhook_url, **row} for row in rows],
+        )
+        notes = result.all()
+        await db.commit()
+
+    await enqueue_jobs([(str(note.id), note.audio_path) for note in notes])
+    return notes
+
+
 @router.get("/notes/{note_id}/transcript", response_model=TranscriptResponse)
 async def service_get_transcript(
+    request: Request,
     note_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """서비스용 트랜스크립트 조회 (유저 인증 없이)."""
-    result = await db.execute(
-        select(Transcript).where(Transcript.note_id == note_id)
+    query = select(Transcript.id, Transcript.etag).where(Transcript.note_id == note_id)
+    response = await artifact_response(
+        request, db, query, Transcript, TranscriptResponse, "transcript", note_id, None
     )
-    transcript = result.scalar_one_or_none()
-    if not transcript:
+    if response is None:
         raise HTTPException(status_code=404, detail="트랜스크립트를 찾을 수 없습니다")
-    return transcript
+    return response
 
 
 @router.get("/notes/{note_id}/analysis", response_model=AnalysisResponse)
 async def service_get_analysis(
+    request: Request,
     note_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """서비스용 분석 결과 조회."""
-    result = await db.execute(
-        select(Analysis).where(Analysis.note_id == note_id)
+    query = select(Analysis.id, Analysis.etag).where(Analysis.note_id == note_id)
+    response = await artifact_response(
+        request, db, query, Analysis, AnalysisResponse, "analysis", note_id, None
     )
-    analysis = result.scalar_one_or_none()
-    if not analysis:
+    if response is None:
         raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
-    return analysis
+    return response
 
 
 @router.get("/notes/{note_id}/status")
@@ -162,5 +282,82 @@ async def service_get_note_status(
         "status": note.status,
         "title": note.title,
         "duration_seconds": note.duration_seconds,
+        "processing_profile": note.processing_profile,
         "created_at": note.created_at,
     }
+
+
+async def _fetch_note_batch(db: AsyncSession, body: NoteBatchRequest) -> list[NoteBatchItem]:
+    """요청된 노트 상태(및 선택적 결과)를 기본 키 인덱스로 한 번에 조회합니다."""
+    columns = [Note.id, Note.status, Note.title, Note.duration_seconds, Note.created_at]
+    query = select(*columns).where(Note.id.in_(body.note_ids))
+    if body.include_transcript:
+        query = query.add_columns(Transcript).outerjoin(Transcript, Transcript.note_id == Note.id)
+    if body.include_analysis:
+        query = query.add_columns(Analysis).outerjoin(Analysis, Analysis.note_id == Note.id)
+
+    result = await db.execute(query)
+    items = [
+        NoteBatchItem(
+            note_id=row.id,
+            status=row.status,
+            title=row.title,
+            duration_seconds=row.duration_seconds,
+            created_at=row.created_at,
+            transcript=row.Transcript if body.include_transcript else None,
+            analysis=row.Analysis if body.include_analysis else None,
+        )
+        for row in result.all()
+    ]
+    # 대기 중 커넥션을 풀에 반환하고, 재조회 시 캐시된 객체 대신 최신 값을 읽도록 함
+    await db.rollback()
+    return items
+
+
+@router.post("/notes/batch", response_model=NoteBatchResponse)
+async def service_get_notes_batch(
+    body: NoteBatchRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """서비스용 노트 일괄 상태/결과 조회.
+
+    wait > 0이면 롱폴링으로 동작합니다. known_statuses(없으면 최초 조회 결과)와
+    달라진 노트가 생기거나 wait초가 지나면 응답합니다. 대기는 Redis 상태 채널
+    알림으로 깨어나므로 알림이 없는 동안에는 DB를 조회하지 않습니다.
+    """
+    note_ids = list(dict.fromkeys(body.note_ids))
+    if len(note_ids) > settings.service_batch_max_notes:
+        raise HTTPException(
+            status_code=400, detail=f"한 번에 최대 {settings.service_batch_max_notes}개까지 조회할 수 있습니다"
+        )
+    body.note_ids = note_ids
+    wait = min(body.wait, settings.service_batch_max_wait_seconds)
+
+    def changed_from(baseline: dict[uuid.UUID, str], items: list[NoteBatchItem]) -> bool:
+        return any(item.note_id in baseline and baseline[item.note_id] != item.status for item in items)
+
+    if wait <= 0:
+        items = await _fetch_note_batch(db, body)
+        changed = changed_from(body.known_statuses or {}, items)
+    else:
+        async with status_watcher.watch([str(note_id) for note_id in note_ids]) as event:
+            items = await _fetch_note_batch(db, body)
+            baseline = body.known_statuses or {item.note_id: item.status for item in items}
+            changed = changed_from(baseline, items)
+            deadline = time.monotonic() + wait
+            while not changed and (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                event.clear()
+                # 워커는 DB 상태 변경 없이 진행률만 발행하기도 하므로 재조회 후 비교
+                items = await _fetch_note_batch(db, body)
+                changed = changed_from(baseline, items)
+
+    found = {item.note_id for item in items}
+    return NoteBatchResponse(
+        notes=items,
+        missing=[note_id for note_id in note_ids if note_id not in found],
+        changed=changed,
+    )
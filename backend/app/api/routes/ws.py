@@ -1,6 +1,7 @@
 # backend/app/api/routes/ws.py
 import asyncio
 
+import anyio
 import redis.asyncio as redis
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
@@ -16,14 +17,24 @@ async def note_status_ws(websocket: WebSocket, note_id: str):
     pubsub = r.pubsub()
     await pubsub.subscribe(f"voice:status:{note_id}")
 
-    try:
+    async def forward():
         while True:
             message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
             if message and message["type"] == "message":
                 await websocket.send_text(message["data"])
-            await asyncio.sleep(0.1)
+
+    forward_task = asyncio.create_task(forward())
+    try:
+        # 전송만 해서는 다음 상태 메시지 전까지 연결 종료를 알 수 없으므로
+        # 수신을 기다려 종료 즉시 구독을 해제함
+        while True:
+            await websocket.receive_text()
     except WebSocketDisconnect:
         pass
     finally:
-        await pubsub.unsubscribe(f"voice:status:{note_id}")
-        await r.aclose()
+        # 서버 종료 등으로 핸들러가 취소된 경우에도 구독 연결을 반드시 닫도록 정리를 보호
+        with anyio.CancelScope(shield=True):
+            forward_task.cancel()
+            await asyncio.gather(forward_task, return_exceptions=True)
+            await pubsub.aclose()
+            await r.aclose()
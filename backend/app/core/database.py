@@ -3,10 +3,40 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+
+def _create_engine(url: str):
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        # asyncpg 준비된 문장 캐시 (PgBouncer 트랜잭션 모드에서는 0)
+        connect_args={"prepared_statement_cache_size": settings.db_statement_cache_size},
+    )
+
+
+engine = _create_engine(settings.database_url)
+# 읽기 전용 복제본이 없으면 주 DB 엔진을 그대로 사용
+read_engine = _create_engine(settings.database_read_url) if settings.database_read_url else engine
+
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
 
 
 async def get_db():
     async with async_session() as session:
         yield session
+
+
+async def get_read_db():
+    """읽기 전용 엔드포인트용 세션 (복제본으로 라우팅).
+
+    복제 지연이 있을 수 있으므로 방금 쓴 데이터를 바로 읽어야 하는 경로에는 get_db를 사용합니다.
+    노트 상태와 처리 결과(트랜스크립트/단어 타이밍/분석/오디오)는 완료 알림 직후 조회되므로
+    주 DB에서 읽습니다.
+    """
+    async with read_session() as session:
+        yield session
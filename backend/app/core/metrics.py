@@ -0,0 +1,114 @@
+# backend/app/core/metrics.py
+"""Prometheus 메트릭 정의.
+
+메트릭 이름과 라벨은 알림 규칙에서 참조하므로 변경하지 않습니다.
+/metrics 엔드포인트로 노출됩니다.
+"""
+
+import time
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "voice_api_password_hash_queue_depth",
+    "bcrypt 작업 풀에 대기 중이거나 실행 중인 해시/검증 작업 수",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "voice_api_password_hash_rejected_total",
+    "대기열 한도 초과로 거절된 해시/검증 요청 수",
+)
+REQUEST_DURATION = Histogram(
+    "voice_api_request_duration_seconds",
+    "HTTP 요청 처리 시간 (route: 경로 템플릿)",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+UPLOAD_BYTES = Counter(
+    "voice_api_upload_bytes_total",
+    "저장한 업로드 오디오 바이트 수",
+    ["endpoint"],
+)
+UPLOAD_DURATION = Histogram(
+    "voice_api_upload_duration_seconds",
+    "업로드 파일 하나를 수신/저장하는 데 걸린 시간",
+    ["endpoint"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+OLLAMA_TOKENS_PER_SECOND = Histogram(
+    "voice_api_ollama_tokens_per_second",
+    "Ollama 응답 생성 속도 (eval_count / eval_duration)",
+    ["model"],
+    buckets=(1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 200),
+)
+
+
+def observe_ollama(model: str, body: dict) -> None:
+    """Ollama 비스트리밍 응답의 eval_count/eval_duration(ns)으로 생성 속도를 기록합니다."""
+    eval_count = body.get("eval_count")
+    eval_duration = body.get("eval_duration")
+    if eval_count and eval_duration:
+        OLLAMA_TOKENS_PER_SECOND.labels(model).observe(eval_count / (eval_duration / 1e9))
+
+
+class RequestMetricsMiddleware:
+    """요청별 처리 시간을 경로 템플릿 라벨로 기록하는 ASGI 미들웨어.
+
+    실제 URL 대신 라우트 템플릿(/api/notes/{note_id})을 써서 라벨 수를 고정합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            REQUEST_DURATION.labels(
+                scope["method"], getattr(route, "path", "unmatched"), str(status_code)
+            ).observe(time.perf_counter() - start)
+
+
+class DatabasePoolCollector:
+    """수집 시점의 SQLAlchemy 커넥션 풀 상태 (engine: primary/replica)"""
+
+    def collect(self):
+        from app.core.database import engine, read_engine
+
+        engines = {"primary": engine}
+        if read_engine is not engine:
+            engines["replica"] = read_engine
+
+        size = GaugeMetricFamily("voice_api_db_pool_size", "커넥션 풀 기본 크기", labels=["engine"])
+        connections = GaugeMetricFamily(
+            "voice_api_db_pool_connections",
+            "상태별 커넥션 수 (checked_out: 사용 중, checked_in: 유휴, overflow: 기본 크기 초과분)",
+            labels=["engine", "state"],
+        )
+        for name, eng in engines.items():
+            pool = eng.sync_engine.pool
+            if not hasattr(pool, "checkedout"):
+                continue
+            size.add_metric([name], pool.size())
+            connections.add_metric([name, "checked_out"], pool.checkedout())
+            connections.add_metric([name, "checked_in"], pool.checkedin())
+            connections.add_metric([name, "overflow"], max(pool.overflow(), 0))
+        yield size
+        yield connections
+
+
+REGISTRY.register(DatabasePoolCollector())
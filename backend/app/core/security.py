@@ -1,13 +1,26 @@
 # backend/app/core/security.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.metrics import PASSWORD_HASH_QUEUE_DEPTH, PASSWORD_HASH_REJECTED
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt는 요청당 수백 ms CPU를 쓰므로 이벤트 루프 밖 전용 스레드 풀에서 실행
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt"
+)
+_password_tasks = 0
+
+
+class PasswordHasherBusy(Exception):
+    """bcrypt 대기열이 가득 차 요청을 받을 수 없음"""
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -17,6 +30,31 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+async def _run_password_task(fn, *args):
+    global _password_tasks
+    if _password_tasks >= settings.password_hash_max_pending:
+        PASSWORD_HASH_REJECTED.inc()
+        raise PasswordHasherBusy()
+
+    _password_tasks += 1
+    PASSWORD_HASH_QUEUE_DEPTH.set(_password_tasks)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_executor, fn, *args)
+    finally:
+        _password_tasks -= 1
+        PASSWORD_HASH_QUEUE_DEPTH.set(_password_tasks)
+
+
+async def hash_password_async(password: str) -> str:
+    """이벤트 루프를 막지 않는 hash_password. 대기열 초과 시 PasswordHasherBusy."""
+    return await _run_password_task(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """이벤트 루프를 막지 않는 verify_password. 대기열 초과 시 PasswordHasherBusy."""
+    return await _run_password_task(verify_password, plain, hashed)
+
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
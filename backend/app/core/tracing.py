@@ -0,0 +1,116 @@
+# backend/app/core/tracing.py
+"""OpenTelemetry 분산 추적.
+
+요청마다 서버 스팬을 만들고(클라이언트가 보낸 traceparent가 있으면 이어서),
+작업을 큐에 넣을 때 현재 컨텍스트를 작업 페이로드의 trace 필드에 담습니다.
+워커(worker/app/tracing.py)가 이를 이어받아 큐 대기/단계별 스팬을 같은 트레이스에 기록하므로
+노트 하나의 업로드부터 처리 완료까지의 지연을 트레이스 하나로 확인할 수 있습니다.
+
+tracing_exporter가 비어 있으면 추적기는 아무것도 기록하지 않습니다.
+- otlp: tracing_otlp_endpoint(OTLP/HTTP 수집기)로 전송
+- file: tracing_file_path에 스팬을 한 줄에 하나씩 JSON으로 추가
+- console: 표준 출력
+"""
+
+from typing import TextIO
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from app.core.config import settings
+
+tracer = trace.get_tracer("voice-api")
+
+# 공급자 설정/종료 (_create_exporter, setup_tracing, shutdown_tracing)는 API와 워커가 같은 구현을
+# 씁니다. 이미지가 달라 모듈을 공유할 수 없으므로 worker/tests/test_tracing.py가 일치를 확인합니다.
+_provider: TracerProvider | None = None
+_file: TextIO | None = None
+
+
+def _create_exporter() -> SpanExporter:
+    global _file
+    if settings.tracing_exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+    if settings.tracing_exporter == "file":
+        _file = open(settings.tracing_file_path, "a", encoding="utf-8")
+        return ConsoleSpanExporter(out=_file, formatter=lambda span: span.to_json(indent=None) + "\n")
+    if settings.tracing_exporter == "console":
+        return ConsoleSpanExporter()
+    raise ValueError(f"지원하지 않는 추적 내보내기 방식입니다: {settings.tracing_exporter}")
+
+
+def setup_tracing() -> None:
+    global _provider
+    if not settings.tracing_exporter or _provider is not None:
+        return
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.tracing_service_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_ratio)),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    trace.set_tracer_provider(_provider)
+
+
+def shutdown_tracing() -> None:
+    """남은 스팬을 내보내고 파일 내보내기의 파일 핸들을 닫습니다."""
+    global _provider, _file
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+    if _file is not None:
+        _file.close()
+        _file = None
+
+
+def inject_context() -> dict[str, str]:
+    """현재 스팬 컨텍스트를 작업 페이로드에 담을 수 있는 W3C traceparent 딕셔너리로 반환합니다."""
+    carrier: dict[str, str] = {}
+    propagate.inject(carrier)
+    return carrier
+
+
+class TracingMiddleware:
+    """요청별 서버 스팬을 만드는 ASGI 미들웨어.
+
+    스팬 이름은 라우트 템플릿(POST /api/notes/upload)으로 정해 카디널리티를 고정합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with tracer.start_as_current_span(
+            scope["method"],
+            context=propagate.extract(headers),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": scope["method"], "url.path": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.update_name(f"{scope['method']} {route}")
+                    span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status_code)
+                if status_code >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
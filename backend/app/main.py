@@ -1,27 +1,38 @@
 # backend/app/main.py
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from sqlalchemy import text
 
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.api.routes.auth import router as auth_router
 from app.api.routes.chat import router as chat_router
 from app.api.routes.notes import router as notes_router
 from app.api.routes.projects import router as projects_router
+from app.api.routes.search import SEARCH_MODE_HEADER
 from app.api.routes.search import router as search_router
 from app.api.routes.service import router as service_router
 from app.api.routes.ws import router as ws_router
 from app.core.database import engine
+from app.core.metrics import RequestMetricsMiddleware
+from app.core.tracing import TracingMiddleware, setup_tracing, shutdown_tracing
+from app.services.auth_cache import auth_cache
+from app.services.status_watch import status_watcher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    setup_tracing()
     # DB 연결 확인
     async with engine.begin() as conn:
         await conn.execute(text("SELECT 1"))
     yield
+    await status_watcher.stop()
+    await auth_cache.stop()
     await engine.dispose()
+    shutdown_tracing()
 
 
 app = FastAPI(title="Voice Recognition API", version="0.1.0", lifespan=lifespan)
@@ -32,7 +43,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, SEARCH_MODE_HEADER],
 )
+app.add_middleware(RequestMetricsMiddleware)
+app.add_middleware(TracingMiddleware)
 
 # 라우터 등록
 app.include_router(auth_router)
@@ -47,3 +61,8 @@ app.include_router(ws_router)
 @app.get("/health")
 async def health():
     return {"status": "ok", "version": "0.1.0"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
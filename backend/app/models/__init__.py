@@ -1,6 +1,7 @@
 # backend/app/models/__init__.py
 from app.models.base import Base
 from app.models.user import User
-from app.models.note import Project, Note, Transcript, Analysis, Bookmark, ChatSession
+from app.models.note import Project, Note, Transcript, Segment, Analysis, Bookmark, ChatSession
+from app.models.webhook import WebhookDelivery
 
-__all__ = ["Base", "User", "Project", "Note", "Transcript", "Analysis", "Bookmark", "ChatSession"]
+__all__ = ["Base", "User", "Project", "Note", "Transcript", "Segment", "Analysis", "Bookmark", "ChatSession", "WebhookDelivery"]
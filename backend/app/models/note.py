@@ -1,11 +1,18 @@
 # backend/app/models/note.py
 import uuid
 
-from sqlalchemy import Float, ForeignKey, String, Text
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DDL, Computed, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, event
 from sqlalchemy.dialects.postgresql import JSONB, UUID, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.triggers import TRIGGER_DDL
+
+# 세그먼트 임베딩 차원 (Ollama 임베딩 모델 출력 차원과 일치해야 함).
+# docker-compose의 pgvector 0.8.0은 halfvec을 지원하지만, 이미지를 고정하지 않은 로컬/CI
+# Postgres(pgvector 0.7 미만)에서도 스키마와 테스트가 동작하도록 vector(768)로 저장
+EMBEDDING_DIMENSIONS = 768
 
 
 class Project(UUIDMixin, TimestampMixin, Base):
@@ -18,6 +25,10 @@ class Project(UUIDMixin, TimestampMixin, Base):
     user = relationship("User", back_populates="projects")
     notes = relationship("Note", back_populates="project", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_projects_user_created", "user_id", "created_at", "id"),
+    )
+
 
 class Note(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "notes"
@@ -28,6 +39,10 @@ class Note(UUIDMixin, TimestampMixin, Base):
     duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
     language: Mapped[str | None] = mapped_column(String(10), nullable=True)
     status: Mapped[str] = mapped_column(String(20), default="uploading")
+    # 처리 완료/실패 시 결과를 POST할 URL (서비스 연동용)
+    webhook_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
+    # 워커가 작업마다 고른 STT 설정 (모델/배치/연산 타입과 그 근거가 된 입력값)
+    processing_profile: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     project = relationship("Project", back_populates="notes")
     transcript = relationship("Transcript", back_populates="note", uselist=False, cascade="all, delete-orphan")
@@ -35,6 +50,10 @@ class Note(UUIDMixin, TimestampMixin, Base):
     bookmarks = relationship("Bookmark", back_populates="note", cascade="all, delete-orphan")
     chat_sessions = relationship("ChatSession", back_populates="note", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_notes_project_created", "project_id", "created_at", "id"),
+    )
+
 
 class Transcript(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "transcripts"
@@ -43,9 +62,57 @@ class Transcript(UUIDMixin, TimestampMixin, Base):
     segments: Mapped[dict] = mapped_column(JSONB, default=list)
     full_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
+    # 워커가 생성한 gzip 압축 응답 JSON과 그 내용 해시 (app.services.payloads 참고)
+    payload: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    etag: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # 단어 단위 시작/끝/신뢰도의 압축 열 형식 (app.services.word_timings 참고)
+    word_timings: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    word_timings_etag: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # 가장 긴 세그먼트 길이(초). segments 변경 시 트리거가 계산 (구간 조회 범위 제한용)
+    max_segment_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     note = relationship("Note", back_populates="transcript")
 
+    __table_args__ = (
+        Index("ix_transcripts_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+class Segment(Base):
+    """세그먼트 단위 검색/조회용 정규화 테이블.
+
+    transcripts.segments(JSONB)에서 트리거로 파생되므로 직접 쓰지 않습니다.
+    """
+
+    __tablename__ = "transcript_segments"
+
+    note_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE"), primary_key=True
+    )
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    speaker: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    start_seconds: Mapped[float] = mapped_column(Float)
+    end_seconds: Mapped[float] = mapped_column(Float)
+    text: Mapped[str] = mapped_column(Text)
+    confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed("to_tsvector('simple', text)", persisted=True)
+    )
+    embedding: Mapped[list[float] | None] = mapped_column(Vector(EMBEDDING_DIMENSIONS), nullable=True)
+
+    __table_args__ = (
+        Index("ix_transcript_segments_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_transcript_segments_note_start", "note_id", "start_seconds"),
+        Index(
+            "ix_transcript_segments_embedding",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        # 트라이그램 인덱스(ix_transcript_segments_text_trgm)는 pg_trgm 확장이 필요하므로
+        # 마이그레이션에서만 생성합니다.
+    )
+
 
 class Analysis(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "analyses"
@@ -55,6 +122,8 @@ class Analysis(UUIDMixin, TimestampMixin, Base):
     topics: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     keywords: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     action_items: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    payload: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    etag: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     note = relationship("Note", back_populates="analysis")
 
@@ -76,3 +145,9 @@ class ChatSession(UUIDMixin, TimestampMixin, Base):
     messages: Mapped[dict] = mapped_column(JSONB, default=list)
 
     note = relationship("Note", back_populates="chat_sessions")
+
+
+# 검색 벡터/세그먼트 행을 유지하는 트리거 (DDL은 마이그레이션과 공유하는 app.models.triggers)
+# 함수가 다른 테이블을 참조하므로 모든 테이블이 생성된 뒤 create_all(테스트)에서 실행한다.
+for _ddl in TRIGGER_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_ddl))
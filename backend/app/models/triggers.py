@@ -0,0 +1,140 @@
+# backend/app/models/triggers.py
+"""검색 벡터와 세그먼트 행을 유지하는 DB 함수/트리거 DDL.
+
+마이그레이션(8cd1bed14154, a6d8cbb1b1b0, 5d2f7a9c1e34)과 테스트용 create_all(app.models.note)이
+같은 상수를 실행하므로 두 스키마가 어긋나지 않습니다. 내용을 바꿀 때는 이전 마이그레이션이 쓰던
+상수를 _V1처럼 남겨 두고, 새 마이그레이션에서 바뀐 상수를 다시 실행하세요
+(함수는 CREATE OR REPLACE이므로 그대로 재실행할 수 있습니다).
+"""
+
+# 검색 벡터 자동 유지: 제목(A) > 요약/키워드(B) > 본문(C) 가중치
+NOTE_SEARCH_DOCUMENT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION note_search_document(p_note_id uuid, p_full_text text)
+    RETURNS tsvector AS $$
+    BEGIN
+        RETURN (
+            SELECT setweight(to_tsvector('simple', coalesce(n.title, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(a.summary, '')), 'B')
+                || setweight(jsonb_to_tsvector('simple', coalesce(a.keywords, '[]'::jsonb), '["string"]'), 'B')
+                || setweight(to_tsvector('simple', coalesce(p_full_text, '')), 'C')
+            FROM notes n
+            LEFT JOIN analyses a ON a.note_id = n.id
+            WHERE n.id = p_note_id
+        );
+    END
+    $$ LANGUAGE plpgsql STABLE
+"""
+
+TRANSCRIPTS_SEARCH_VECTOR_FUNCTION = """
+    CREATE OR REPLACE FUNCTION transcripts_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := note_search_document(NEW.note_id, NEW.full_text);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+ANALYSES_SEARCH_VECTOR_FUNCTION = """
+    CREATE OR REPLACE FUNCTION analyses_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        UPDATE transcripts SET search_vector = note_search_document(note_id, full_text)
+        WHERE note_id = NEW.note_id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+NOTES_SEARCH_VECTOR_FUNCTION = """
+    CREATE OR REPLACE FUNCTION notes_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        UPDATE transcripts SET search_vector = note_search_document(note_id, full_text)
+        WHERE note_id = NEW.id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+TRANSCRIPTS_SEARCH_VECTOR_TRIGGER = """
+    CREATE TRIGGER transcripts_search_vector_update
+    BEFORE INSERT OR UPDATE OF full_text ON transcripts
+    FOR EACH ROW EXECUTE FUNCTION transcripts_search_vector_trigger()
+"""
+
+ANALYSES_SEARCH_VECTOR_TRIGGER = """
+    CREATE TRIGGER analyses_search_vector_refresh
+    AFTER INSERT OR UPDATE OF summary, keywords ON analyses
+    FOR EACH ROW EXECUTE FUNCTION analyses_search_vector_trigger()
+"""
+
+NOTES_SEARCH_VECTOR_TRIGGER = """
+    CREATE TRIGGER notes_search_vector_refresh
+    AFTER UPDATE OF title ON notes
+    FOR EACH ROW EXECUTE FUNCTION notes_search_vector_trigger()
+"""
+
+# transcripts.segments(JSONB) → transcript_segments 행 동기화 (a6d8cbb1b1b0 시점, confidence 열 이전)
+SEGMENTS_SYNC_FUNCTION_V1 = """
+    CREATE OR REPLACE FUNCTION transcripts_segments_sync_trigger() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM transcript_segments WHERE note_id = NEW.note_id;
+        INSERT INTO transcript_segments (note_id, seq, speaker, start_seconds, end_seconds, text)
+        SELECT NEW.note_id, e.ord - 1, e.seg->>'speaker',
+               (e.seg->>'start')::float, (e.seg->>'end')::float, coalesce(e.seg->>'text', '')
+        FROM jsonb_array_elements(coalesce(NEW.segments, '[]'::jsonb)) WITH ORDINALITY AS e(seg, ord);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+SEGMENTS_SYNC_FUNCTION = """
+    CREATE OR REPLACE FUNCTION transcripts_segments_sync_trigger() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM transcript_segments WHERE note_id = NEW.note_id;
+        INSERT INTO transcript_segments (note_id, seq, speaker, start_seconds, end_seconds, text, confidence)
+        SELECT NEW.note_id, e.ord - 1, e.seg->>'speaker',
+               (e.seg->>'start')::float, (e.seg->>'end')::float, coalesce(e.seg->>'text', ''),
+               (e.seg->>'confidence')::float
+        FROM jsonb_array_elements(coalesce(NEW.segments, '[]'::jsonb)) WITH ORDINALITY AS e(seg, ord);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+SEGMENTS_SYNC_TRIGGER = """
+    CREATE TRIGGER transcripts_segments_sync
+    AFTER INSERT OR UPDATE OF segments ON transcripts
+    FOR EACH ROW EXECUTE FUNCTION transcripts_segments_sync_trigger()
+"""
+
+SEARCH_VECTOR_DDL = [
+    NOTE_SEARCH_DOCUMENT_FUNCTION,
+    TRANSCRIPTS_SEARCH_VECTOR_FUNCTION,
+    ANALYSES_SEARCH_VECTOR_FUNCTION,
+    NOTES_SEARCH_VECTOR_FUNCTION,
+    TRANSCRIPTS_SEARCH_VECTOR_TRIGGER,
+    ANALYSES_SEARCH_VECTOR_TRIGGER,
+    NOTES_SEARCH_VECTOR_TRIGGER,
+]
+
+# 가장 긴 세그먼트 길이: 구간 조회가 start_seconds 인덱스 범위로 시작 위치를 좁히는 데 사용
+SEGMENT_SPAN_FUNCTION = """
+    CREATE OR REPLACE FUNCTION transcripts_segment_span_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.max_segment_seconds := (
+            SELECT max((seg->>'end')::float - (seg->>'start')::float)
+            FROM jsonb_array_elements(coalesce(NEW.segments, '[]'::jsonb)) AS seg
+        );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+SEGMENT_SPAN_TRIGGER = """
+    CREATE TRIGGER transcripts_segment_span
+    BEFORE INSERT OR UPDATE OF segments ON transcripts
+    FOR EACH ROW EXECUTE FUNCTION transcripts_segment_span_trigger()
+"""
+
+SEGMENTS_SYNC_DDL = [SEGMENTS_SYNC_FUNCTION, SEGMENTS_SYNC_TRIGGER, SEGMENT_SPAN_FUNCTION, SEGMENT_SPAN_TRIGGER]
+
+TRIGGER_DDL = SEARCH_VECTOR_DDL + SEGMENTS_SYNC_DDL
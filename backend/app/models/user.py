@@ -1,5 +1,5 @@
 # backend/app/models/user.py
-from sqlalchemy import String
+from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -11,5 +11,7 @@ class User(UUIDMixin, TimestampMixin, Base):
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     name: Mapped[str] = mapped_column(String(100))
     password_hash: Mapped[str] = mapped_column(String(255))
+    # 토큰 "ver" 클레임과 비교 — 증가시키면 기존에 발급된 토큰이 모두 무효화됨
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     projects = relationship("Project", back_populates="user", cascade="all, delete-orphan")
@@ -0,0 +1,38 @@
+# backend/app/models/webhook.py
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin, UUIDMixin
+
+
+class WebhookDelivery(UUIDMixin, TimestampMixin, Base):
+    """완료/실패 웹훅 전송 대기열 (아웃박스).
+
+    워커가 노트 상태를 바꾸는 트랜잭션 안에서 행을 추가하고,
+    워커의 디스패처가 next_attempt_at이 지난 행을 꺼내 전송합니다.
+    """
+
+    __tablename__ = "webhook_deliveries"
+
+    note_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE")
+    )
+    event: Mapped[str] = mapped_column(String(30))
+    url: Mapped[str] = mapped_column(String(2048))
+    status: Mapped[str] = mapped_column(String(20), default="pending", server_default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    delivered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_webhook_deliveries_due",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
@@ -2,7 +2,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class NoteResponse(BaseModel):
@@ -17,6 +17,30 @@ class NoteResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class NoteDetailResponse(NoteResponse):
+    processing_profile: dict | None
+
+
+class NoteListItem(NoteResponse):
+    summary: str | None
+    keywords: list[str] | None
+
+
+class NoteSearchResult(NoteResponse):
+    rank: float
+
+
+class SegmentSearchResult(BaseModel):
+    note_id: uuid.UUID
+    note_title: str
+    seq: int
+    speaker: str | None
+    start: float
+    end: float
+    snippet: str
+    rank: float
+
+
 class TranscriptSegment(BaseModel):
     speaker: str
     start: float
@@ -34,6 +58,19 @@ class TranscriptResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class WordTimingsResponse(BaseModel):
+    """구간 안 단어 타이밍 (열 단위, 같은 위치가 같은 단어)"""
+    note_id: uuid.UUID
+    start: float
+    end: float
+    index: int
+    starts: list[float]
+    ends: list[float]
+    scores: list[float | None]
+    segments: list[int]
+    texts: list[str]
+
+
 class AnalysisResponse(BaseModel):
     id: uuid.UUID
     note_id: uuid.UUID
@@ -45,6 +82,11 @@ class AnalysisResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ReanalysisResponse(BaseModel):
+    # 저대역 큐에 등록된 다시 분석 작업 수 (트랜스크립트가 있는 노트만)
+    queued: int
+
+
 class BookmarkCreate(BaseModel):
     timestamp_seconds: float
     label: str
@@ -57,3 +99,28 @@ class BookmarkResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class NoteBatchRequest(BaseModel):
+    note_ids: list[uuid.UUID] = Field(..., min_length=1)
+    include_transcript: bool = False
+    include_analysis: bool = False
+    # 롱폴링: 클라이언트가 알고 있는 상태와 달라질 때까지 최대 wait초 대기
+    wait: float = Field(default=0, ge=0)
+    known_statuses: dict[uuid.UUID, str] | None = None
+
+
+class NoteBatchItem(BaseModel):
+    note_id: uuid.UUID
+    status: str
+    title: str
+    duration_seconds: float | None
+    created_at: datetime
+    transcript: TranscriptResponse | None = None
+    analysis: AnalysisResponse | None = None
+
+
+class NoteBatchResponse(BaseModel):
+    notes: list[NoteBatchItem]
+    missing: list[uuid.UUID]
+    changed: bool
@@ -0,0 +1,161 @@
+# backend/app/services/auth_cache.py
+"""인증된 사용자(principal) 캐시.
+
+요청마다 users 테이블을 조회하지 않도록 프로세스 내 TTL LRU 캐시를 두고,
+설정 시 Redis를 2차 캐시로 사용해 API 프로세스 간에 공유합니다.
+사용자 정보가 바뀌면 invalidate_user()로 즉시 제거해야 합니다.
+
+무효화는 Redis 채널(voice:auth:invalidate)로 모든 프로세스에 전파되어 각 프로세스의
+로컬 캐시에서도 제거됩니다. 구독이 끊긴 동안에는 무효화를 놓칠 수 있으므로 로컬 캐시를
+쓰지 않습니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.models.user import User
+from app.services.queue import redis_client
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "voice:auth:invalidate"
+# 구독 확인 메시지를 기다리는 최대 시간 (초)
+SUBSCRIBE_TIMEOUT_SECONDS = 5.0
+
+
+def _redis_key(user_id: uuid.UUID) -> str:
+    return f"voice:auth:user:{user_id}"
+
+
+def _to_user(data: dict) -> User:
+    # 세션에 속하지 않는 읽기 전용 객체 (라우트에서는 id 등 속성만 사용)
+    return User(
+        id=uuid.UUID(data["id"]),
+        email=data["email"],
+        name=data["name"],
+        token_version=data["token_version"],
+    )
+
+
+async def _wait_subscribed(pubsub) -> None:
+    """subscribe()는 명령을 보내기만 하므로 서버의 구독 확인 메시지를 받을 때까지 기다림"""
+    while True:
+        message = await pubsub.get_message(timeout=SUBSCRIBE_TIMEOUT_SECONDS)
+        if message is None:
+            raise redis.TimeoutError("인증 캐시 무효화 구독 확인 시간 초과")
+        if message["type"] == "subscribe":
+            return
+
+
+class AuthCache:
+    def __init__(self):
+        self._local: OrderedDict[uuid.UUID, tuple[float, dict]] = OrderedDict()
+        self._task: asyncio.Task | None = None
+        self._ready: asyncio.Event | None = None
+        self._subscribed = False
+
+    async def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._listen())
+        await self._ready.wait()
+
+    async def _listen(self) -> None:
+        r = redis.from_url(settings.redis_url, decode_responses=True)
+        pubsub = r.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATE_CHANNEL)
+            # 확인 전에 로컬 캐시를 켜면 그 사이 발행된 무효화를 놓침
+            await _wait_subscribed(pubsub)
+            self._subscribed = True
+            self._ready.set()
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    self._local.pop(uuid.UUID(message["data"]), None)
+                except ValueError:
+                    continue
+        except asyncio.CancelledError:
+            pass
+        except redis.RedisError as e:
+            logger.error(f"인증 캐시 무효화 구독 오류: {e}")
+        finally:
+            # 구독 전 캐시 항목은 놓친 무효화가 있을 수 있으므로 모두 버림
+            self._subscribed = False
+            self._local.clear()
+            self._ready.set()
+            await pubsub.aclose()
+            await r.aclose()
+
+    def _local_get(self, user_id: uuid.UUID) -> dict | None:
+        entry = self._local.get(user_id)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            del self._local[user_id]
+            return None
+        self._local.move_to_end(user_id)
+        return data
+
+    def _local_set(self, user_id: uuid.UUID, data: dict) -> None:
+        if not self._subscribed:
+            return
+        self._local[user_id] = (time.monotonic() + settings.auth_cache_ttl_seconds, data)
+        self._local.move_to_end(user_id)
+        while len(self._local) > settings.auth_cache_max_entries:
+            self._local.popitem(last=False)
+
+    async def get_cached_user(self, user_id: uuid.UUID) -> User | None:
+        await self._ensure_started()
+        data = self._local_get(user_id)
+        if data is None and settings.auth_cache_redis:
+            raw = await redis_client.get(_redis_key(user_id))
+            if raw:
+                data = json.loads(raw)
+                self._local_set(user_id, data)
+        return _to_user(data) if data else None
+
+    async def cache_user(self, user: User) -> None:
+        await self._ensure_started()
+        data = {
+            "id": str(user.id),
+            "email": user.email,
+            "name": user.name,
+            "token_version": user.token_version,
+        }
+        self._local_set(user.id, data)
+        if settings.auth_cache_redis:
+            await redis_client.set(
+                _redis_key(user.id), json.dumps(data), ex=settings.auth_cache_redis_ttl_seconds
+            )
+
+    async def invalidate_user(self, user_id: uuid.UUID) -> None:
+        self._local.pop(user_id, None)
+        if settings.auth_cache_redis:
+            await redis_client.delete(_redis_key(user_id))
+        try:
+            await redis_client.publish(INVALIDATE_CHANNEL, str(user_id))
+        except redis.RedisError as e:
+            # 구독 측도 끊긴 상태이므로 다른 프로세스는 로컬 캐시를 쓰지 않음
+            logger.error(f"인증 캐시 무효화 전파 실패: {e}")
+
+    def clear(self) -> None:
+        self._local.clear()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+auth_cache = AuthCache()
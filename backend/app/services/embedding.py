@@ -0,0 +1,35 @@
+# backend/app/services/embedding.py
+import logging
+
+import httpx
+
+from app.core.config import settings
+from app.models.note import EMBEDDING_DIMENSIONS
+
+logger = logging.getLogger(__name__)
+
+
+async def embed_query(query: str) -> list[float] | None:
+    """Ollama 임베딩 모델로 검색어 벡터를 계산합니다 (워커의 세그먼트 임베딩과 동일 모델)."""
+    try:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            resp = await client.post(
+                f"{settings.ollama_url}/api/embed",
+                json={"model": settings.embedding_model, "input": [query]},
+            )
+    except httpx.HTTPError as e:
+        logger.error(f"Ollama 임베딩 연결 오류: {e}")
+        return None
+
+    if resp.status_code != 200:
+        logger.error(f"Ollama 임베딩 응답 오류: {resp.status_code}")
+        return None
+    try:
+        vector = [float(x) for x in resp.json()["embeddings"][0]]
+    except (ValueError, KeyError, IndexError, TypeError) as e:
+        logger.error(f"Ollama 임베딩 응답 형식 오류: {e!r}")
+        return None
+    if len(vector) != EMBEDDING_DIMENSIONS:
+        logger.error(f"Ollama 임베딩 차원 불일치: {len(vector)} != {EMBEDDING_DIMENSIONS}")
+        return None
+    return vector
@@ -0,0 +1,119 @@
+# backend/app/services/note_cache.py
+"""완료된 노트 결과의 Redis 읽기 캐시.
+
+노트마다 해시 하나(voice:note:v{CACHE_VERSION}:{note_id})에 다음 필드를 둡니다.
+워커(worker/app/services/note_cache.py)와 같은 형식을 사용해야 합니다.
+필드나 페이로드 형식을 바꾸면 양쪽의 CACHE_VERSION을 함께 올려, 배포 중 섞여 도는
+이전 버전 프로세스의 항목을 읽지 않게 합니다.
+
+- owner: 소유 사용자 ID (사용자 API의 권한 확인용)
+- {kind}:etag / {kind}:payload: 결과 버전(내용 해시)과 직렬화된 페이로드 (kind: transcript, analysis)
+- context: 채팅 프롬프트용 전문 앞부분/요약/키워드 JSON
+
+워커가 결과를 저장할 때 기록(덮어쓰기)하고, API는 캐시에 없을 때만 DB에서 읽어
+없는 필드만 채웁니다(HSETNX). 노트 삭제/재분석 시 invalidate()로 제거합니다.
+모든 키에 TTL을 두어 Redis maxmemory(volatile-lru) 정책으로 작업 큐를 건드리지 않고
+캐시만 축출되게 합니다. Redis 오류 시에는 캐시 미스로 처리합니다.
+"""
+
+import json
+import logging
+import uuid
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 페이로드는 gzip 바이트이므로 응답 디코딩 없는 별도 클라이언트 사용
+cache_client = redis.from_url(settings.redis_url)
+
+
+# 캐시 형식 버전 (워커 note_cache.CACHE_VERSION과 같아야 함)
+CACHE_VERSION = 1
+
+
+def _key(note_id: uuid.UUID) -> str:
+    return f"voice:note:v{CACHE_VERSION}:{note_id}"
+
+
+def _owner_matches(owner: bytes | None, owner_id: uuid.UUID | None) -> bool:
+    # 서비스 API(owner_id=None)는 소유자 확인 없이 사용
+    return owner_id is None or (owner is not None and owner.decode() == str(owner_id))
+
+
+async def get_artifact_etag(note_id: uuid.UUID, kind: str, owner_id: uuid.UUID | None) -> str | None:
+    if not settings.note_cache_enabled:
+        return None
+    try:
+        owner, etag = await cache_client.hmget(_key(note_id), ["owner", f"{kind}:etag"])
+    except redis.RedisError as e:
+        logger.warning(f"노트 캐시 조회 실패: {e}")
+        return None
+    if etag is None or not _owner_matches(owner, owner_id):
+        return None
+    return etag.decode()
+
+
+async def get_artifact(
+    note_id: uuid.UUID, kind: str, owner_id: uuid.UUID | None
+) -> tuple[str, bytes] | None:
+    if not settings.note_cache_enabled:
+        return None
+    try:
+        owner, etag, payload = await cache_client.hmget(
+            _key(note_id), ["owner", f"{kind}:etag", f"{kind}:payload"]
+        )
+    except redis.RedisError as e:
+        logger.warning(f"노트 캐시 조회 실패: {e}")
+        return None
+    if etag is None or payload is None or not _owner_matches(owner, owner_id):
+        return None
+    return etag.decode(), payload
+
+
+async def _fill(note_id: uuid.UUID, owner_id: uuid.UUID | None, fields: dict) -> None:
+    if not settings.note_cache_enabled:
+        return
+    if owner_id is not None:
+        fields = {"owner": str(owner_id), **fields}
+    key = _key(note_id)
+    try:
+        async with cache_client.pipeline(transaction=True) as pipe:
+            for field, value in fields.items():
+                pipe.hsetnx(key, field, value)
+            pipe.expire(key, settings.note_cache_ttl_seconds)
+            await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"노트 캐시 저장 실패: {e}")
+
+
+async def fill_artifact(
+    note_id: uuid.UUID, kind: str, owner_id: uuid.UUID | None, etag: str, payload: bytes
+) -> None:
+    await _fill(note_id, owner_id, {f"{kind}:etag": etag, f"{kind}:payload": payload})
+
+
+async def get_chat_context(note_id: uuid.UUID, owner_id: uuid.UUID) -> dict | None:
+    if not settings.note_cache_enabled:
+        return None
+    try:
+        owner, context = await cache_client.hmget(_key(note_id), ["owner", "context"])
+    except redis.RedisError as e:
+        logger.warning(f"노트 캐시 조회 실패: {e}")
+        return None
+    if context is None or not _owner_matches(owner, owner_id):
+        return None
+    return json.loads(context)
+
+
+async def fill_chat_context(note_id: uuid.UUID, owner_id: uuid.UUID, context: dict) -> None:
+    await _fill(note_id, owner_id, {"context": json.dumps(context, ensure_ascii=False)})
+
+
+async def invalidate(note_id: uuid.UUID) -> None:
+    try:
+        await cache_client.delete(_key(note_id))
+    except redis.RedisError as e:
+        logger.warning(f"노트 캐시 삭제 실패: {e}")
@@ -0,0 +1,170 @@
+# backend/app/services/payloads.py
+"""미리 직렬화된 트랜스크립트/분석 응답.
+
+워커가 처리 완료 시 TranscriptResponse/AnalysisResponse와 같은 형태의 JSON을
+gzip으로 압축해 payload 컬럼에, 그 JSON의 해시를 etag 컬럼에 저장합니다.
+API는 페이로드를 검증/재직렬화 없이 그대로 전송하고(Accept-Encoding: gzip),
+필요할 때만 압축 해제하거나 MessagePack으로 변환합니다.
+If-None-Match가 일치하면 etag만 조회한 뒤 304로 응답합니다.
+Redis 노트 캐시(app.services.note_cache)에 있으면 DB를 조회하지 않습니다.
+
+워커의 encode_payload(worker/app/services/payloads.py)와 바이트 단위로 같은 JSON을 만들어야
+하므로, 양쪽 테스트가 같은 골든 값(본문과 ETag)을 확인합니다.
+"""
+
+import gzip
+import hashlib
+import json
+import uuid
+
+import msgpack
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services import note_cache
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# 완료된 결과는 거의 바뀌지 않지만 재분석될 수 있으므로 매번 재검증(304)하게 함
+ARTIFACT_CACHE_CONTROL = "private, no-cache"
+
+
+def encode_payload(data: dict) -> tuple[bytes, str]:
+    """워커와 동일한 형식(압축 JSON)으로 인코딩하고 내용 기반 ETag 값을 함께 반환합니다."""
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+    return gzip.compress(body, compresslevel=6), hashlib.sha256(body).hexdigest()[:32]
+
+
+def _accepts(header: str, token: str) -> bool:
+    """헤더 목록에 token이 q=0이 아닌 값으로 포함되어 있는지 확인합니다."""
+    for part in header.split(","):
+        name, *params = part.split(";")
+        if name.strip().lower() != token:
+            continue
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 목록에 etag(표현별 접미사 무시)가 있는지 확인합니다."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag == "*" or tag.split("-", 1)[0] == etag:
+            return True
+    return False
+
+
+def not_modified(etag_header: str, cache_control: str = ARTIFACT_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers={"ETag": etag_header, "Cache-Control": cache_control})
+
+
+def _variant(request: Request) -> str | None:
+    """요청 헤더로 응답 표현을 고릅니다: "msgpack", "gzip" 또는 None(일반 JSON)."""
+    if _accepts(request.headers.get("accept", ""), MSGPACK_MEDIA_TYPE):
+        return "msgpack"
+    if _accepts(request.headers.get("accept-encoding", ""), "gzip"):
+        return "gzip"
+    return None
+
+
+def variant_etag(request: Request, etag: str) -> str:
+    """요청이 받을 표현의 ETag 헤더 값. 304도 200과 같은 검증자를 보내야 합니다."""
+    variant = _variant(request)
+    return f'"{etag}-{variant}"' if variant else f'"{etag}"'
+
+
+def payload_response(request: Request, payload: bytes, etag: str) -> Response:
+    """Accept/Accept-Encoding에 따라 압축 JSON, JSON 또는 MessagePack으로 응답합니다.
+
+    표현마다 바이트가 다르므로 강한 ETag에 표현별 접미사를 붙입니다.
+    """
+    headers = {
+        "Vary": "Accept, Accept-Encoding",
+        "Cache-Control": ARTIFACT_CACHE_CONTROL,
+        "ETag": variant_etag(request, etag),
+    }
+    variant = _variant(request)
+    if variant == "msgpack":
+        body = msgpack.packb(json.loads(gzip.decompress(payload)))
+        return Response(body, media_type=MSGPACK_MEDIA_TYPE, headers=headers)
+    if variant == "gzip":
+        headers["Content-Encoding"] = "gzip"
+        return Response(payload, media_type="application/json", headers=headers)
+    return Response(gzip.decompress(payload), media_type="application/json", headers=headers)
+
+
+async def _store_payload(
+    db: AsyncSession, model: type, row_id: uuid.UUID, payload: bytes, etag: str
+) -> None:
+    """레거시 행에 계산한 페이로드를 저장해 다음 요청부터는 다시 만들지 않게 합니다.
+
+    그 사이 워커가 저장한 값은 덮어쓰지 않습니다.
+    """
+    await db.execute(
+        update(model)
+        .where(model.id == row_id, model.payload.is_(None))
+        .values(payload=payload, etag=etag)
+    )
+    await db.commit()
+
+
+async def artifact_response(
+    request: Request,
+    db: AsyncSession,
+    query: Select,
+    model: type,
+    schema: type[BaseModel],
+    kind: str,
+    note_id: uuid.UUID,
+    owner_id: uuid.UUID | None,
+) -> Response | None:
+    """트랜스크립트/분석 조회 공통 처리. 대상이 없으면 None을 반환합니다.
+
+    Redis 노트 캐시를 먼저 확인하고, 없을 때만 DB에서 읽어 캐시를 채웁니다.
+    db는 주 DB 세션이어야 합니다 (완료 직후 조회, 레거시 페이로드 저장).
+    query는 (model.id, model.etag)를 조회하는 소유권 조건이 포함된 SELECT이고,
+    owner_id는 사용자 API에서 캐시 항목의 소유자 확인에 사용합니다(서비스 API는 None).
+    조건부 요청이면 etag만 먼저 확인하고, 일치하지 않을 때만 페이로드를 읽습니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match:
+        etag = await note_cache.get_artifact_etag(note_id, kind, owner_id)
+        if etag and etag_matches(if_none_match, etag):
+            return not_modified(variant_etag(request, etag))
+    cached = await note_cache.get_artifact(note_id, kind, owner_id)
+    if cached:
+        etag, payload = cached
+        return payload_response(request, payload, etag)
+
+    if not if_none_match:
+        query = query.add_columns(model.payload)
+    row = (await db.execute(query)).one_or_none()
+    if row is None:
+        return None
+    if if_none_match and row.etag and etag_matches(if_none_match, row.etag):
+        return not_modified(variant_etag(request, row.etag))
+
+    if if_none_match:
+        payload = await db.scalar(select(model.payload).where(model.id == row.id))
+    else:
+        payload = row.payload
+    etag = row.etag
+    if payload is None or etag is None:
+        # 워커가 페이로드를 만들기 전의 데이터
+        obj = await db.get(model, row.id)
+        payload, etag = encode_payload(schema.model_validate(obj).model_dump(mode="json"))
+        await _store_payload(db, model, row.id, payload, etag)
+    await note_cache.fill_artifact(note_id, kind, owner_id, etag, payload)
+    if etag_matches(if_none_match or "", etag):
+        return not_modified(variant_etag(request, etag))
+    return payload_response(request, payload, etag)
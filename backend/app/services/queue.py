@@ -1,18 +1,65 @@
 # backend/app/services/queue.py
 import json
+import time
 
 import redis.asyncio as redis
 
 from app.core.config import settings
+from app.core.tracing import inject_context, tracer
 
 redis_client = redis.from_url(settings.redis_url, decode_responses=True)
 
 QUEUE_NAME = "voice:jobs"
+# 다시 분석 같은 저우선순위 작업: 워커는 QUEUE_NAME이 비었을 때만, 최소 간격을 두고 꺼냄
+LOW_PRIORITY_QUEUE = "voice:jobs:low"
+
+
+def _job(note_id: str, audio_path: str) -> str:
+    # enqueued_at: 워커의 대기 시간/큐 적체 메트릭용
+    # trace: 워커가 이어받을 추적 컨텍스트 (W3C traceparent, 추적 비활성 시 빈 딕셔너리)
+    return json.dumps({
+        "note_id": note_id,
+        "audio_path": audio_path,
+        "enqueued_at": time.time(),
+        "trace": inject_context(),
+    })
 
 
 async def enqueue_job(note_id: str, audio_path: str) -> None:
-    job = json.dumps({"note_id": note_id, "audio_path": audio_path})
-    await redis_client.rpush(QUEUE_NAME, job)
+    with tracer.start_as_current_span("queue.enqueue", attributes={"note.id": note_id}):
+        await redis_client.rpush(QUEUE_NAME, _job(note_id, audio_path))
+
+
+async def enqueue_jobs(jobs: list[tuple[str, str]]) -> None:
+    """여러 작업을 단일 RPUSH로 등록합니다. jobs: (note_id, audio_path) 목록
+
+    노트마다 queue.enqueue 스팬을 만들어 각 작업의 워커 스팬이 그 아래에 이어지게 합니다.
+    """
+    if not jobs:
+        return
+    payloads = []
+    for note_id, audio_path in jobs:
+        with tracer.start_as_current_span("queue.enqueue", attributes={"note.id": note_id}):
+            payloads.append(_job(note_id, audio_path))
+    with tracer.start_as_current_span("queue.push", attributes={"queue.jobs": len(payloads)}):
+        await redis_client.rpush(QUEUE_NAME, *payloads)
+
+
+async def enqueue_reanalysis(note_ids: list[str]) -> None:
+    """저장된 트랜스크립트로 분석 단계만 다시 실행하는 작업을 저우선순위 큐에 등록합니다."""
+    if not note_ids:
+        return
+    payloads = []
+    for note_id in note_ids:
+        with tracer.start_as_current_span("queue.enqueue", attributes={"note.id": note_id, "job.type": "reanalyze"}):
+            payloads.append(json.dumps({
+                "type": "reanalyze",
+                "note_id": note_id,
+                "enqueued_at": time.time(),
+                "trace": inject_context(),
+            }))
+    with tracer.start_as_current_span("queue.push", attributes={"queue.jobs": len(payloads)}):
+        await redis_client.rpush(LOW_PRIORITY_QUEUE, *payloads)
 
 
 async def publish_status(note_id: str, status: str, progress: int = 0) -> None:
@@ -0,0 +1,101 @@
+# backend/app/services/status_watch.py
+"""노트 상태 변경 대기 (롱폴링용).
+
+요청마다 PubSub 연결을 만들지 않도록 프로세스당 하나의 패턴 구독
+(voice:status:*)을 두고, 대기 중인 요청에 asyncio.Event로 알립니다.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL_PATTERN = "voice:status:*"
+STATUS_CHANNEL_PREFIX = "voice:status:"
+# 구독 확인 메시지를 기다리는 최대 시간 (초)
+SUBSCRIBE_TIMEOUT_SECONDS = 5.0
+
+
+async def _wait_subscribed(pubsub) -> None:
+    """psubscribe()는 명령을 보내기만 하므로 서버의 구독 확인 메시지를 받을 때까지 기다림"""
+    while True:
+        message = await pubsub.get_message(timeout=SUBSCRIBE_TIMEOUT_SECONDS)
+        if message is None:
+            raise redis.TimeoutError("상태 구독 확인 시간 초과")
+        if message["type"] == "psubscribe":
+            return
+
+
+class StatusWatcher:
+    def __init__(self):
+        self._waiters: dict[str, set[asyncio.Event]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+        self._ready: asyncio.Event | None = None
+
+    async def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._listen())
+        await self._ready.wait()
+
+    async def _listen(self) -> None:
+        r = redis.from_url(settings.redis_url, decode_responses=True)
+        pubsub = r.pubsub()
+        try:
+            await pubsub.psubscribe(STATUS_CHANNEL_PATTERN)
+            # 확인 전에 대기를 시작하면 그 사이 발행된 상태 변경을 놓쳐 타임아웃까지 기다림
+            await _wait_subscribed(pubsub)
+            self._ready.set()
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                note_id = message["channel"].removeprefix(STATUS_CHANNEL_PREFIX)
+                for event in self._waiters.get(note_id, ()):
+                    event.set()
+        except asyncio.CancelledError:
+            pass
+        except redis.RedisError as e:
+            logger.error(f"상태 구독 오류: {e}")
+        finally:
+            # 구독이 끊기면 대기 중인 요청을 깨워 DB를 다시 확인하게 함
+            self._ready.set()
+            for events in self._waiters.values():
+                for event in events:
+                    event.set()
+            await pubsub.aclose()
+            await r.aclose()
+
+    @asynccontextmanager
+    async def watch(self, note_ids: list[str]):
+        """note_ids 상태 메시지 수신 시 set되는 Event를 반환합니다.
+
+        DB 조회 전에 등록해야 조회와 대기 사이의 변경을 놓치지 않습니다.
+        """
+        await self._ensure_started()
+        event = asyncio.Event()
+        for note_id in note_ids:
+            self._waiters[note_id].add(event)
+        try:
+            yield event
+        finally:
+            for note_id in note_ids:
+                waiters = self._waiters.get(note_id)
+                if waiters is not None:
+                    waiters.discard(event)
+                    if not waiters:
+                        del self._waiters[note_id]
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+status_watcher = StatusWatcher()
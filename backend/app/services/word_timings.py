@@ -0,0 +1,125 @@
+# backend/app/services/word_timings.py
+"""단어 단위 타이밍(노래방식 하이라이트용) 압축 형식.
+
+워커(app.services.word_timings)가 정렬 결과의 단어 시간을 단어별 JSON 객체 대신
+열 단위로 묶어 transcripts.word_timings에 저장합니다 (리틀 엔디언).
+
+    헤더    "VWT1", 단어 수 n, 세그먼트 수 m          (<4sII)
+    start   float32 × n   단어 시작(초), 오름차순
+    end     float32 × n   단어 끝(초)
+    score   float32 × n   정렬 신뢰도 (없으면 NaN)
+    text    uint32 × (n+1)  단어 텍스트의 UTF-8 바이트 오프셋
+    segment uint32 × (m+1)  세그먼트별 첫 단어 번호 (transcript_segments.seq 순서)
+    UTF-8 텍스트 (단어를 구분자 없이 이어 붙임)
+
+시작 시간이 정렬되어 있으므로 구간 조회는 전체를 풀지 않고 이진 탐색한 뒤 해당 범위만 읽습니다.
+워커는 저장본의 해시(word_timings_etag)를 함께 저장하므로 조건부 요청은 저장본을 읽지 않고 처리합니다.
+"""
+
+import array
+import hashlib
+import math
+import struct
+import sys
+from bisect import bisect_left, bisect_right
+
+MAGIC = b"VWT1"
+HEADER = struct.Struct("<4sII")
+
+
+def _floats(view: memoryview):
+    if sys.byteorder == "little":
+        return view.cast("f")
+    values = array.array("f", view)
+    values.byteswap()
+    return values
+
+
+def _uints(view: memoryview):
+    if sys.byteorder == "little":
+        return view.cast("I")
+    values = array.array("I", view)
+    values.byteswap()
+    return values
+
+
+def pack_word_timings(segments: list[dict]) -> bytes:
+    """정렬된 세그먼트(words 포함)를 압축 형식으로 변환합니다. 워커와 같은 형식이어야 합니다."""
+    starts, ends, scores = array.array("f"), array.array("f"), array.array("f")
+    text_offsets, segment_offsets = array.array("I", [0]), array.array("I", [0])
+    text = bytearray()
+    previous_start = previous_end = 0.0
+    for seg in segments:
+        for word in seg.get("words") or []:
+            # 정렬하지 못한 단어(숫자/기호)는 시간이 없으므로 앞 단어 끝에 붙임
+            start = max(float(word.get("start", previous_end)), previous_start)
+            end = max(float(word.get("end", start)), start)
+            starts.append(start)
+            ends.append(end)
+            scores.append(float(word.get("score", math.nan)))
+            text += str(word.get("word", "")).encode()
+            text_offsets.append(len(text))
+            previous_start, previous_end = start, end
+        segment_offsets.append(len(starts))
+
+    if sys.byteorder != "little":
+        for values in (starts, ends, scores, text_offsets, segment_offsets):
+            values.byteswap()
+    return b"".join((
+        HEADER.pack(MAGIC, len(starts), len(segment_offsets) - 1),
+        starts.tobytes(),
+        ends.tobytes(),
+        scores.tobytes(),
+        text_offsets.tobytes(),
+        segment_offsets.tobytes(),
+        bytes(text),
+    ))
+
+
+def word_timings_etag(data: bytes) -> str:
+    """저장본 해시. 워커와 같은 방식이어야 합니다 (마이그레이션 백필도 같은 식)."""
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def words_in_window(data: bytes, start: float, end: float) -> dict:
+    """[start, end) 구간과 겹치는 단어를 열 단위로 반환합니다.
+
+    index는 첫 단어의 전체 순번, segments는 단어마다 속한 세그먼트 순번입니다.
+    """
+    magic, count, segment_count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("지원하지 않는 단어 타이밍 형식입니다")
+    view = memoryview(data)
+    position = HEADER.size
+
+    def take(size: int) -> memoryview:
+        nonlocal position
+        part = view[position:position + size]
+        position += size
+        return part
+
+    starts = _floats(take(4 * count))
+    ends = _floats(take(4 * count))
+    scores = _floats(take(4 * count))
+    text_offsets = _uints(take(4 * (count + 1)))
+    segment_offsets = _uints(take(4 * (segment_count + 1)))
+    text = take(len(data) - position)
+
+    # 시작 시간 기준으로 범위를 찾고, 구간 시작 전에 시작해 걸쳐 있는 단어는 바로 앞 하나만 확인
+    hi = bisect_left(starts, end)
+    lo = max(bisect_right(starts, start) - 1, 0)
+    while lo < hi and ends[lo] <= start:
+        lo += 1
+
+    words = {"index": lo, "starts": [], "ends": [], "scores": [], "segments": [], "texts": []}
+    segment = max(bisect_right(segment_offsets, lo) - 1, 0)
+    for i in range(lo, hi):
+        while segment < segment_count - 1 and segment_offsets[segment + 1] <= i:
+            segment += 1
+        score = scores[i]
+        words["starts"].append(round(starts[i], 3))
+        words["ends"].append(round(ends[i], 3))
+        words["scores"].append(None if math.isnan(score) else round(score, 3))
+        words["segments"].append(segment)
+        words["texts"].append(bytes(text[text_offsets[i]:text_offsets[i + 1]]).decode())
+    return words
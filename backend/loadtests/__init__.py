@@ -0,0 +1 @@
+"""API 부하 테스트 (python -m loadtests.run)"""
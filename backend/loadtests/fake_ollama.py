@@ -0,0 +1,73 @@
+# backend/loadtests/fake_ollama.py
+"""부하 테스트용 로컬 Ollama 대체 서버.
+
+채팅(/api/chat)과 임베딩(/api/embed)에 고정된 형식의 응답을 지정한 지연 후 돌려줍니다.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.models.note import EMBEDDING_DIMENSIONS
+
+
+class FakeOllama:
+    def __init__(self, chat_latency: float = 0.0):
+        self.chat_latency = chat_latency
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, body: dict) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if self.path == "/api/chat":
+                    time.sleep(fake.chat_latency)
+                    self._reply({
+                        "model": request["model"],
+                        "message": {"role": "assistant", "content": "부하 테스트 응답입니다."},
+                        "done": True,
+                        "eval_count": 40,
+                        "eval_duration": int(max(fake.chat_latency, 0.001) * 1e9),
+                    })
+                elif self.path == "/api/embed":
+                    texts = request["input"] if isinstance(request["input"], list) else [request["input"]]
+                    rng = random.Random(len(texts))
+                    self._reply({
+                        "model": request["model"],
+                        "embeddings": [
+                            [rng.uniform(-1, 1) for _ in range(EMBEDDING_DIMENSIONS)] for _ in texts
+                        ],
+                    })
+                else:
+                    self.send_error(404)
+
+        return Handler
+
+    def __enter__(self) -> "FakeOllama":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
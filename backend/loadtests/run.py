@@ -0,0 +1,382 @@
+# backend/loadtests/run.py
+"""API 부하 테스트.
+
+로컬 Postgres/Redis(DATABASE_URL/REDIS_URL, alembic upgrade head 적용)를 사용하는 API를
+별도 프로세스의 uvicorn으로 띄우고(부하 생성기와 이벤트 루프를 공유하지 않도록),
+업로드/검색/트랜스크립트 조회/채팅(가짜 Ollama)/
+WebSocket 상태 구독을 가중치에 따라 섞어 동시 사용자 수만큼 실행합니다.
+엔드포인트별 p50/p95/p99와 처리량을 기록하고 budgets.json의 예산을 넘으면 종료 코드 1로 끝납니다.
+backend 디렉터리에서 실행합니다.
+
+    python -m loadtests.run --duration 30 --concurrency 20 --output loadtest.json
+
+테스트용 사용자/노트를 만들고 끝나면 삭제합니다. 업로드된 노트의 작업은 voice:jobs에서 제거합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_BUDGETS = Path(__file__).parent / "budgets.json"
+
+# 요청 종류별 가중치 (읽기 위주의 실제 사용 비율을 반영)
+DEFAULT_MIX = {
+    "transcript": 30,
+    "transcript.window": 10,
+    "analysis": 15,
+    "search.notes": 15,
+    "search.segments": 10,
+    "upload": 5,
+    "chat": 10,
+    "ws.status": 5,
+}
+
+WORDS = ["회의", "예산", "일정", "디자인", "배포", "고객", "보고서", "검토", "계약", "마케팅", "채용", "서버"]
+
+# 업로드용 최소 WAV (헤더 + 0.1초 무음)
+_WAV_FRAMES = 1600
+SAMPLE_WAV = (
+    b"RIFF" + (36 + _WAV_FRAMES * 2).to_bytes(4, "little") + b"WAVEfmt "
+    + (16).to_bytes(4, "little") + (1).to_bytes(2, "little") + (1).to_bytes(2, "little")
+    + (16000).to_bytes(4, "little") + (32000).to_bytes(4, "little") + (2).to_bytes(2, "little")
+    + (16).to_bytes(2, "little") + b"data" + (_WAV_FRAMES * 2).to_bytes(4, "little") + bytes(_WAV_FRAMES * 2)
+)
+
+
+@dataclass
+class Seed:
+    user_id: uuid.UUID
+    project_id: uuid.UUID
+    note_ids: list[uuid.UUID]
+    token: str
+    uploaded: list[str] = field(default_factory=list)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """최근접 순위 백분위수"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: dict[str, list[float]], errors: dict[str, int], duration: float) -> dict:
+    endpoints = {}
+    for name in sorted(set(samples) | set(errors)):
+        values = samples.get(name, [])
+        count = len(values) + errors.get(name, 0)
+        endpoints[name] = {
+            "requests": count,
+            "errors": errors.get(name, 0),
+            "rps": round(count / duration, 2),
+            **(
+                {
+                    "p50_ms": round(percentile(values, 50) * 1000, 2),
+                    "p95_ms": round(percentile(values, 95) * 1000, 2),
+                    "p99_ms": round(percentile(values, 99) * 1000, 2),
+                }
+                if values
+                else {}
+            ),
+        }
+    total = sum(e["requests"] for e in endpoints.values())
+    total_errors = sum(e["errors"] for e in endpoints.values())
+    return {
+        "duration_seconds": round(duration, 2),
+        "requests": total,
+        "rps": round(total / duration, 2),
+        "error_rate": round(total_errors / total, 4) if total else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def check_budgets(result: dict, budgets: dict) -> list[str]:
+    """예산을 넘은 항목 목록을 반환합니다. 지원 키: p50_ms/p95_ms/p99_ms(상한), min_rps(하한)"""
+    violations = []
+    max_error_rate = budgets.get("max_error_rate")
+    if max_error_rate is not None and result["error_rate"] > max_error_rate:
+        violations.append(f"error_rate {result['error_rate']:.2%} > {max_error_rate:.2%}")
+    for name, budget in budgets.get("endpoints", {}).items():
+        measured = result["endpoints"].get(name)
+        if measured is None:
+            continue
+        for key, limit in budget.items():
+            if key == "min_rps":
+                if measured["rps"] < limit:
+                    violations.append(f"{name} rps {measured['rps']} < {limit}")
+            elif key in measured and measured[key] > limit:
+                violations.append(f"{name} {key} {measured[key]} > {limit}")
+    return violations
+
+
+async def seed_data(notes: int, segments_per_note: int) -> Seed:
+    from app.core.database import async_session
+    from app.core.security import create_access_token
+    from app.models.note import Analysis, Note, Project, Transcript
+    from app.models.user import User
+
+    rng = random.Random(0)
+    user_id = uuid.uuid4()
+    async with async_session() as db:
+        db.add(User(id=user_id, email=f"loadtest-{user_id}@example.com", name="부하 테스트", password_hash="-"))
+        project = Project(user_id=user_id, name="부하 테스트")
+        db.add(project)
+        await db.flush()
+
+        note_ids = []
+        for i in range(notes):
+            segments = [
+                {
+                    "speaker": f"SPEAKER_0{s % 2}",
+                    "start": s * 5.0,
+                    "end": s * 5.0 + 4.5,
+                    "text": " ".join(rng.choices(WORDS, k=8)) + f" 관련 논의 {s}번",
+                    "confidence": 0.9,
+                }
+                for s in range(segments_per_note)
+            ]
+            note = Note(
+                project_id=project.id,
+                title=f"부하 테스트 노트 {i} {rng.choice(WORDS)}",
+                audio_path="/tmp/none.wav",
+                status="completed",
+                duration_seconds=segments[-1]["end"],
+            )
+            db.add(note)
+            await db.flush()
+            db.add(Transcript(note_id=note.id, segments=segments, full_text=" ".join(s["text"] for s in segments)))
+            db.add(Analysis(
+                note_id=note.id,
+                summary=f"{rng.choice(WORDS)}에 대한 요약",
+                topics=rng.sample(WORDS, 2),
+                keywords=rng.sample(WORDS, 4),
+                action_items=[],
+            ))
+            note_ids.append(note.id)
+        await db.commit()
+        project_id = project.id
+
+    return Seed(user_id, project_id, note_ids, create_access_token({"sub": str(user_id)}))
+
+
+async def cleanup(seed: Seed) -> None:
+    from sqlalchemy import delete, select
+
+    from app.core.database import async_session, engine
+    from app.models.note import Analysis, Bookmark, ChatSession, Note, Project, Transcript
+    from app.models.user import User
+    from app.services import note_cache
+    from app.services.queue import QUEUE_NAME, redis_client
+
+    async with async_session() as db:
+        note_ids = (await db.scalars(select(Note.id).where(Note.project_id == seed.project_id))).all()
+        for model in (ChatSession, Bookmark, Analysis, Transcript):
+            await db.execute(delete(model).where(model.note_id.in_(note_ids)))
+        await db.execute(delete(Note).where(Note.project_id == seed.project_id))
+        await db.execute(delete(Project).where(Project.id == seed.project_id))
+        await db.execute(delete(User).where(User.id == seed.user_id))
+        await db.commit()
+    for note_id in note_ids:
+        await note_cache.invalidate(note_id)
+
+    # 업로드로 등록된 작업 제거 (실제 워커가 처리하지 않도록)
+    uploaded = set(seed.uploaded)
+    for job in await redis_client.lrange(QUEUE_NAME, 0, -1):
+        if json.loads(job)["note_id"] in uploaded:
+            await redis_client.lrem(QUEUE_NAME, 1, job)
+    await engine.dispose()
+
+
+class Runner:
+    def __init__(self, client, base_url: str, seed: Seed, mix: dict[str, int]):
+        self.client = client
+        self.base_url = base_url
+        self.seed = seed
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def _request(self, rng: random.Random, name: str) -> bool:
+        note_id = rng.choice(self.seed.note_ids)
+        if name == "transcript":
+            r = await self.client.get(f"/api/notes/{note_id}/transcript")
+        elif name == "transcript.window":
+            start = rng.uniform(0, 200)
+            r = await self.client.get(f"/api/notes/{note_id}/transcript", params={"start": start, "end": start + 60})
+        elif name == "analysis":
+            r = await self.client.get(f"/api/notes/{note_id}/analysis")
+        elif name == "search.notes":
+            r = await self.client.get("/api/search", params={"q": rng.choice(WORDS)})
+        elif name == "search.segments":
+            r = await self.client.get("/api/search/segments", params={"q": rng.choice(WORDS)})
+        elif name == "chat":
+            r = await self.client.post(f"/api/notes/{note_id}/chat", json={"message": f"{rng.choice(WORDS)} 요약해줘"})
+        elif name == "upload":
+            r = await self.client.post(
+                "/api/notes/upload",
+                params={"project_id": str(self.seed.project_id)},
+                files={"file": ("loadtest.wav", SAMPLE_WAV, "audio/wav")},
+            )
+            if r.status_code == 201:
+                self.seed.uploaded.append(r.json()["id"])
+        elif name == "ws.status":
+            return await self._ws_status(note_id)
+        else:
+            raise ValueError(f"알 수 없는 요청 종류입니다: {name}")
+        return r.status_code < 400
+
+    async def _ws_status(self, note_id: uuid.UUID) -> bool:
+        """구독 후 상태 메시지 하나를 받을 때까지 (연결 + 전달 지연)"""
+        import websockets
+
+        from app.services.queue import publish_status
+
+        url = self.base_url.replace("http", "ws", 1) + f"/ws/notes/{note_id}/status"
+        async with websockets.connect(url) as ws:
+            # 서버가 구독을 마칠 때까지 발행을 반복 (구독 전 메시지는 유실됨)
+            for _ in range(50):
+                await publish_status(str(note_id), "processing", 10)
+                try:
+                    message = await asyncio.wait_for(ws.recv(), 0.1)
+                except asyncio.TimeoutError:
+                    continue
+                return json.loads(message)["note_id"] == str(note_id)
+        return False
+
+    async def user(self, index: int, deadline: float) -> None:
+        rng = random.Random(index)
+        while time.perf_counter() < deadline:
+            name = rng.choices(self.names, self.weights)[0]
+            start = time.perf_counter()
+            try:
+                ok = await self._request(rng, name)
+            except Exception:
+                ok = False
+            if ok:
+                self.samples[name].append(time.perf_counter() - start)
+            else:
+                self.errors[name] += 1
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_ready(client, server: subprocess.Popen) -> None:
+    import httpx
+
+    for _ in range(200):
+        if server.poll() is not None:
+            raise RuntimeError(f"API 서버가 시작되지 않았습니다 (종료 코드 {server.returncode})")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("API 서버 시작 대기 시간을 초과했습니다")
+
+
+async def run(args, env: dict[str, str]) -> dict:
+    import httpx
+
+    from app.core.config import settings
+
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--workers", str(args.workers)],
+        env={**os.environ, **env},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    seed = None
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+            await _wait_ready(client, server)
+            seed = await seed_data(args.notes, args.segments)
+            client.headers["Authorization"] = f"Bearer {seed.token}"
+            runner = Runner(client, base_url, seed, args.mix)
+            # 캐시/커넥션 예열
+            await runner.user(-1, time.perf_counter() + args.warmup)
+            runner.samples.clear()
+            runner.errors.clear()
+
+            start = time.perf_counter()
+            deadline = start + args.duration
+            await asyncio.gather(*(runner.user(i, deadline) for i in range(args.concurrency)))
+            duration = time.perf_counter() - start
+    finally:
+        if seed is not None:
+            await cleanup(seed)
+        server.terminate()
+        server.wait(timeout=30)
+
+    return {
+        "config": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "notes": args.notes,
+            "segments_per_note": args.segments,
+            "mix": args.mix,
+            "chat_latency": args.chat_latency,
+            "database_read_url": bool(settings.database_read_url),
+            "note_cache_enabled": settings.note_cache_enabled,
+        },
+        **summarize(runner.samples, runner.errors, duration),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API 부하 테스트")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="예열 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 프로세스 수")
+    parser.add_argument("--notes", type=int, default=50, help="생성할 완료 노트 수")
+    parser.add_argument("--segments", type=int, default=60, help="노트당 세그먼트 수")
+    parser.add_argument("--mix", type=json.loads, default=DEFAULT_MIX, help='요청 가중치 JSON (예: \'{"transcript": 1}\')')
+    parser.add_argument("--chat-latency", type=float, default=0.1, help="가짜 Ollama 채팅 응답 지연(초)")
+    parser.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS)
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    from loadtests.fake_ollama import FakeOllama
+
+    with tempfile.TemporaryDirectory() as upload_dir, FakeOllama(args.chat_latency) as ollama:
+        result = asyncio.run(run(args, {"UPLOAD_DIR": upload_dir, "OLLAMA_URL": ollama.url}))
+
+    for name, endpoint in result["endpoints"].items():
+        print(
+            f"{name:<18} {endpoint['requests']:>7} req {endpoint['rps']:>8} rps  "
+            f"p50 {endpoint.get('p50_ms', '-'):>8}  p95 {endpoint.get('p95_ms', '-'):>8}  "
+            f"p99 {endpoint.get('p99_ms', '-'):>8} ms  errors {endpoint['errors']}"
+        )
+    print(f"합계 {result['requests']} req, {result['rps']} rps, 오류율 {result['error_rate']:.2%}")
+    if args.output:
+        args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n")
+
+    violations = check_budgets(result, json.loads(args.budgets.read_text()))
+    if violations:
+        print("예산 초과: " + ", ".join(violations))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import uuid
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
@@ -9,6 +10,7 @@ from sqlalchemy.pool import NullPool
 from app.core.config import settings
 from app.core.security import create_access_token, hash_password
 from app.models import Base
+from app.models.note import Analysis, Note, Project, Transcript
 from app.models.user import User
 
 # NullPool: 이벤트 루프 간 연결 재사용 방지
@@ -27,6 +29,18 @@ async def _setup_tables():
     await test_engine.dispose()
 
 
+@pytest_asyncio.fixture
+async def requires_pg_trgm(_setup_tables):
+    """pg_trgm 확장이 없는 DB에서는 트라이그램 테스트를 건너뜀"""
+    async with test_engine.begin() as conn:
+        available = await conn.scalar(
+            text("SELECT count(*) FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        )
+        if not available:
+            pytest.skip("pg_trgm 확장을 사용할 수 없습니다")
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def _clean_tables(_setup_tables):
     """각 테스트 후 데이터 초기화"""
@@ -39,14 +53,17 @@ async def _clean_tables(_setup_tables):
 @pytest_asyncio.fixture
 async def client():
     """API 클라이언트 - 각 요청마다 새 DB 세션 사용"""
-    from app.core.database import get_db
+    from app.core.database import get_db, get_read_db
     from app.main import app
+    from app.services.auth_cache import auth_cache
 
     async def override_get_db():
         async with TestSessionFactory() as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    auth_cache.clear()
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
         yield c
@@ -90,3 +107,49 @@ async def auth_client(client, auth_headers):
     """인증된 클라이언트"""
     client.headers.update(auth_headers)
     return client
+
+
+@pytest_asyncio.fixture
+async def make_note(test_user):
+    """테스트 사용자 소유의 노트(+트랜스크립트/분석)를 DB에 직접 생성하는 팩토리"""
+    project_ids = {}
+
+    async def _make_note(
+        title="테스트 노트",
+        segments=None,
+        summary=None,
+        keywords=None,
+        status="completed",
+        project_name="기본 프로젝트",
+    ):
+        async with TestSessionFactory() as session:
+            if project_name not in project_ids:
+                project = Project(user_id=test_user.id, name=project_name)
+                session.add(project)
+                await session.flush()
+                project_ids[project_name] = project.id
+
+            note = Note(
+                project_id=project_ids[project_name],
+                title=title,
+                audio_path="/tmp/none.wav",
+                status=status,
+                duration_seconds=segments[-1]["end"] if segments else None,
+            )
+            session.add(note)
+            await session.flush()
+
+            if segments is not None:
+                session.add(Transcript(
+                    note_id=note.id,
+                    segments=segments,
+                    full_text=" ".join(s["text"] for s in segments),
+                ))
+            if summary is not None or keywords is not None:
+                session.add(Analysis(
+                    note_id=note.id, summary=summary, topics=[], keywords=keywords or [], action_items=[],
+                ))
+            await session.commit()
+            return note.id
+
+    return _make_note
@@ -0,0 +1,48 @@
+"""DB 세션 라우팅 테스트"""
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+
+from app.core.database import get_read_db
+from app.main import app
+from tests.conftest import TestSessionFactory
+
+
+@pytest.mark.asyncio
+class TestReadRouting:
+    async def test_read_endpoints_use_read_session(self, auth_client: AsyncClient, make_note):
+        await make_note(segments=[{"speaker": "A", "start": 0.0, "end": 1.0, "text": "안녕"}])
+        used = []
+
+        async def recording_read_db():
+            used.append(True)
+            async with TestSessionFactory() as session:
+                yield session
+
+        app.dependency_overrides[get_read_db] = recording_read_db
+        for url in ("/api/projects", "/api/notes", "/api/search?q=안녕"):
+            used.clear()
+            response = await auth_client.get(url)
+            assert response.status_code == 200, url
+            assert used, url
+
+    async def test_status_and_results_read_from_primary(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=[{"speaker": "A", "start": 0.0, "end": 1.0, "text": "안녕"}], summary="요약")
+
+        # 복제본을 쓸 수 없어도 완료 알림 직후 읽는 경로는 주 DB로 응답
+        async def unavailable_read_db():
+            raise HTTPException(status_code=503, detail="복제본 사용 불가")
+            yield
+
+        app.dependency_overrides[get_read_db] = unavailable_read_db
+        for url in (
+            f"/api/notes/{note_id}",
+            f"/api/notes/{note_id}/transcript",
+            f"/api/notes/{note_id}/transcript?start=0&end=1",
+            f"/api/notes/{note_id}/analysis",
+        ):
+            assert (await auth_client.get(url)).status_code == 200, url
+        # 단어 타이밍/오디오는 저장본이 없어 404지만 복제본을 거치지 않음
+        for url in (f"/api/notes/{note_id}/transcript/words", f"/api/notes/{note_id}/audio"):
+            assert (await auth_client.get(url)).status_code == 404, url
+        assert (await auth_client.get("/api/notes")).status_code == 503
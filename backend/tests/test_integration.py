@@ -1,8 +1,22 @@
 """통합 테스트: API 엔드포인트 E2E 검증 (실제 PostgreSQL 사용)"""
+import asyncio
+import json
+import time
 import uuid
 
 import pytest
+import redis as sync_redis
 from httpx import AsyncClient
+from sqlalchemy import text, update
+from starlette.testclient import TestClient
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services import auth_cache as auth_cache_module
+from app.services.auth_cache import INVALIDATE_CHANNEL, AuthCache, auth_cache
+from app.services.queue import redis_client
+from tests.conftest import TestSessionFactory
 
 
 @pytest.mark.asyncio
@@ -60,6 +74,128 @@ class TestAuth:
         )
         assert response.status_code == 401
 
+    async def test_logout_all_revokes_existing_tokens(self, client: AsyncClient):
+        await client.post(
+            "/api/auth/register",
+            json={"email": "revoke@example.com", "name": "폐기", "password": "pass123"},
+        )
+        login = {"email": "revoke@example.com", "password": "pass123"}
+        old_token = (await client.post("/api/auth/login", json=login)).json()["access_token"]
+        old_headers = {"Authorization": f"Bearer {old_token}"}
+        assert (await client.get("/api/projects", headers=old_headers)).status_code == 200
+
+        response = await client.post("/api/auth/logout-all", headers=old_headers)
+        assert response.status_code == 204
+        assert (await client.get("/api/projects", headers=old_headers)).status_code == 401
+
+        new_token = (await client.post("/api/auth/login", json=login)).json()["access_token"]
+        response = await client.get("/api/projects", headers={"Authorization": f"Bearer {new_token}"})
+        assert response.status_code == 200
+
+    async def test_authenticated_user_is_cached(self, auth_client: AsyncClient, test_user):
+        assert (await auth_client.get("/api/projects")).status_code == 200
+
+        # 캐시된 principal로 인증되므로 users 조회 없이 통과
+        async with TestSessionFactory() as session:
+            await session.execute(text("DELETE FROM users WHERE id = :id"), {"id": test_user.id})
+            await session.commit()
+        assert (await auth_client.get("/api/projects")).status_code == 200
+
+        await auth_cache.invalidate_user(test_user.id)
+        assert (await auth_client.get("/api/projects")).status_code == 401
+
+    async def test_invalidation_reaches_other_process_cache(self, test_user):
+        # API 프로세스 두 개를 흉내: 한쪽에서 무효화하면 다른 쪽 로컬 캐시에서도 제거
+        first, second = AuthCache(), AuthCache()
+        try:
+            async with TestSessionFactory() as session:
+                user = await session.get(User, test_user.id)
+            await first.cache_user(user)
+            await second.cache_user(user)
+            # 준비가 끝났으면 서버가 구독을 확인한 상태여야 함 (그 전에 발행된 무효화는 유실)
+            subscribers = dict(await redis_client.pubsub_numsub(INVALIDATE_CHANNEL))[INVALIDATE_CHANNEL]
+            assert subscribers >= 2
+            assert (await second.get_cached_user(test_user.id)).token_version == 0
+
+            await first.invalidate_user(test_user.id)
+            for _ in range(50):
+                if await second.get_cached_user(test_user.id) is None:
+                    break
+                await asyncio.sleep(0.02)
+            assert await second.get_cached_user(test_user.id) is None
+        finally:
+            await first.stop()
+            await second.stop()
+
+    async def test_local_cache_waits_for_subscribe_confirmation(self, monkeypatch):
+        """SUBSCRIBE 전송만으로는 로컬 캐시를 켜지 않고 서버 확인 메시지를 받은 뒤에 켬"""
+        confirmed = asyncio.Event()
+
+        class FakePubSub:
+            async def subscribe(self, channel):
+                pass
+
+            async def get_message(self, timeout=None):
+                await confirmed.wait()
+                return {"type": "subscribe", "pattern": None, "channel": INVALIDATE_CHANNEL, "data": 1}
+
+            async def listen(self):
+                await asyncio.Event().wait()
+                yield
+
+            async def aclose(self):
+                pass
+
+        class FakeRedis:
+            def pubsub(self):
+                return FakePubSub()
+
+            async def aclose(self):
+                pass
+
+        monkeypatch.setattr(auth_cache_module.redis, "from_url", lambda *args, **kwargs: FakeRedis())
+        cache = AuthCache()
+        started = asyncio.create_task(cache._ensure_started())
+        try:
+            await asyncio.sleep(0.1)
+            assert not started.done()
+            assert not cache._subscribed
+            confirmed.set()
+            await asyncio.wait_for(started, 1)
+            assert cache._subscribed
+        finally:
+            await cache.stop()
+
+    async def test_newer_token_version_reloads_stale_cache(self, auth_client: AsyncClient, test_user):
+        assert (await auth_client.get("/api/projects")).status_code == 200
+
+        # 다른 프로세스에서 버전이 올라가고 새 토큰이 발급된 상황 (이 프로세스 캐시는 버전 0)
+        async with TestSessionFactory() as session:
+            await session.execute(update(User).where(User.id == test_user.id).values(token_version=1))
+            await session.commit()
+        token = create_access_token({"sub": str(test_user.id), "ver": 1})
+        response = await auth_client.get("/api/projects", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        # 캐시가 DB 값으로 갱신되어 이전 토큰은 거부
+        assert (await auth_client.get("/api/projects")).status_code == 401
+
+    async def test_login_rejected_when_hasher_saturated(self, client: AsyncClient, monkeypatch):
+        await client.post(
+            "/api/auth/register",
+            json={"email": "busy@example.com", "name": "혼잡", "password": "pass123"},
+        )
+        monkeypatch.setattr(settings, "password_hash_max_pending", 0)
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": "busy@example.com", "password": "pass123"},
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+        metrics = (await client.get("/metrics")).text
+        assert "voice_api_password_hash_rejected_total" in metrics
+        assert "voice_api_password_hash_queue_depth 0.0" in metrics
+
     async def test_login_nonexistent_user(self, client: AsyncClient):
         response = await client.post(
             "/api/auth/login",
@@ -129,3 +265,44 @@ class TestNotes:
         fake_id = str(uuid.uuid4())
         response = await auth_client.get(f"/api/notes/{fake_id}/analysis")
         assert response.status_code == 404
+
+    async def test_note_detail_includes_processing_profile(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note()
+        profile = {"policy": "adaptive", "model": "small", "compute_type": "float16", "reasons": ["queue:16"]}
+        async with TestSessionFactory() as session:
+            await session.execute(
+                text("UPDATE notes SET processing_profile = CAST(:profile AS jsonb) WHERE id = :id"),
+                {"profile": json.dumps(profile), "id": note_id},
+            )
+            await session.commit()
+
+        response = await auth_client.get(f"/api/notes/{note_id}")
+        assert response.status_code == 200
+        assert response.json()["processing_profile"] == profile
+
+
+class TestStatusWebSocket:
+    @staticmethod
+    def _wait_for_subscribers(r, channel: str, expected: int) -> int:
+        deadline = time.monotonic() + 3.0
+        while True:
+            count = dict(r.pubsub_numsub(channel)).get(channel, 0)
+            if count == expected or time.monotonic() > deadline:
+                return count
+            time.sleep(0.05)
+
+    def test_disconnect_unsubscribes(self):
+        """상태 메시지를 받는 도중 연결이 끊기면 다음 발행을 기다리지 않고 구독을 해제"""
+        from app.main import app
+
+        channel = f"voice:status:{uuid.uuid4()}"
+        r = sync_redis.from_url(settings.redis_url, decode_responses=True)
+        try:
+            with TestClient(app).websocket_connect(f"/ws/notes/{channel.rsplit(':', 1)[1]}/status") as ws:
+                assert self._wait_for_subscribers(r, channel, 1) == 1
+                r.publish(channel, json.dumps({"status": "processing"}))
+                assert json.loads(ws.receive_text()) == {"status": "processing"}
+
+            assert self._wait_for_subscribers(r, channel, 0) == 0
+        finally:
+            r.close()
@@ -0,0 +1,65 @@
+"""프로젝트/노트 목록 페이지네이션 테스트"""
+import pytest
+from httpx import AsyncClient
+
+from app.api.pagination import encode_cursor
+
+
+async def _collect_pages(client: AsyncClient, url: str, **params):
+    items, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = await client.get(url, params=query)
+        assert response.status_code == 200
+        items.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items
+
+
+@pytest.mark.asyncio
+class TestProjectListing:
+    async def test_keyset_pages_newest_first(self, auth_client: AsyncClient):
+        for i in range(5):
+            await auth_client.post("/api/projects", json={"name": f"프로젝트{i}"})
+
+        items = await _collect_pages(auth_client, "/api/projects", limit=2)
+        assert [p["name"] for p in items] == [f"프로젝트{i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+class TestNoteListing:
+    async def test_includes_analysis_summary(self, auth_client: AsyncClient, make_note):
+        await make_note(title="대기 중", status="queued")
+        done_id = await make_note(
+            title="완료",
+            segments=[{"speaker": "SPEAKER_00", "start": 0.0, "end": 12.5, "text": "내용"}],
+            summary="요약 문장",
+            keywords=["키워드"],
+        )
+
+        response = await auth_client.get("/api/notes")
+        assert response.status_code == 200
+        data = response.json()
+        assert [n["title"] for n in data] == ["완료", "대기 중"]
+        assert data[0]["id"] == str(done_id)
+        assert data[0]["summary"] == "요약 문장"
+        assert data[0]["keywords"] == ["키워드"]
+        assert data[0]["duration_seconds"] == 12.5
+        assert data[1]["summary"] is None
+        assert "segments" not in data[0]
+
+    async def test_filter_by_project_and_paginate(self, auth_client: AsyncClient, make_note):
+        for i in range(3):
+            await make_note(title=f"A{i}", project_name="A")
+        await make_note(title="B0", project_name="B")
+        project_a = (await auth_client.get("/api/notes")).json()[-1]["project_id"]
+
+        items = await _collect_pages(auth_client, "/api/notes", project_id=project_a, limit=2)
+        assert [n["title"] for n in items] == ["A2", "A1", "A0"]
+
+    async def test_cursor_with_wrong_value_types(self, auth_client: AsyncClient):
+        # 정수 id처럼 값 타입이 다른 조작된 커서는 500이 아니라 400
+        for cursor in (encode_cursor("2026-01-01T00:00:00", 123), encode_cursor(1, 2)):
+            response = await auth_client.get("/api/notes", params={"cursor": cursor})
+            assert response.status_code == 400
@@ -0,0 +1,30 @@
+"""부하 테스트 결과 집계/예산 검사 테스트"""
+from loadtests.run import check_budgets, percentile, summarize
+
+
+class TestLoadtestBudgets:
+    def test_percentile_nearest_rank(self):
+        values = [i / 1000 for i in range(1, 101)]
+        assert percentile(values, 50) == 0.05
+        assert percentile(values, 95) == 0.095
+        assert percentile(values, 99) == 0.099
+        assert percentile([0.2], 99) == 0.2
+
+    def test_summarize_counts_errors(self):
+        result = summarize({"transcript": [0.01] * 9}, {"transcript": 1, "chat": 2}, duration=2.0)
+        assert result["requests"] == 12
+        assert result["endpoints"]["transcript"]["rps"] == 5.0
+        assert result["endpoints"]["transcript"]["p95_ms"] == 10.0
+        assert "p95_ms" not in result["endpoints"]["chat"]
+        assert result["error_rate"] == 0.25
+
+    def test_check_budgets(self):
+        result = summarize({"transcript": [0.01] * 99 + [0.5]}, {}, duration=10.0)
+        assert check_budgets(result, {"endpoints": {"transcript": {"p95_ms": 20}}}) == []
+        assert check_budgets(result, {"endpoints": {"transcript": {"p99_ms": 20}}}) == []
+        assert check_budgets(result, {"endpoints": {"transcript": {"min_rps": 20}}}) == ["transcript rps 10.0 < 20"]
+        # 측정하지 않은 엔드포인트의 예산은 무시
+        assert check_budgets(result, {"endpoints": {"chat": {"p95_ms": 1}}}) == []
+
+        failing = summarize({"transcript": [0.01]}, {"transcript": 1}, duration=1.0)
+        assert check_budgets(failing, {"max_error_rate": 0.01}) == ["error_rate 50.00% > 1.00%"]
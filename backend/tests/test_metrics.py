@@ -0,0 +1,21 @@
+"""Prometheus 메트릭 테스트"""
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+class TestMetrics:
+    async def test_pool_metrics_exposed(self, client: AsyncClient):
+        response = await client.get("/metrics")
+        assert 'voice_api_db_pool_size{engine="primary"}' in response.text
+        assert 'voice_api_db_pool_connections{engine="primary",state="checked_out"}' in response.text
+
+    async def test_request_duration_uses_route_template(self, auth_client: AsyncClient):
+        await auth_client.get(f"/api/notes/{uuid.uuid4()}")
+        response = await auth_client.get("/metrics")
+        assert (
+            'voice_api_request_duration_seconds_count{method="GET",route="/api/notes/{note_id}",status="404"}'
+            in response.text
+        )
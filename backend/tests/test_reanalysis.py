@@ -0,0 +1,75 @@
+"""다시 분석 요청 테스트 (저우선순위 큐 등록)"""
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.models.note import Note
+from app.services.queue import LOW_PRIORITY_QUEUE, QUEUE_NAME, redis_client
+from tests.conftest import TestSessionFactory
+
+SEGMENTS = [{"speaker": "SPEAKER_00", "start": 0.0, "end": 3.0, "text": "내용"}]
+
+
+@pytest_asyncio.fixture
+async def low_queue():
+    await redis_client.delete(LOW_PRIORITY_QUEUE)
+    yield
+    await redis_client.delete(LOW_PRIORITY_QUEUE)
+
+
+async def _jobs() -> list[dict]:
+    return [json.loads(j) for j in await redis_client.lrange(LOW_PRIORITY_QUEUE, 0, -1)]
+
+
+# 전역 redis_client 연결 풀이 세션 이벤트 루프에 묶이므로 세션 루프에서 실행
+@pytest.mark.asyncio(loop_scope="session")
+class TestReanalyzeNote:
+    async def test_enqueues_low_priority_job(self, auth_client: AsyncClient, make_note, low_queue):
+        note_id = await make_note(segments=SEGMENTS, summary="이전 요약")
+
+        response = await auth_client.post(f"/api/notes/{note_id}/reanalyze")
+        assert response.status_code == 202
+        assert response.json() == {"queued": 1}
+
+        [job] = await _jobs()
+        assert job["type"] == "reanalyze"
+        assert job["note_id"] == str(note_id)
+        assert "audio_path" not in job
+        assert await redis_client.llen(QUEUE_NAME) == 0
+
+    async def test_requires_transcript(self, auth_client: AsyncClient, make_note, low_queue):
+        note_id = await make_note(status="queued")
+
+        response = await auth_client.post(f"/api/notes/{note_id}/reanalyze")
+        assert response.status_code == 409
+        assert await _jobs() == []
+
+    async def test_unknown_note(self, auth_client: AsyncClient, low_queue):
+        response = await auth_client.post(f"/api/notes/{uuid.uuid4()}/reanalyze")
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestReanalyzeProject:
+    async def test_enqueues_notes_with_transcripts(self, auth_client: AsyncClient, make_note, low_queue):
+        first = await make_note(title="첫째", segments=SEGMENTS)
+        second = await make_note(title="둘째", segments=SEGMENTS)
+        await make_note(title="처리 중", status="processing")
+        other = await make_note(segments=SEGMENTS, project_name="다른 프로젝트")
+        async with TestSessionFactory() as session:
+            project_id = await session.scalar(select(Note.project_id).where(Note.id == first))
+
+        response = await auth_client.post(f"/api/projects/{project_id}/reanalyze")
+        assert response.status_code == 202
+        assert response.json() == {"queued": 2}
+        note_ids = {job["note_id"] for job in await _jobs()}
+        assert note_ids == {str(first), str(second)}
+        assert str(other) not in note_ids
+
+    async def test_unknown_project(self, auth_client: AsyncClient, low_queue):
+        response = await auth_client.post(f"/api/projects/{uuid.uuid4()}/reanalyze")
+        assert response.status_code == 404
@@ -0,0 +1,241 @@
+"""검색 API 테스트"""
+import functools
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.core.security import hash_password
+from app.models.note import EMBEDDING_DIMENSIONS, Note, Project, Segment
+from app.models.user import User
+from app.services.embedding import embed_query
+from tests.conftest import TestSessionFactory
+
+
+def _vec(*weights):
+    """앞쪽 차원에 가중치를 둔 테스트용 임베딩"""
+    return list(weights) + [0.0] * (EMBEDDING_DIMENSIONS - len(weights))
+
+
+def _seg(text, start=0.0, end=1.0, speaker="SPEAKER_00"):
+    return {"speaker": speaker, "start": start, "end": end, "text": text, "confidence": None}
+
+
+@pytest.mark.asyncio
+class TestNoteSearch:
+    async def test_ranks_title_above_body(self, auth_client: AsyncClient, make_note):
+        body_id = await make_note(title="주간 보고", segments=[_seg("예산 검토를 진행했습니다")])
+        title_id = await make_note(title="예산 회의", segments=[_seg("다음 분기 계획")])
+
+        response = await auth_client.get("/api/search", params={"q": "예산"})
+        assert response.status_code == 200
+        data = response.json()
+        assert [n["id"] for n in data] == [str(title_id), str(body_id)]
+        assert data[0]["rank"] > data[1]["rank"]
+
+    async def test_matches_analysis_keywords(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=[_seg("안녕하세요")], summary="요약", keywords=["로드맵"])
+
+        response = await auth_client.get("/api/search", params={"q": "로드맵"})
+        assert [n["id"] for n in response.json()] == [str(note_id)]
+
+    async def test_keyset_pagination(self, auth_client: AsyncClient, make_note):
+        for i in range(5):
+            await make_note(title=f"회의 {i}", segments=[_seg("공통 단어")])
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"q": "공통", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await auth_client.get("/api/search", params=params)
+            assert response.status_code == 200
+            seen.extend(n["id"] for n in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    async def test_invalid_cursor(self, auth_client: AsyncClient):
+        response = await auth_client.get("/api/search", params={"q": "x", "cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+class TestSegmentSearch:
+    async def test_returns_segment_position_and_snippet(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=[
+            _seg("인사말입니다", 0.0, 4.5, "SPEAKER_00"),
+            _seg("이번 분기 예산 이야기를 하겠습니다", 4.5, 9.0, "SPEAKER_01"),
+        ])
+
+        response = await auth_client.get("/api/search/segments", params={"q": "예산"})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        hit = data[0]
+        assert hit["note_id"] == str(note_id)
+        assert hit["seq"] == 1
+        assert hit["speaker"] == "SPEAKER_01"
+        assert (hit["start"], hit["end"]) == (4.5, 9.0)
+        assert "<mark>예산</mark>" in hit["snippet"]
+
+    async def test_snippet_escapes_text(self, auth_client: AsyncClient, make_note):
+        await make_note(segments=[_seg("예산 a < b & c 논의 <script>alert(1)</script>")])
+
+        response = await auth_client.get("/api/search/segments", params={"q": "예산"})
+        snippet = response.json()[0]["snippet"]
+        assert "<mark>예산</mark>" in snippet
+        assert "&lt;" in snippet and "&amp;" in snippet
+        assert "<script" not in snippet and "a < b" not in snippet
+
+    async def test_short_fuzzy_query_uses_prefix_match(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=[_seg("회의록에서 <확인> 했습니다"), _seg("정기 총회의 안건")])
+
+        response = await auth_client.get("/api/search/segments", params={"q": "회의", "mode": "fuzzy"})
+        assert response.status_code == 200
+        data = response.json()
+        # 트라이그램 없이 단어 접두 일치만: 단어 중간의 "총회의"는 제외
+        assert [(h["note_id"], h["seq"]) for h in data] == [(str(note_id), 0)]
+        assert data[0]["snippet"] == "<mark>회의</mark>록에서 &lt;확인&gt; 했습니다"
+
+    async def test_filter_by_note(self, auth_client: AsyncClient, make_note):
+        first = await make_note(segments=[_seg("공통 문장")])
+        await make_note(segments=[_seg("공통 문장")])
+
+        response = await auth_client.get(
+            "/api/search/segments", params={"q": "공통", "note_id": str(first)}
+        )
+        assert [h["note_id"] for h in response.json()] == [str(first)]
+
+    async def test_keyset_pagination(self, auth_client: AsyncClient, make_note):
+        await make_note(segments=[_seg(f"반복 구간 {i}", i, i + 1) for i in range(5)])
+
+        first = await auth_client.get("/api/search/segments", params={"q": "반복", "limit": 3})
+        cursor = first.headers["X-Next-Cursor"]
+        second = await auth_client.get(
+            "/api/search/segments", params={"q": "반복", "limit": 3, "cursor": cursor}
+        )
+        assert "X-Next-Cursor" not in second.headers
+        seqs = [h["seq"] for h in first.json() + second.json()]
+        assert sorted(seqs) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("requires_pg_trgm")
+class TestFuzzySegmentSearch:
+    async def test_matches_stem_inside_agglutinated_word(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=[_seg("회의록에서 확인했습니다")])
+
+        fulltext = await auth_client.get("/api/search/segments", params={"q": "회의"})
+        assert fulltext.json() == []
+
+        response = await auth_client.get("/api/search/segments", params={"q": "회의", "mode": "fuzzy"})
+        assert response.status_code == 200
+        data = response.json()
+        assert [h["note_id"] for h in data] == [str(note_id)]
+        assert data[0]["snippet"].startswith("<mark>회의</mark>록에서")
+
+    async def test_tolerates_typo(self, auth_client: AsyncClient, make_note):
+        await make_note(segments=[_seg("quarterly budget review")])
+
+        response = await auth_client.get("/api/search/segments", params={"q": "reviw", "mode": "fuzzy"})
+        assert len(response.json()) == 1
+
+
+@pytest.mark.asyncio
+class TestSemanticSegmentSearch:
+    async def test_orders_by_cosine_similarity(self, auth_client: AsyncClient, make_note, monkeypatch):
+        note_id = await make_note(segments=[
+            _seg("예산 얘기를 했습니다", 0.0, 3.0),
+            _seg("점심 메뉴 정하기", 3.0, 6.0),
+        ])
+        async with TestSessionFactory() as session:
+            for seq, vector in [(0, _vec(1.0, 0.1)), (1, _vec(0.0, 1.0))]:
+                await session.execute(
+                    update(Segment)
+                    .where(Segment.note_id == note_id, Segment.seq == seq)
+                    .values(embedding=vector)
+                )
+            await session.commit()
+
+        async def fake_embed_query(q):
+            return _vec(1.0, 0.0)
+
+        monkeypatch.setattr("app.api.routes.search.embed_query", fake_embed_query)
+        response = await auth_client.get(
+            "/api/search/segments", params={"q": "budget discussion", "mode": "semantic", "limit": 1}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [(h["note_id"], h["seq"]) for h in data] == [(str(note_id), 0)]
+        assert data[0]["rank"] > 0.9
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_other_users_neighbours_do_not_crowd_out_results(
+        self, auth_client: AsyncClient, make_note, monkeypatch
+    ):
+        note_id = await make_note(segments=[_seg("내 세그먼트", 0.0, 1.0)])
+        other_note = await make_note(
+            project_name="다른 사용자", segments=[_seg(f"남의 세그먼트 {i}", i, i + 1.0) for i in range(150)]
+        )
+        async with TestSessionFactory() as session:
+            other = User(email="other@example.com", name="다른 사용자", password_hash=hash_password("x"))
+            session.add(other)
+            await session.flush()
+            project_id = (await session.get(Note, other_note)).project_id
+            await session.execute(update(Project).where(Project.id == project_id).values(user_id=other.id))
+            await session.execute(update(Segment).where(Segment.note_id == other_note).values(embedding=_vec(1.0)))
+            await session.execute(update(Segment).where(Segment.note_id == note_id).values(embedding=_vec(0.1, 1.0)))
+            await session.commit()
+
+        async def fake_embed_query(q):
+            return _vec(1.0)
+
+        monkeypatch.setattr("app.api.routes.search.embed_query", fake_embed_query)
+        response = await auth_client.get("/api/search/segments", params={"q": "x", "mode": "semantic"})
+        assert [(h["note_id"], h["seq"]) for h in response.json()] == [(str(note_id), 0)]
+
+    async def test_escapes_snippet(self, auth_client: AsyncClient, make_note, monkeypatch):
+        note_id = await make_note(segments=[_seg("<b>굵게</b> & 끝")])
+        async with TestSessionFactory() as session:
+            await session.execute(update(Segment).where(Segment.note_id == note_id).values(embedding=_vec(1.0)))
+            await session.commit()
+
+        async def fake_embed_query(q):
+            return _vec(1.0)
+
+        monkeypatch.setattr("app.api.routes.search.embed_query", fake_embed_query)
+        response = await auth_client.get("/api/search/segments", params={"q": "x", "mode": "semantic"})
+        assert response.json()[0]["snippet"] == "&lt;b&gt;굵게&lt;/b&gt; &amp; 끝"
+
+    async def test_falls_back_to_fulltext_when_embedding_unavailable(
+        self, auth_client: AsyncClient, make_note, monkeypatch
+    ):
+        note_id = await make_note(segments=[_seg("예산 이야기"), _seg("점심 메뉴")])
+
+        async def failing_embed_query(q):
+            return None
+
+        monkeypatch.setattr("app.api.routes.search.embed_query", failing_embed_query)
+        response = await auth_client.get("/api/search/segments", params={"q": "예산", "mode": "semantic"})
+        assert response.status_code == 200
+        assert response.headers["X-Search-Mode"] == "fulltext"
+        assert [(h["note_id"], h["seq"]) for h in response.json()] == [(str(note_id), 0)]
+
+    @pytest.mark.parametrize("status_code, body", [
+        (500, {"error": "model not loaded"}),
+        (200, {"error": "unexpected"}),
+        (200, {"embeddings": []}),
+        (200, {"embeddings": [[0.1, 0.2]]}),
+    ])
+    async def test_embed_query_returns_none_on_bad_response(self, monkeypatch, status_code, body):
+        transport = httpx.MockTransport(lambda request: httpx.Response(status_code, json=body))
+        monkeypatch.setattr(
+            "app.services.embedding.httpx.AsyncClient", functools.partial(httpx.AsyncClient, transport=transport)
+        )
+        assert await embed_query("x") is None
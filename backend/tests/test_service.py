@@ -0,0 +1,326 @@
+"""서비스 간 통신 API 테스트 (X-Service-Key 인증)"""
+import asyncio
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import select
+
+from app.api.routes import notes, service
+from app.core import tracing
+from app.core.config import settings
+from app.models.note import Note
+from app.services import queue, status_watch
+from app.services.queue import QUEUE_NAME, publish_status, redis_client
+from app.services.status_watch import STATUS_CHANNEL_PATTERN, StatusWatcher, status_watcher
+from tests.conftest import TestSessionFactory
+
+SERVICE_KEY = "test-service-key"
+
+
+@pytest_asyncio.fixture
+async def service_client(client: AsyncClient, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "service_api_key", SERVICE_KEY)
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "webhook_secret", "test-webhook-secret")
+    # 테스트마다 테이블이 초기화되므로 프로세스 캐시도 초기화
+    monkeypatch.setattr(service, "_service_project_id", None)
+    await redis_client.delete(QUEUE_NAME)
+    client.headers["X-Service-Key"] = SERVICE_KEY
+    yield client
+    await redis_client.delete(QUEUE_NAME)
+    await status_watcher.stop()
+
+
+# 전역 redis_client 연결 풀이 세션 이벤트 루프에 묶이므로 세션 루프에서 실행
+@pytest.mark.asyncio(loop_scope="session")
+class TestServiceBulkUpload:
+    async def test_files_and_shared_paths(self, service_client: AsyncClient, tmp_path):
+        (tmp_path / "incoming").mkdir()
+        (tmp_path / "incoming" / "shared.wav").write_bytes(b"RIFF")
+
+        response = await service_client.post(
+            "/api/service/upload/bulk",
+            files=[
+                ("files", ("a.mp3", b"ID3a", "audio/mpeg")),
+                ("files", ("b.wav", b"RIFFb", "audio/wav")),
+            ],
+            data={"paths": ["incoming/shared.wav"]},
+        )
+        assert response.status_code == 201
+        notes = response.json()
+        assert [n["title"] for n in notes] == ["a.mp3", "b.wav", "shared.wav"]
+        assert len({n["project_id"] for n in notes}) == 1
+
+        jobs = [json.loads(j) for j in await redis_client.lrange(QUEUE_NAME, 0, -1)]
+        assert [j["note_id"] for j in jobs] == [n["id"] for n in notes]
+        assert jobs[2]["audio_path"] == str(tmp_path / "incoming" / "shared.wav")
+
+    async def test_response_order_matches_files(self, service_client: AsyncClient):
+        """응답의 n번째 노트가 n번째 파일에 대응 (제목과 저장된 내용으로 확인)"""
+        names = [f"{i:02d}-{uuid.uuid4().hex[:6]}.mp3" for i in range(12)]
+        response = await service_client.post(
+            "/api/service/upload/bulk",
+            files=[("files", (name, f"ID3{name}".encode(), "audio/mpeg")) for name in names],
+        )
+        assert response.status_code == 201
+        notes = response.json()
+        assert [n["title"] for n in notes] == names
+
+        audio_paths = {
+            job["note_id"]: job["audio_path"]
+            for job in map(json.loads, await redis_client.lrange(QUEUE_NAME, 0, -1))
+        }
+        for name, note in zip(names, notes):
+            with open(audio_paths[note["id"]], "rb") as f:
+                assert f.read() == f"ID3{name}".encode()
+
+    async def test_rejects_path_outside_upload_dir(self, service_client: AsyncClient):
+        response = await service_client.post(
+            "/api/service/upload/bulk", data={"paths": ["../../etc/passwd"]}
+        )
+        assert response.status_code == 400
+        assert await redis_client.llen(QUEUE_NAME) == 0
+
+    async def test_rejects_invalid_extension_before_saving(self, service_client: AsyncClient, tmp_path):
+        response = await service_client.post(
+            "/api/service/upload/bulk",
+            files=[
+                ("files", ("ok.mp3", b"ID3", "audio/mpeg")),
+                ("files", ("bad.txt", b"text", "text/plain")),
+            ],
+        )
+        assert response.status_code == 400
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_requires_service_key(self, service_client: AsyncClient):
+        service_client.headers["X-Service-Key"] = "wrong"
+        response = await service_client.post("/api/service/upload/bulk")
+        assert response.status_code == 401
+
+    async def test_webhook_url_applies_to_all_notes(self, service_client: AsyncClient):
+        response = await service_client.post(
+            "/api/service/upload/bulk",
+            files=[("files", ("a.mp3", b"ID3a", "audio/mpeg")), ("files", ("b.mp3", b"ID3b", "audio/mpeg"))],
+            data={"webhook_url": "https://example.com/hook"},
+        )
+        assert response.status_code == 201
+        async with TestSessionFactory() as session:
+            urls = (await session.scalars(select(Note.webhook_url))).all()
+        assert urls == ["https://example.com/hook"] * 2
+
+    async def test_rejects_invalid_webhook_url(self, service_client: AsyncClient):
+        response = await service_client.post(
+            "/api/service/upload/bulk",
+            files=[("files", ("a.mp3", b"ID3a", "audio/mpeg"))],
+            data={"webhook_url": "ftp://example.com/hook"},
+        )
+        assert response.status_code == 400
+        assert await redis_client.llen(QUEUE_NAME) == 0
+
+    async def test_rejects_webhook_without_secret(self, service_client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(settings, "webhook_secret", "")
+        response = await service_client.post(
+            "/api/service/upload/bulk",
+            files=[("files", ("a.mp3", b"ID3a", "audio/mpeg"))],
+            data={"webhook_url": "https://example.com/hook"},
+        )
+        assert response.status_code == 500
+        assert await redis_client.llen(QUEUE_NAME) == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestServiceWebhookDefault:
+    async def test_service_default_webhook_url(self, service_client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(settings, "service_webhook_url", "https://example.com/default")
+        response = await service_client.post(
+            "/api/service/upload", files={"file": ("a.wav", b"RIFF", "audio/wav")}
+        )
+        assert response.status_code == 201
+        async with TestSessionFactory() as session:
+            note = await session.get(Note, uuid.UUID(response.json()["id"]))
+        assert note.webhook_url == "https://example.com/default"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestServiceNoteBatch:
+    async def test_returns_statuses_results_and_missing(self, service_client: AsyncClient, make_note):
+        done = await make_note(
+            title="완료", segments=[{"speaker": "A", "start": 0.0, "end": 1.0, "text": "안녕"}], summary="요약"
+        )
+        queued = await make_note(title="대기", status="queued")
+        unknown = "00000000-0000-0000-0000-000000000000"
+
+        response = await service_client.post(
+            "/api/service/notes/batch",
+            json={
+                "note_ids": [str(done), str(queued), unknown],
+                "include_transcript": True,
+                "include_analysis": True,
+                "known_statuses": {str(queued): "processing"},
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        notes = {n["note_id"]: n for n in data["notes"]}
+        assert notes[str(done)]["status"] == "completed"
+        assert notes[str(done)]["transcript"]["full_text"] == "안녕"
+        assert notes[str(done)]["analysis"]["summary"] == "요약"
+        assert notes[str(queued)]["transcript"] is None
+        assert data["missing"] == [unknown]
+        assert data["changed"] is True
+
+    async def test_rejects_too_many_ids(self, service_client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(settings, "service_batch_max_notes", 2)
+        ids = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(3)]
+        response = await service_client.post("/api/service/notes/batch", json={"note_ids": ids})
+        assert response.status_code == 400
+
+    async def test_long_poll_returns_on_status_change(self, service_client: AsyncClient, make_note):
+        note_id = await make_note(status="processing")
+
+        async def complete_later():
+            await asyncio.sleep(0.3)
+            # 진행률 알림만으로는 응답하지 않아야 함
+            await publish_status(str(note_id), "stt", 10)
+            await asyncio.sleep(0.3)
+            async with TestSessionFactory() as session:
+                note = await session.get(Note, note_id)
+                note.status = "completed"
+                await session.commit()
+            await publish_status(str(note_id), "completed", 100)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        response, _ = await asyncio.gather(
+            service_client.post("/api/service/notes/batch", json={"note_ids": [str(note_id)], "wait": 10}),
+            complete_later(),
+        )
+        elapsed = loop.time() - started
+
+        assert response.json()["changed"] is True
+        assert response.json()["notes"][0]["status"] == "completed"
+        assert 0.5 < elapsed < 5
+
+    async def test_watch_receives_change_published_right_after_start(self, service_client: AsyncClient):
+        note_id = str(uuid.uuid4())
+        async with status_watcher.watch([note_id]) as event:
+            await publish_status(note_id, "completed", 100)
+            await asyncio.wait_for(event.wait(), 2)
+
+    async def test_watcher_waits_for_subscribe_confirmation(self, monkeypatch):
+        """PSUBSCRIBE 전송만으로는 준비되지 않고 서버 확인 메시지를 받은 뒤에 준비"""
+        confirmed = asyncio.Event()
+
+        class FakePubSub:
+            async def psubscribe(self, pattern):
+                pass
+
+            async def get_message(self, timeout=None):
+                await confirmed.wait()
+                return {"type": "psubscribe", "pattern": None, "channel": STATUS_CHANNEL_PATTERN, "data": 1}
+
+            async def listen(self):
+                await asyncio.Event().wait()
+                yield
+
+            async def aclose(self):
+                pass
+
+        class FakeRedis:
+            def pubsub(self):
+                return FakePubSub()
+
+            async def aclose(self):
+                pass
+
+        monkeypatch.setattr(status_watch.redis, "from_url", lambda *args, **kwargs: FakeRedis())
+        watcher = StatusWatcher()
+        started = asyncio.create_task(watcher._ensure_started())
+        try:
+            await asyncio.sleep(0.1)
+            assert not started.done()
+            confirmed.set()
+            await asyncio.wait_for(started, 1)
+        finally:
+            await watcher.stop()
+
+    async def test_long_poll_times_out_without_change(self, service_client: AsyncClient, make_note):
+        note_id = await make_note(status="processing")
+        response = await service_client.post(
+            "/api/service/notes/batch", json={"note_ids": [str(note_id)], "wait": 0.3}
+        )
+        assert response.json()["changed"] is False
+        assert response.json()["notes"][0]["status"] == "processing"
+
+
+@pytest.fixture
+def span_exporter(monkeypatch):
+    """전역 추적기 공급자를 바꾸지 않고, 로컬 공급자의 추적기를 스팬을 만드는 모듈에 주입"""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    local_tracer = provider.get_tracer("voice-api")
+    for module in (tracing, queue, service, notes):
+        monkeypatch.setattr(module, "tracer", local_tracer)
+    return exporter
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestServiceTracing:
+    TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    async def test_job_continues_request_trace(self, service_client: AsyncClient, span_exporter):
+        response = await service_client.post(
+            "/api/service/upload",
+            files={"file": ("a.mp3", b"ID3", "audio/mpeg")},
+            headers={"traceparent": f"00-{self.TRACE_ID}-00f067aa0ba902b7-01"},
+        )
+        assert response.status_code == 201
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+        assert {"POST /api/service/upload", "upload.save", "db.insert_note", "queue.enqueue"} <= set(spans)
+        assert all(format(span.context.trace_id, "032x") == self.TRACE_ID for span in spans.values())
+
+        # 워커는 queue.enqueue 스팬 아래에서 처리를 이어감
+        job = json.loads(await redis_client.lindex(QUEUE_NAME, 0))
+        _, trace_id, parent_id, _ = job["trace"]["traceparent"].split("-")
+        assert trace_id == self.TRACE_ID
+        assert parent_id == format(spans["queue.enqueue"].context.span_id, "016x")
+        assert spans["queue.enqueue"].attributes["note.id"] == response.json()["id"]
+
+    async def test_bulk_jobs_get_separate_parent_spans(self, service_client: AsyncClient, span_exporter):
+        response = await service_client.post(
+            "/api/service/upload/bulk",
+            files=[
+                ("files", ("a.mp3", b"ID3a", "audio/mpeg")),
+                ("files", ("b.wav", b"RIFFb", "audio/wav")),
+            ],
+        )
+        assert response.status_code == 201
+
+        jobs = [json.loads(j) for j in await redis_client.lrange(QUEUE_NAME, 0, -1)]
+        traceparents = [job["trace"]["traceparent"].split("-") for job in jobs]
+        assert len({tp[1] for tp in traceparents}) == 1
+        assert len({tp[2] for tp in traceparents}) == 2
+
+    async def test_file_exporter_closed_on_shutdown(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "tracing_exporter", "file")
+        monkeypatch.setattr(settings, "tracing_file_path", str(tmp_path / "spans.jsonl"))
+        # 전역 공급자는 프로세스당 한 번만 설정할 수 있으므로 등록은 생략
+        monkeypatch.setattr(tracing.trace, "set_tracer_provider", lambda provider: None)
+
+        tracing.setup_tracing()
+        handle = tracing._file
+        tracing._provider.get_tracer("test").start_span("기록").end()
+        tracing.shutdown_tracing()
+
+        assert handle.closed
+        assert tracing._provider is None and tracing._file is None
+        lines = (tmp_path / "spans.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["기록"]
@@ -0,0 +1,378 @@
+"""트랜스크립트 조회 테스트"""
+import gzip
+import json
+import uuid
+
+import msgpack
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.models.note import Analysis, Note, Transcript
+from app.services import note_cache
+from app.schemas.note import TranscriptResponse
+from app.services.payloads import encode_payload
+from app.services.word_timings import pack_word_timings, word_timings_etag, words_in_window
+from tests.conftest import TestSessionFactory
+
+# 워커 tests/test_payloads.py와 같은 골든 값: 양쪽 인코더가 같은 본문/ETag를 만들어야 함
+GOLDEN_TRANSCRIPT = {
+    "id": "00000000-0000-0000-0000-000000000001",
+    "note_id": "00000000-0000-0000-0000-000000000002",
+    "segments": [{"speaker": "SPEAKER_00", "start": 0.0, "end": 1.5, "text": '안녕하세요 "인용"', "confidence": None}],
+    "full_text": '안녕하세요 "인용"',
+}
+GOLDEN_BODY = (
+    '{"id":"00000000-0000-0000-0000-000000000001","note_id":"00000000-0000-0000-0000-000000000002",'
+    '"segments":[{"speaker":"SPEAKER_00","start":0.0,"end":1.5,"text":"안녕하세요 \\"인용\\"","confidence":null}],'
+    '"full_text":"안녕하세요 \\"인용\\""}'
+)
+GOLDEN_ETAG = "9e3291bc2cc412589c387d8e7189ce59"
+
+# 워커 tests/test_word_timings.py와 같은 골든 값: 워커가 쓴 저장본을 API가 그대로 읽어야 함
+GOLDEN_WORD_SEGMENTS = [
+    {"words": [{"word": "안녕", "start": 0.5, "end": 0.75, "score": 0.5}, {"word": "2024"}]},
+    {"words": []},
+    {"words": [{"word": "하세요", "start": 1.0, "end": 1.5, "score": 0.25}]},
+]
+GOLDEN_WORD_TIMINGS = bytes.fromhex(
+    "5657543103000000030000000000003f0000403f0000803f0000403f0000403f0000c03f0000003f0000c07f0000803e"
+    "00000000060000000a0000001300000000000000020000000200000003000000ec9588eb859532303234ed9598ec84b8ec9a94"
+)
+GOLDEN_WORD_TIMINGS_ETAG = "a3765f4e51c953a6ce621912d22473d8"
+
+SEGMENTS = [
+    {"speaker": "SPEAKER_00", "start": i * 10.0, "end": i * 10.0 + 9.0, "text": f"문장{i}", "confidence": 0.9}
+    for i in range(10)
+]
+
+# 세그먼트마다 3초 간격 단어 3개 (마지막 단어는 정렬 실패로 시간/점수 없음)
+ALIGNED_SEGMENTS = [
+    {
+        **seg,
+        "words": [
+            {"word": f"단어{i}-{j}", "start": seg["start"] + j * 3, "end": seg["start"] + j * 3 + 2, "score": 0.5}
+            for j in range(2)
+        ] + [{"word": f"{i}"}],
+    }
+    for i, seg in enumerate(SEGMENTS)
+]
+
+
+@pytest.mark.asyncio
+class TestTranscriptWindow:
+    async def test_full_transcript(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        response = await auth_client.get(f"/api/notes/{note_id}/transcript")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["segments"]) == 10
+        assert data["segments"][0]["confidence"] == 0.9
+
+    async def test_time_window_returns_overlapping_segments(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript", params={"start": 25, "end": 41}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["text"] for s in data["segments"]] == ["문장2", "문장3", "문장4"]
+        assert data["full_text"] == "문장2 문장3 문장4"
+        assert data["note_id"] == str(note_id)
+        assert data["segments"][0]["confidence"] == 0.9
+
+    async def test_time_window_includes_long_segment_started_before(self, auth_client: AsyncClient, make_note):
+        # 구간 시작 훨씬 전에 시작했지만 아직 끝나지 않은 긴 세그먼트도 포함
+        segments = [
+            {"speaker": "SPEAKER_00", "start": 0.0, "end": 5.0, "text": "짧은", "confidence": None},
+            {"speaker": "SPEAKER_00", "start": 5.0, "end": 125.0, "text": "긴", "confidence": None},
+            {"speaker": "SPEAKER_01", "start": 125.0, "end": 130.0, "text": "다음", "confidence": None},
+        ]
+        note_id = await make_note(segments=segments)
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript", params={"start": 100, "end": 126}
+        )
+        assert [s["text"] for s in response.json()["segments"]] == ["긴", "다음"]
+
+    async def test_offset_limit(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript", params={"offset": 8, "limit": 5}
+        )
+        assert [s["text"] for s in response.json()["segments"]] == ["문장8", "문장9"]
+
+    async def test_window_with_offset_limit(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript", params={"start": 30, "offset": 1, "limit": 2}
+        )
+        assert [s["text"] for s in response.json()["segments"]] == ["문장4", "문장5"]
+
+    async def test_window_not_modified(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        etag = await _store_payload(Transcript, note_id, {"id": "x", "note_id": str(note_id), "segments": [], "full_text": ""})
+        params = {"start": 25, "end": 41}
+
+        first = await auth_client.get(f"/api/notes/{note_id}/transcript", params=params)
+        assert first.headers["etag"] == f'"{etag}"'
+        second = await auth_client.get(
+            f"/api/notes/{note_id}/transcript", params=params, headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 304
+
+    async def test_window_on_missing_transcript(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(status="queued")
+        response = await auth_client.get(f"/api/notes/{note_id}/transcript", params={"limit": 5})
+        assert response.status_code == 404
+
+
+async def _store_word_timings(note_id, segments: list[dict]) -> str:
+    data = pack_word_timings(segments)
+    etag = word_timings_etag(data)
+    async with TestSessionFactory() as session:
+        await session.execute(
+            update(Transcript).where(Transcript.note_id == note_id).values(word_timings=data, word_timings_etag=etag)
+        )
+        await session.commit()
+    return etag
+
+
+@pytest.mark.asyncio
+class TestWordTimings:
+    async def test_window(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        await _store_word_timings(note_id, ALIGNED_SEGMENTS)
+
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript/words", params={"start": 14, "end": 23}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        # 13~15초 단어는 구간 시작에 걸쳐 포함, 정렬 실패 단어는 앞 단어 끝 시간에 붙음
+        assert data["texts"] == ["단어1-1", "1", "단어2-0"]
+        assert data["starts"] == [13.0, 15.0, 20.0]
+        assert data["scores"] == [0.5, None, 0.5]
+        assert data["segments"] == [1, 1, 2]
+        assert data["index"] == 4
+        assert data["end"] == 23
+
+    async def test_window_is_capped(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        await _store_word_timings(note_id, ALIGNED_SEGMENTS)
+
+        response = await auth_client.get(f"/api/notes/{note_id}/transcript/words", params={"start": 50})
+        data = response.json()
+        assert data["end"] == 350
+        assert data["texts"][0] == "단어5-0"
+        assert len(data["texts"]) == 15
+
+    async def test_not_modified(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        etag = await _store_word_timings(note_id, ALIGNED_SEGMENTS)
+
+        first = await auth_client.get(f"/api/notes/{note_id}/transcript/words")
+        assert first.headers["etag"] == f'"{etag}"'
+        second = await auth_client.get(
+            f"/api/notes/{note_id}/transcript/words", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 304
+
+    async def test_etag_is_read_from_the_stored_column(self, auth_client: AsyncClient, make_note):
+        """ETag는 요청마다 저장본을 해시하지 않고 워커가 저장한 값을 사용"""
+        note_id = await make_note(segments=SEGMENTS)
+        await _store_word_timings(note_id, ALIGNED_SEGMENTS)
+        stored_etag = "0123456789abcdef0123456789abcdef"
+        async with TestSessionFactory() as session:
+            await session.execute(
+                update(Transcript).where(Transcript.note_id == note_id).values(word_timings_etag=stored_etag)
+            )
+            await session.commit()
+
+        response = await auth_client.get(f"/api/notes/{note_id}/transcript/words")
+        assert response.headers["etag"] == f'"{stored_etag}"'
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript/words", headers={"If-None-Match": f'"{stored_etag}"'}
+        )
+        assert response.status_code == 304
+
+    async def test_golden_blob_matches_worker(self):
+        assert pack_word_timings(GOLDEN_WORD_SEGMENTS) == GOLDEN_WORD_TIMINGS
+        assert word_timings_etag(GOLDEN_WORD_TIMINGS) == GOLDEN_WORD_TIMINGS_ETAG
+        words = words_in_window(GOLDEN_WORD_TIMINGS, 0.0, 2.0)
+        assert words["texts"] == ["안녕", "2024", "하세요"]
+        # 정렬하지 못한 단어는 앞 단어 끝에 붙고, 빈 세그먼트는 건너뜀
+        assert words["starts"] == [0.5, 0.75, 1.0]
+        assert words["segments"] == [0, 0, 2]
+        assert words["scores"] == [0.5, None, 0.25]
+
+    async def test_missing_word_timings(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS)
+        response = await auth_client.get(f"/api/notes/{note_id}/transcript/words")
+        assert response.status_code == 404
+
+
+async def _store_payload(model, note_id, data: dict) -> str:
+    payload, etag = encode_payload(data)
+    async with TestSessionFactory() as session:
+        await session.execute(update(model).where(model.note_id == note_id).values(payload=payload, etag=etag))
+        await session.commit()
+    return etag
+
+
+@pytest.mark.asyncio
+class TestSerializedPayload:
+    async def test_stored_payload_sent_as_gzip(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS[:1])
+        stored = {"id": "x", "note_id": str(note_id), "segments": [], "full_text": "저장본"}
+        await _store_payload(Transcript, note_id, stored)
+
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        # DB 행을 다시 직렬화하지 않고 저장된 페이로드를 그대로 전송
+        assert response.json() == stored
+
+    async def test_plain_json_without_gzip(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(summary="요약")
+        stored = {"id": "x", "note_id": str(note_id), "summary": "저장본", "topics": [], "keywords": [], "action_items": []}
+        await _store_payload(Analysis, note_id, stored)
+
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/analysis", headers={"Accept-Encoding": "identity"}
+        )
+        assert "content-encoding" not in response.headers
+        assert json.loads(response.content) == stored
+
+    async def test_msgpack(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS[:2])
+        response = await auth_client.get(
+            f"/api/notes/{note_id}/transcript", headers={"Accept": "application/msgpack"}
+        )
+        assert response.headers["content-type"] == "application/msgpack"
+        data = msgpack.unpackb(response.content)
+        assert [s["text"] for s in data["segments"]] == ["문장0", "문장1"]
+
+    async def test_fallback_without_stored_payload(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS[:2], summary="요약")
+        response = await auth_client.get(f"/api/notes/{note_id}/analysis")
+        assert response.status_code == 200
+        assert response.json()["summary"] == "요약"
+
+        # 계산한 페이로드를 저장해 다음 요청부터는 다시 만들지 않음
+        async with TestSessionFactory() as session:
+            analysis = (await session.execute(select(Analysis).where(Analysis.note_id == note_id))).scalar_one()
+            await session.refresh(analysis, ["payload"])
+        assert analysis.etag is not None
+        assert json.loads(gzip.decompress(analysis.payload))["summary"] == "요약"
+
+    async def test_encoding_matches_worker_golden(self):
+        payload, etag = encode_payload(TranscriptResponse(**GOLDEN_TRANSCRIPT).model_dump(mode="json"))
+        assert gzip.decompress(payload).decode() == GOLDEN_BODY
+        assert etag == GOLDEN_ETAG
+
+
+@pytest.mark.asyncio
+class TestConditionalGet:
+    async def test_not_modified_with_stored_etag(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(segments=SEGMENTS[:1])
+        etag = await _store_payload(Transcript, note_id, {"id": "x", "note_id": str(note_id), "segments": [], "full_text": ""})
+
+        first = await auth_client.get(f"/api/notes/{note_id}/transcript", headers={"Accept-Encoding": "gzip"})
+        assert first.headers["etag"] == f'"{etag}-gzip"'
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        second = await auth_client.get(
+            f"/api/notes/{note_id}/transcript",
+            headers={"If-None-Match": first.headers["etag"], "Accept-Encoding": "gzip"},
+        )
+        assert second.status_code == 304
+        assert second.content == b""
+        # 304도 200과 같은 표현별 검증자를 보냄
+        assert second.headers["etag"] == first.headers["etag"]
+
+        packed = await auth_client.get(
+            f"/api/notes/{note_id}/transcript",
+            headers={"If-None-Match": first.headers["etag"], "Accept": "application/msgpack"},
+        )
+        assert packed.status_code == 304
+        assert packed.headers["etag"] == f'"{etag}-msgpack"'
+
+    async def test_changed_etag_returns_body(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(summary="요약")
+        response = await auth_client.get(f"/api/notes/{note_id}/analysis", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["summary"] == "요약"
+
+        # 페이로드가 없는 기존 데이터도 내용 기반 ETag로 재검증 가능
+        again = await auth_client.get(f"/api/notes/{note_id}/analysis", headers={"If-None-Match": response.headers["etag"]})
+        assert again.status_code == 304
+
+    async def test_audio_range_and_etag(self, auth_client: AsyncClient, make_note, tmp_path):
+        note_id = await make_note(status="completed")
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"RIFF0123456789")
+        async with TestSessionFactory() as session:
+            await session.execute(update(Note).where(Note.id == note_id).values(audio_path=str(audio)))
+            await session.commit()
+
+        response = await auth_client.get(f"/api/notes/{note_id}/audio", headers={"Range": "bytes=0-3"})
+        assert response.status_code == 206
+        assert response.content == b"RIFF"
+        assert "immutable" in response.headers["cache-control"]
+
+        cached = await auth_client.get(f"/api/notes/{note_id}/audio", headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
+
+
+@pytest.mark.asyncio
+class TestNoteCache:
+    async def test_second_read_served_from_cache(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(summary="원본")
+        first = await auth_client.get(f"/api/notes/{note_id}/analysis")
+        assert first.json()["summary"] == "원본"
+
+        # DB를 직접 바꿔도 캐시된 결과가 응답됨
+        await _store_payload(Analysis, note_id, {"summary": "변경"})
+        second = await auth_client.get(f"/api/notes/{note_id}/analysis")
+        assert second.json()["summary"] == "원본"
+        assert second.headers["etag"] == first.headers["etag"]
+
+    async def test_delete_invalidates(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(summary="요약")
+        await auth_client.get(f"/api/notes/{note_id}/analysis")
+        assert await note_cache.get_artifact(note_id, "analysis", None) is not None
+
+        assert (await auth_client.delete(f"/api/notes/{note_id}")).status_code == 204
+        assert await note_cache.get_artifact(note_id, "analysis", None) is None
+
+    async def test_delete_removes_checkpoints(self, auth_client: AsyncClient, make_note, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+        note_id = await make_note(status="queued")
+        checkpoint_dir = tmp_path / ".checkpoints" / str(note_id)
+        checkpoint_dir.mkdir(parents=True)
+        (checkpoint_dir / "asr.json").write_text("{}")
+
+        assert (await auth_client.delete(f"/api/notes/{note_id}")).status_code == 204
+        assert not checkpoint_dir.exists()
+
+    async def test_cache_entry_checks_owner(self, auth_client: AsyncClient, make_note):
+        note_id = await make_note(summary="요약")
+        await auth_client.get(f"/api/notes/{note_id}/analysis")
+        assert await note_cache.get_artifact(note_id, "analysis", uuid.uuid4()) is None
+
+    async def test_ignores_entries_from_other_cache_version(self, auth_client: AsyncClient, make_note, test_user):
+        note_id = await make_note(summary="DB")
+        # 형식이 다른 이전 버전 프로세스가 남긴 항목 (버전 없는 키)
+        stale_payload, stale_etag = encode_payload({"summary": "이전 형식"})
+        await note_cache.cache_client.hset(
+            f"voice:note:{note_id}",
+            mapping={"owner": str(test_user.id), "analysis:etag": stale_etag, "analysis:payload": stale_payload},
+        )
+        try:
+            response = await auth_client.get(f"/api/notes/{note_id}/analysis")
+            assert response.json()["summary"] == "DB"
+        finally:
+            await note_cache.cache_client.delete(f"voice:note:{note_id}")
@@ -1,9 +1,9 @@
 "use client";
 
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useRef } from "react";
 import { useRouter } from "next/navigation";
 import Link from "next/link";
-import { api } from "@/lib/api";
+import { api, getAll, getPage } from "@/lib/api";
 import { useAuth } from "@/stores/auth";
 
 interface Project {
@@ -21,6 +21,8 @@ interface Note {
   duration_seconds: number | null;
   language: string | null;
   created_at: string;
+  summary: string | null;
+  keywords: string[] | null;
 }
 
 export default function DashboardPage() {
@@ -28,6 +30,10 @@ export default function DashboardPage() {
   const { token, logout } = useAuth();
   const [projects, setProjects] = useState<Project[]>([]);
   const [notes, setNotes] = useState<Note[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  // 프로젝트 전환 후 늦게 도착한 이전 목록 응답을 무시하기 위한 요청 번호
+  const notesRequest = useRef(0);
   const [showNewProject, setShowNewProject] = useState(false);
   const [newProjectName, setNewProjectName] = useState("");
   const [newProjectDesc, setNewProjectDesc] = useState("");
@@ -35,25 +41,44 @@ export default function DashboardPage() {
 
   const fetchProjects = useCallback(async () => {
     try {
-      const { data } = await api.get("/api/projects");
-      setProjects(data);
+      setProjects(await getAll<Project>("/api/projects"));
     } catch {
       /* 무시 */
     }
   }, []);
 
   const fetchNotes = useCallback(async (projectId?: string) => {
+    const request = ++notesRequest.current;
     try {
-      const url = projectId
-        ? `/api/search?q=&project_id=${projectId}`
-        : "/api/search?q=";
-      const { data } = await api.get(url);
-      setNotes(data);
+      const page = await getPage<Note>("/api/notes", { project_id: projectId });
+      if (request !== notesRequest.current) return;
+      setNotes(page.items);
+      setNextCursor(page.nextCursor);
     } catch {
       /* 무시 */
     }
   }, []);
 
+  const loadMoreNotes = async () => {
+    if (!nextCursor) return;
+    const request = notesRequest.current;
+    setIsLoadingMore(true);
+    try {
+      const page = await getPage<Note>(
+        "/api/notes",
+        { project_id: selectedProject ?? undefined },
+        nextCursor,
+      );
+      if (request !== notesRequest.current) return;
+      setNotes((prev) => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch {
+      /* 무시 */
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     if (!token) {
       router.replace("/login");
@@ -320,6 +345,15 @@ export default function DashboardPage() {
                     </div>
                   </Link>
                 ))}
+                {nextCursor && (
+                  <button
+                    onClick={loadMoreNotes}
+                    disabled={isLoadingMore}
+                    className="w-full py-2.5 text-sm text-gray-400 border border-gray-800 rounded-xl hover:text-white hover:border-gray-700 transition disabled:opacity-50"
+                  >
+                    {isLoadingMore ? "불러오는 중..." : "더 보기"}
+                  </button>
+                )}
               </div>
             )}
           </div>
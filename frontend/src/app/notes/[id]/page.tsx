@@ -209,6 +209,7 @@ export default function NoteDetailPage() {
                 segments={transcript.segments}
                 currentTime={currentTime}
                 onSeek={handleSeek}
+                noteId={noteId}
               />
             ) : activeTab === "transcript" ? (
               <div className="text-center py-12 text-gray-500">
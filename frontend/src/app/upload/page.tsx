@@ -3,7 +3,7 @@
 import { useState, useEffect, useCallback } from "react";
 import { useRouter } from "next/navigation";
 import Link from "next/link";
-import { api } from "@/lib/api";
+import { api, getAll } from "@/lib/api";
 import { useAuth } from "@/stores/auth";
 import FileUploader from "@/components/FileUploader";
 import AudioRecorder from "@/components/AudioRecorder";
@@ -39,7 +39,7 @@ export default function UploadPage() {
 
   const fetchProjects = useCallback(async () => {
     try {
-      const { data } = await api.get("/api/projects");
+      const data = await getAll<Project>("/api/projects");
       setProjects(data);
       if (data.length > 0) {
         setSelectedProject(data[0].id);
@@ -1,5 +1,9 @@
 "use client";
 
+import { useEffect, useRef, useState, type ReactNode } from "react";
+import axios from "axios";
+import { api } from "@/lib/api";
+
 interface Segment {
   speaker: string;
   start: number;
@@ -7,12 +11,35 @@ interface Segment {
   text: string;
 }
 
+// GET /api/notes/{id}/transcript/words 응답 (같은 위치가 같은 단어)
+interface WordWindow {
+  start: number;
+  end: number;
+  starts: number[];
+  ends: number[];
+  segments: number[];
+  texts: string[];
+}
+
+interface Word {
+  text: string;
+  start: number;
+  end: number;
+}
+
 interface TranscriptViewProps {
   segments: Segment[];
   currentTime: number;
   onSeek: (time: number) => void;
+  // 지정하면 재생 위치 주변 단어 타이밍을 불러와 단어 단위로 하이라이트
+  noteId?: string;
 }
 
+// 한 번에 불러오는 단어 타이밍 구간 (초)
+const WORD_WINDOW_SECONDS = 120;
+// 구간 끝에 이만큼 가까워지면 다음 구간을 미리 불러옴 (초)
+const WORD_PREFETCH_SECONDS = 10;
+
 const SPEAKER_COLORS: Record<string, { bg: string; text: string; border: string; dot: string }> = {
   SPEAKER_00: { bg: "bg-blue-500/10", text: "text-blue-400", border: "border-blue-500/20", dot: "bg-blue-500" },
   SPEAKER_01: { bg: "bg-emerald-500/10", text: "text-emerald-400", border: "border-emerald-500/20", dot: "bg-emerald-500" },
@@ -37,16 +64,107 @@ function formatTimestamp(seconds: number) {
   return `${m}:${s.toString().padStart(2, "0")}`;
 }
 
+function segmentWords(loaded: WordWindow | null, index: number): Word[] {
+  if (!loaded) return [];
+  const words: Word[] = [];
+  loaded.segments.forEach((seg, i) => {
+    if (seg === index) {
+      words.push({ text: loaded.texts[i], start: loaded.starts[i], end: loaded.ends[i] });
+    }
+  });
+  return words;
+}
+
+function renderWords(
+  text: string,
+  words: Word[],
+  currentTime: number,
+  onSeek: (time: number) => void,
+) {
+  // 단어 텍스트를 세그먼트 텍스트에서 순서대로 찾아 감쌈 (띄어쓰기/문장부호는 원문 그대로 유지)
+  const parts: ReactNode[] = [];
+  let cursor = 0;
+  words.forEach((word, i) => {
+    const token = word.text.trim();
+    const at = token ? text.indexOf(token, cursor) : -1;
+    if (at < 0) return;
+    if (at > cursor) parts.push(text.slice(cursor, at));
+    const isCurrent = currentTime >= word.start && currentTime < word.end;
+    const isSpoken = currentTime >= word.start;
+    parts.push(
+      <span
+        key={i}
+        className={`rounded transition-colors ${
+          isCurrent ? "bg-blue-500/30 text-white" : isSpoken ? "text-white" : "text-gray-400"
+        }`}
+        onClick={(e) => {
+          e.stopPropagation();
+          onSeek(word.start);
+        }}
+      >
+        {text.slice(at, at + token.length)}
+      </span>,
+    );
+    cursor = at + token.length;
+  });
+  parts.push(text.slice(cursor));
+  return parts;
+}
+
 export default function TranscriptView({
   segments,
   currentTime,
   onSeek,
+  noteId,
 }: TranscriptViewProps) {
+  const [words, setWords] = useState<WordWindow | null>(null);
+  const [wordsUnavailable, setWordsUnavailable] = useState(false);
+  const requestedRef = useRef<number | null>(null);
+  const controllerRef = useRef<AbortController | null>(null);
+  const transcriptEnd = segments.length ? segments[segments.length - 1].end : 0;
+
+  // 재생 위치가 불러온 구간을 벗어나거나 끝에 가까워지면 다음 구간 조회
+  useEffect(() => {
+    if (!noteId || wordsUnavailable) return;
+    const covered =
+      words !== null &&
+      currentTime >= words.start &&
+      (currentTime < words.end - WORD_PREFETCH_SECONDS || words.end >= transcriptEnd);
+    if (covered) return;
+
+    const start = Math.max(0, Math.floor(currentTime) - WORD_PREFETCH_SECONDS);
+    if (requestedRef.current === start) return;
+    requestedRef.current = start;
+    // 탐색으로 새 구간을 요청하면 이전 요청을 취소해 늦게 도착한 응답이 덮어쓰지 않게 함
+    controllerRef.current?.abort();
+    const controller = new AbortController();
+    controllerRef.current = controller;
+    api
+      .get(`/api/notes/${noteId}/transcript/words`, {
+        params: { start, end: start + WORD_WINDOW_SECONDS },
+        signal: controller.signal,
+      })
+      .then((res) => setWords(res.data))
+      .catch((err) => {
+        // 단어 타이밍이 없는 노트(이전 처리분, 404)만 세그먼트 단위 하이라이트로 전환하고
+        // 일시적인 오류는 재생 위치가 바뀔 때 다시 요청
+        if (axios.isAxiosError(err) && err.response?.status === 404) {
+          setWordsUnavailable(true);
+        }
+      });
+  }, [noteId, currentTime, words, wordsUnavailable, transcriptEnd]);
+
+  // 노트가 바뀌거나 화면을 떠나면 진행 중인 요청 취소
+  useEffect(() => {
+    return () => controllerRef.current?.abort();
+  }, [noteId]);
+
   return (
     <div className="space-y-2">
       {segments.map((seg, i) => {
         const color = getColor(seg.speaker);
         const isActive = currentTime >= seg.start && currentTime < seg.end;
+        const activeWords = isActive ? segmentWords(words, i) : [];
 
         return (
           <div
@@ -77,7 +195,9 @@ export default function TranscriptView({
                 isActive ? "text-white" : "text-gray-300"
               }`}
             >
-              {seg.text}
+              {activeWords.length
+                ? renderWords(seg.text, activeWords, currentTime, onSeek)
+                : seg.text}
             </p>
           </div>
         );
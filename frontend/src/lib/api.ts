@@ -24,3 +24,42 @@ api.interceptors.response.use(
     return Promise.reject(error);
   },
 );
+
+type QueryParams = Record<string, string | number | undefined>;
+
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+// 목록 API는 키셋 페이지네이션: 다음 페이지 커서를 X-Next-Cursor 헤더로 전달
+export async function getPage<T>(
+  url: string,
+  params: QueryParams = {},
+  cursor: string | null = null,
+): Promise<Page<T>> {
+  const { data, headers } = await api.get<T[]>(url, {
+    params: cursor ? { ...params, cursor } : params,
+  });
+  const nextCursor = headers["x-next-cursor"] as string | undefined;
+  return { items: data, nextCursor: nextCursor ?? null };
+}
+
+// 선택 목록처럼 전체가 필요한 경우 커서를 끝까지 따라감
+export async function getAll<T>(
+  url: string,
+  params: QueryParams = {},
+): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const page: Page<T> = await getPage<T>(
+      url,
+      { limit: 100, ...params },
+      cursor,
+    );
+    items.push(...page.items);
+    cursor = page.nextCursor;
+  } while (cursor);
+  return items;
+}
@@ -2,20 +2,34 @@
 import asyncio
 import json
 import logging
+import os
+import time
+import uuid
 
 import redis.asyncio as redis
+from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
+from prometheus_client import start_http_server
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.pipelines.analysis import analyze_transcript
+from app.metrics import JOB_DURATION, JOBS, QUEUE_DEPTH, QUEUE_OLDEST_AGE, QUEUE_WAIT, REANALYSES
+from app.pipelines.analysis import AnalysisError, analyze_transcript, empty_result
+from app.pipelines.embedding import embed_texts, to_pgvector
 from app.pipelines.stt import transcribe_audio
+from app.services.checkpoints import Checkpoints
 from app.services.db import async_session
+from app.services.job_queue import QUEUE_NAME, JobQueue
+from app.services.note_cache import chat_context, store_note_cache
+from app.services.payloads import analysis_payload, transcript_payload
+from app.services.webhooks import enqueue_webhook, webhook_dispatcher
+from app.services.word_timings import word_timings_etag
+from app.tracing import job_context, record_queue_wait, setup_tracing, shutdown_tracing, stage, tracer
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
-QUEUE_NAME = "voice:jobs"
-
 
 async def publish_status(r: redis.Redis, note_id: str, status: str, progress: int = 0):
     """Redis PubSub으로 진행 상태 발행"""
@@ -30,12 +44,101 @@ def update_note_status(note_id: str, status: str):
     )
 
 
-async def process_job(r: redis.Redis, job_data: dict):
-    """단일 작업 처리: STT → 분석 → DB 저장"""
+async def fail_note(r: redis.Redis, note_id: str):
+    """최종 실패 처리: 상태 변경 + note.failed 웹훅, 다시 시도하지 않으므로 체크포인트도 삭제"""
+    async with async_session() as db:
+        await db.execute(
+            text("UPDATE notes SET status = 'failed' WHERE id = CAST(:note_id AS uuid)"),
+            {"note_id": note_id},
+        )
+        await enqueue_webhook(db, note_id, "note.failed")
+        await db.commit()
+    webhook_dispatcher.wake()
+    Checkpoints(note_id).clear()
+    await publish_status(r, note_id, "failed", 0)
+
+
+async def store_segment_embeddings(note_id: str, segments: list[dict]):
+    """세그먼트 임베딩 계산 후 transcript_segments에 일괄 저장"""
+    if not segments:
+        return
+    with stage("embedding"):
+        embeddings = await embed_texts([s["text"] for s in segments])
+    if embeddings is None:
+        logger.warning(f"임베딩 생략: note_id={note_id}")
+        return
+
+    with stage("db_write"):
+        async with async_session() as db:
+            await db.execute(
+                text("""
+                    UPDATE transcript_segments AS s SET embedding = CAST(v.embedding AS vector)
+                    FROM unnest(CAST(:seqs AS int[]), CAST(:embeddings AS text[])) AS v(seq, embedding)
+                    WHERE s.note_id = CAST(:note_id AS uuid) AND s.seq = v.seq
+                """),
+                {
+                    "note_id": note_id,
+                    "seqs": list(range(len(embeddings))),
+                    "embeddings": [to_pgvector(e) for e in embeddings],
+                },
+            )
+            await db.commit()
+
+
+async def store_analysis(db: AsyncSession, note_id: str, analysis: dict) -> tuple[bytes, str]:
+    """분석 결과를 노트 기준으로 upsert (기존 행의 id 유지, 페이로드에 id가 포함되므로 먼저 조회)"""
+    analysis_id = await db.scalar(
+        text("SELECT id FROM analyses WHERE note_id = CAST(:note_id AS uuid)"),
+        {"note_id": note_id},
+    )
+    analysis_id = str(analysis_id or uuid.uuid4())
+    payload, etag = analysis_payload(analysis_id, note_id, analysis)
+    await db.execute(
+        text("""
+            INSERT INTO analyses
+                (id, note_id, summary, topics, keywords, action_items, payload, etag, created_at, updated_at)
+            VALUES (CAST(:id AS uuid), CAST(:note_id AS uuid), :summary, :topics, :keywords, :action_items,
+                    :payload, :etag, now(), now())
+            ON CONFLICT (note_id) DO UPDATE SET
+                summary = EXCLUDED.summary, topics = EXCLUDED.topics, keywords = EXCLUDED.keywords,
+                action_items = EXCLUDED.action_items, payload = EXCLUDED.payload, etag = EXCLUDED.etag,
+                updated_at = now()
+        """),
+        {
+            "id": analysis_id,
+            "note_id": note_id,
+            "payload": payload,
+            "etag": etag,
+            "summary": analysis["summary"],
+            "topics": json.dumps(analysis["topics"]),
+            "keywords": json.dumps(analysis["keywords"]),
+            "action_items": json.dumps(analysis["action_items"]),
+        },
+    )
+    return payload, etag
+
+
+async def process_job(r: redis.Redis, job_data: dict) -> dict | None:
+    """단일 작업 처리: STT → 분석 → DB 저장
+
+    단계 결과는 체크포인트로 남기므로 재시도/회수된 작업은 완료된 단계를 건너뜁니다.
+    DB 쓰기는 노트 기준 upsert라 같은 작업을 다시 처리해도 중복 행이 생기지 않습니다.
+    실패했고 재시도 횟수가 남았으면 다시 넣을 작업을 반환합니다.
+    """
     note_id = job_data["note_id"]
     audio_path = job_data["audio_path"]
+    attempt = job_data.get("attempt", 1)
+    checkpoints = Checkpoints(note_id)
 
-    logger.info(f"작업 시작: note_id={note_id}")
+    resumed = checkpoints.completed()
+    if resumed:
+        logger.info(f"작업 재개: note_id={note_id}, attempt={attempt}, 완료된 단계={resumed}")
+    else:
+        logger.info(f"작업 시작: note_id={note_id}, attempt={attempt}")
+    span = trace.get_current_span()
+    span.set_attribute("job.attempt", attempt)
+    span.set_attribute("job.resumed_stages", resumed)
+    job_start = time.perf_counter()
 
     # 상태 업데이트: processing
     async with async_session() as db:
@@ -45,87 +148,265 @@ async def process_job(r: redis.Redis, job_data: dict):
     try:
         # Step 1: STT + 화자 분리
         await publish_status(r, note_id, "stt", 10)
-        stt_result = transcribe_audio(audio_path)
+        # 블로킹 STT를 스레드에서 실행해 이벤트 루프(웹훅 디스패처 등)가 멈추지 않게 함
+        # to_thread는 컨텍스트를 복사하므로 STT 단계 스팬도 이 스팬 아래에 기록됨
+        # 대기열 적체는 모델 선택 정책의 입력 (app.pipelines.policy)
+        queue_depth = await r.llen(QUEUE_NAME)
+        with tracer.start_as_current_span("stt") as stt_span:
+            stt_result = await asyncio.to_thread(transcribe_audio, audio_path, checkpoints, queue_depth)
+            stt_span.set_attribute("stt.model", stt_result["profile"]["model"])
         await publish_status(r, note_id, "stt_done", 50)
 
-        # Step 2: DB에 트랜스크립트 저장
-        async with async_session() as db:
-            await db.execute(
-                text("""
-                    INSERT INTO transcripts (id, note_id, segments, full_text, search_vector, created_at, updated_at)
-                    VALUES (gen_random_uuid(), CAST(:note_id AS uuid), :segments, :full_text,
-                            to_tsvector('simple', :full_text), now(), now())
-                """),
-                {
-                    "note_id": note_id,
-                    "segments": json.dumps(stt_result["segments"]),
-                    "full_text": stt_result["full_text"],
-                },
-            )
+        # Step 2: DB에 트랜스크립트 저장 (search_vector는 DB 트리거가 가중치 포함해 계산)
+        # API가 그대로 전송할 응답 페이로드도 함께 저장
+        # 재처리 시에는 기존 행의 id를 유지한 채 덮어씀 (페이로드에 id가 포함되므로 먼저 조회)
+        with stage("db_write"):
+            async with async_session() as db:
+                transcript_id = await db.scalar(
+                    text("SELECT id FROM transcripts WHERE note_id = CAST(:note_id AS uuid)"),
+                    {"note_id": note_id},
+                )
+                transcript_id = str(transcript_id or uuid.uuid4())
+                payload, etag = transcript_payload(transcript_id, note_id, stt_result)
+                await db.execute(
+                    text("""
+                        INSERT INTO transcripts
+                            (id, note_id, segments, full_text, payload, etag, word_timings, word_timings_etag,
+                             created_at, updated_at)
+                        VALUES (CAST(:id AS uuid), CAST(:note_id AS uuid), :segments, :full_text, :payload, :etag,
+                                :word_timings, :word_timings_etag, now(), now())
+                        ON CONFLICT (note_id) DO UPDATE SET
+                            segments = EXCLUDED.segments, full_text = EXCLUDED.full_text,
+                            payload = EXCLUDED.payload, etag = EXCLUDED.etag,
+                            word_timings = EXCLUDED.word_timings, word_timings_etag = EXCLUDED.word_timings_etag,
+                            updated_at = now()
+                    """),
+                    {
+                        "id": transcript_id,
+                        "note_id": note_id,
+                        "segments": json.dumps(stt_result["segments"]),
+                        "full_text": stt_result["full_text"],
+                        "payload": payload,
+                        "etag": etag,
+                        "word_timings": stt_result["word_timings"],
+                        "word_timings_etag": word_timings_etag(stt_result["word_timings"]),
+                    },
+                )
 
-            # 노트 언어 업데이트 + 상태 변경
-            await db.execute(
-                text("""
-                    UPDATE notes SET language = :language, status = 'analyzing'
-                    WHERE id = CAST(:note_id AS uuid)
-                """),
-                {"language": stt_result["language"], "note_id": note_id},
-            )
-            await db.commit()
+                # 노트 언어/길이/STT 설정 기록 + 상태 변경 (캐시 소유자 확인용 user_id 함께 조회)
+                result = await db.execute(
+                    text("""
+                        UPDATE notes SET language = :language, duration_seconds = :duration_seconds,
+                            processing_profile = CAST(:profile AS jsonb), status = 'analyzing'
+                        WHERE id = CAST(:note_id AS uuid)
+                        RETURNING (SELECT p.user_id FROM projects p WHERE p.id = notes.project_id)
+                    """),
+                    {
+                        "language": stt_result["language"],
+                        "duration_seconds": stt_result["duration_seconds"],
+                        "profile": json.dumps(stt_result["profile"]),
+                        "note_id": note_id,
+                    },
+                )
+                owner_id = str(result.scalar_one())
+                await db.commit()
+        await store_note_cache(note_id, owner_id, {"transcript:etag": etag, "transcript:payload": payload})
+
+        # Step 2-1: 세그먼트 임베딩 (시맨틱 검색용, 실패해도 분석은 계속)
+        await store_segment_embeddings(note_id, stt_result["segments"])
 
         # Step 3: AI 분석 (요약/키워드)
         await publish_status(r, note_id, "analyzing", 70)
-        analysis = await analyze_transcript(stt_result["full_text"], stt_result["language"])
+        analysis = checkpoints.load("analysis")
+        if analysis is None:
+            try:
+                with stage("analysis"):
+                    analysis = await analyze_transcript(stt_result["full_text"], stt_result["language"])
+                checkpoints.save("analysis", analysis)
+            except AnalysisError as e:
+                # 재시도는 체크포인트 덕분에 분석 단계만 다시 실행. 마지막 시도에서는 트랜스크립트라도
+                # 쓸 수 있도록 빈 분석으로 완료 (체크포인트하지 않으므로 다시 분석으로 채울 수 있음)
+                if attempt < settings.job_max_attempts:
+                    raise
+                logger.error(f"분석 실패, 빈 분석으로 완료: note_id={note_id}, error={e}")
+                analysis = empty_result()
         await publish_status(r, note_id, "analyzing_done", 90)
 
         # Step 4: DB에 분석 결과 저장
-        async with async_session() as db:
-            await db.execute(
-                text("""
-                    INSERT INTO analyses (id, note_id, summary, topics, keywords, action_items, created_at, updated_at)
-                    VALUES (gen_random_uuid(), CAST(:note_id AS uuid), :summary, :topics, :keywords, :action_items, now(), now())
-                """),
-                {
-                    "note_id": note_id,
-                    "summary": analysis["summary"],
-                    "topics": json.dumps(analysis["topics"]),
-                    "keywords": json.dumps(analysis["keywords"]),
-                    "action_items": json.dumps(analysis["action_items"]),
-                },
-            )
+        with stage("db_write"):
+            async with async_session() as db:
+                payload, etag = await store_analysis(db, note_id, analysis)
 
-            await db.execute(
-                text("UPDATE notes SET status = 'completed' WHERE id = CAST(:note_id AS uuid)"),
-                {"note_id": note_id},
-            )
-            await db.commit()
+                await db.execute(
+                    text("UPDATE notes SET status = 'completed' WHERE id = CAST(:note_id AS uuid)"),
+                    {"note_id": note_id},
+                )
+                await enqueue_webhook(db, note_id, "note.completed")
+                await db.commit()
+        webhook_dispatcher.wake()
+        await store_note_cache(note_id, owner_id, {
+            "analysis:etag": etag,
+            "analysis:payload": payload,
+            "context": chat_context(stt_result["full_text"], analysis),
+        })
 
+        checkpoints.clear()
         await publish_status(r, note_id, "completed", 100)
         logger.info(f"작업 완료: note_id={note_id}")
+        JOBS.labels("completed").inc()
+        JOB_DURATION.labels("completed").observe(time.perf_counter() - job_start)
 
     except Exception as e:
+        span.record_exception(e)
+        span.set_status(Status(StatusCode.ERROR, str(e)))
+        if attempt < settings.job_max_attempts:
+            # 체크포인트는 남겨 두고 다시 대기열로: 다음 시도는 마지막 완료 단계 다음부터 진행
+            logger.warning(f"작업 실패, 재시도 예정: note_id={note_id}, attempt={attempt}, error={e}")
+            async with async_session() as db:
+                await db.execute(update_note_status(note_id, "queued"))
+                await db.commit()
+            await publish_status(r, note_id, "queued", 0)
+            JOBS.labels("retried").inc()
+            JOB_DURATION.labels("retried").observe(time.perf_counter() - job_start)
+            return {**job_data, "attempt": attempt + 1, "enqueued_at": time.time()}
+
         logger.error(f"작업 실패: note_id={note_id}, error={e}")
+        await fail_note(r, note_id)
+        JOBS.labels("failed").inc()
+        JOB_DURATION.labels("failed").observe(time.perf_counter() - job_start)
+
+
+async def reanalyze_job(r: redis.Redis, job_data: dict) -> dict | None:
+    """저장된 트랜스크립트로 분석 단계만 다시 실행 (STT 생략)
+
+    노트 상태는 바꾸지 않으며, 실패해도 기존 분석 결과가 그대로 유지됩니다.
+    재시도 횟수가 남았으면 다시 넣을 작업을 반환합니다.
+    """
+    note_id = job_data["note_id"]
+    attempt = job_data.get("attempt", 1)
+    span = trace.get_current_span()
+    span.set_attribute("job.attempt", attempt)
+
+    try:
         async with async_session() as db:
-            await db.execute(
-                text("UPDATE notes SET status = 'failed' WHERE id = CAST(:note_id AS uuid)"),
+            result = await db.execute(
+                text("""
+                    SELECT t.full_text, n.language, p.user_id
+                    FROM transcripts t
+                    JOIN notes n ON n.id = t.note_id
+                    JOIN projects p ON p.id = n.project_id
+                    WHERE t.note_id = CAST(:note_id AS uuid)
+                """),
                 {"note_id": note_id},
             )
-            await db.commit()
-        await publish_status(r, note_id, "failed", 0)
+            row = result.one_or_none()
+        if row is None:
+            # 등록 후 노트가 삭제된 경우
+            logger.info(f"다시 분석 생략 (트랜스크립트 없음): note_id={note_id}")
+            REANALYSES.labels("skipped").inc()
+            return None
+
+        with stage("analysis"):
+            analysis = await analyze_transcript(row.full_text, row.language or "ko")
+
+        with stage("db_write"):
+            async with async_session() as db:
+                payload, etag = await store_analysis(db, note_id, analysis)
+                await enqueue_webhook(db, note_id, "note.reanalyzed")
+                await db.commit()
+        webhook_dispatcher.wake()
+        await store_note_cache(note_id, str(row.user_id), {
+            "analysis:etag": etag,
+            "analysis:payload": payload,
+            "context": chat_context(row.full_text, analysis),
+        })
+        logger.info(f"다시 분석 완료: note_id={note_id}")
+        REANALYSES.labels("completed").inc()
+
+    except Exception as e:
+        span.record_exception(e)
+        span.set_status(Status(StatusCode.ERROR, str(e)))
+        if attempt < settings.job_max_attempts:
+            logger.warning(f"다시 분석 실패, 재시도 예정: note_id={note_id}, attempt={attempt}, error={e}")
+            REANALYSES.labels("retried").inc()
+            return {**job_data, "attempt": attempt + 1, "enqueued_at": time.time()}
+        logger.error(f"다시 분석 실패: note_id={note_id}, error={e}")
+        REANALYSES.labels("failed").inc()
+    return None
+
+
+async def dead_letter_job(r: redis.Redis, job_data: dict):
+    """처리 중 워커가 죽는 일이 반복돼 dead letter로 옮겨진 작업의 노트를 실패 처리"""
+    if job_data.get("type") == "reanalyze":
+        # 다시 분석은 노트 상태를 바꾸지 않으므로 기존 결과를 그대로 둠
+        REANALYSES.labels("failed").inc()
+        return
+    await fail_note(r, job_data["note_id"])
+    JOBS.labels("failed").inc()
+
+
+async def sample_queue(r: redis.Redis):
+    """대기열 길이와 가장 오래된 작업의 대기 시간을 주기적으로 기록
+
+    API는 RPUSH로 넣고 워커는 맨 앞에서 꺼내므로 리스트 맨 앞이 가장 오래된 작업입니다.
+    """
+    while True:
+        try:
+            depth = await r.llen(QUEUE_NAME)
+            QUEUE_DEPTH.set(depth)
+            oldest = await r.lindex(QUEUE_NAME, 0) if depth else None
+            enqueued_at = json.loads(oldest).get("enqueued_at") if oldest else None
+            QUEUE_OLDEST_AGE.set(max(time.time() - enqueued_at, 0) if enqueued_at else 0)
+        except (redis.RedisError, json.JSONDecodeError) as e:
+            logger.warning(f"대기열 메트릭 수집 실패: {e}")
+        await asyncio.sleep(settings.metrics_queue_sample_seconds)
 
 
 async def main():
     """AI 워커 메인 루프: Redis 큐에서 작업을 꺼내 처리"""
     logger.info("AI 워커 시작...")
+    # app.supervisor 아래에서는 감독자가 모든 프로세스의 메트릭을 모아 노출
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        start_http_server(settings.metrics_port)
+    setup_tracing()
     r = redis.from_url(settings.redis_url, decode_responses=True)
+    # 웹훅 전송은 작업 처리와 병행 (참조를 유지해 태스크가 GC되지 않게 함)
+    dispatcher_task = asyncio.create_task(webhook_dispatcher.run())
+    sampler_task = asyncio.create_task(sample_queue(r))
+    # 처리 중 작업은 워커별 목록에 보관하고, 하트비트가 끊긴 워커의 작업은 회수
+    queue = JobQueue(r, settings.worker_id or None, on_dead_letter=lambda job: dead_letter_job(r, job))
+    await queue.recover()
+    await queue.heartbeat()
+    heartbeat_task = asyncio.create_task(queue.run_heartbeat())
 
-    while True:
-        # 블로킹 팝 (5초 타임아웃)
-        result = await r.blpop(QUEUE_NAME, timeout=5)
-        if result:
-            _, job_json = result
-            job_data = json.loads(job_json)
-            await process_job(r, job_data)
+    try:
+        while True:
+            # 블로킹 팝 (5초 타임아웃)
+            job_json = await queue.pop(timeout=5)
+            if job_json:
+                job_data = json.loads(job_json)
+                reanalyze = job_data.get("type") == "reanalyze"
+                # enqueued_at이 없는 작업은 이전 버전 API가 넣은 것
+                # (저우선순위 작업의 대기는 의도된 것이므로 대기 시간 메트릭에서 제외)
+                if "enqueued_at" in job_data and not reanalyze:
+                    QUEUE_WAIT.observe(max(time.time() - job_data["enqueued_at"], 0))
+                # 업로드 요청의 트레이스를 이어서 큐 대기와 처리 과정을 기록
+                context = job_context(job_data)
+                record_queue_wait(job_data, context)
+                with tracer.start_as_current_span(
+                    "worker.reanalyze" if reanalyze else "worker.process_job",
+                    context=context,
+                    attributes={"note.id": job_data["note_id"]},
+                ):
+                    handler = reanalyze_job if reanalyze else process_job
+                    retry_job = await handler(r, job_data)
+                if retry_job:
+                    await queue.retry(job_json, retry_job)
+                else:
+                    await queue.ack(job_json)
+    finally:
+        # 종료 시 버퍼에 남은 스팬 전송
+        shutdown_tracing()
 
 
 if __name__ == "__main__":
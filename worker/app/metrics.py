@@ -0,0 +1,110 @@
+# worker/app/metrics.py
+"""워커 Prometheus 메트릭.
+
+메트릭 이름과 라벨은 알림 규칙에서 참조하므로 변경하지 않습니다.
+start_http_server(settings.metrics_port)로 /metrics를 노출합니다.
+
+stage 라벨 값: model_load, decode, vad, probe, asr, alignment, diarization, embedding, analysis, db_write
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+STAGE_DURATION = Histogram(
+    "voice_worker_stage_duration_seconds",
+    "파이프라인 단계별 소요 시간",
+    ["stage"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+MODEL_LOAD_DURATION = Histogram(
+    "voice_worker_model_load_seconds",
+    "모델 로드 시간 (model: whisper, align, diarize)",
+    ["model"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+MODEL_CACHE = Counter(
+    "voice_worker_model_cache_total",
+    "모델 요청 시 이미 로드된 모델 재사용 여부 (result: hit, miss)",
+    ["model", "result"],
+)
+MODEL_SELECTIONS = Counter(
+    "voice_worker_model_selections_total",
+    "작업별로 선택된 STT 모델 (app.pipelines.policy)",
+    ["model", "compute_type"],
+)
+REALTIME_FACTOR = Histogram(
+    "voice_worker_realtime_factor",
+    "STT 처리 시간 / 오디오 길이 (1 미만이면 실시간보다 빠름)",
+    ["model", "device"],
+    buckets=(0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 5),
+)
+SPEECH_RATIO = Histogram(
+    "voice_worker_speech_ratio",
+    "무음/대기 구간을 잘라낸 뒤 남은 음성 길이 / 오디오 길이 (app.pipelines.vad)",
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1),
+)
+AUDIO_SECONDS = Counter(
+    "voice_worker_audio_seconds_total",
+    "STT로 처리한 오디오 길이 합계",
+    ["model", "device"],
+)
+JOBS = Counter(
+    "voice_worker_jobs_total",
+    "처리 완료된 작업 수 (status: completed, retried, failed)",
+    ["status"],
+)
+REANALYSES = Counter(
+    "voice_worker_reanalyses_total",
+    "다시 분석 작업 결과 (status: completed, retried, failed, skipped)",
+    ["status"],
+)
+JOB_DURATION = Histogram(
+    "voice_worker_job_duration_seconds",
+    "작업 하나의 전체 처리 시간",
+    ["status"],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200),
+)
+QUEUE_DEPTH = Gauge(
+    "voice_worker_queue_depth",
+    "voice:jobs 대기열 길이",
+    # app.supervisor 다중 프로세스 모드에서는 모든 프로세스가 같은 대기열을 측정하므로 최대값 하나만 노출
+    multiprocess_mode="livemax",
+)
+QUEUE_OLDEST_AGE = Gauge(
+    "voice_worker_queue_oldest_age_seconds",
+    "voice:jobs 대기열에서 가장 오래 기다린 작업의 대기 시간",
+    multiprocess_mode="livemax",
+)
+QUEUE_WAIT = Histogram(
+    "voice_worker_queue_wait_seconds",
+    "작업 등록부터 워커가 꺼낼 때까지의 대기 시간",
+    buckets=(0.1, 1, 5, 10, 30, 60, 300, 600, 1800, 3600, 7200),
+)
+OLLAMA_TOKENS_PER_SECOND = Histogram(
+    "voice_worker_ollama_tokens_per_second",
+    "Ollama 응답 생성 속도 (eval_count / eval_duration)",
+    ["model"],
+    buckets=(1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 200),
+)
+OLLAMA_TOKENS = Counter(
+    "voice_worker_ollama_tokens_total",
+    "Ollama 토큰 수 (kind: prompt, completion)",
+    ["model", "kind"],
+)
+WEBHOOK_DELIVERIES = Counter(
+    "voice_worker_webhook_deliveries_total",
+    "웹훅 전송 시도 결과 (result: delivered, retry, failed)",
+    ["result"],
+)
+
+
+def observe_ollama(model: str, body: dict) -> None:
+    """Ollama 비스트리밍 응답의 토큰 수/생성 시간(ns)을 기록합니다."""
+    prompt_count = body.get("prompt_eval_count")
+    eval_count = body.get("eval_count")
+    eval_duration = body.get("eval_duration")
+    if prompt_count:
+        OLLAMA_TOKENS.labels(model, "prompt").inc(prompt_count)
+    if eval_count:
+        OLLAMA_TOKENS.labels(model, "completion").inc(eval_count)
+        if eval_duration:
+            OLLAMA_TOKENS_PER_SECOND.labels(model).observe(eval_count / (eval_duration / 1e9))
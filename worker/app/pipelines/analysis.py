@@ -5,12 +5,20 @@ import logging
 import httpx
 
 from app.config import settings
+from app.metrics import observe_ollama
 
 logger = logging.getLogger(__name__)
 
 
+class AnalysisError(Exception):
+    """Ollama 호출 또는 응답 해석 실패 (호출 측에서 재시도)"""
+
+
 async def analyze_transcript(full_text: str, language: str = "ko") -> dict:
-    """Ollama LLM으로 텍스트 요약, 키워드 추출, 액션 아이템 추출"""
+    """Ollama LLM으로 텍스트 요약, 키워드 추출, 액션 아이템 추출
+
+    실패를 빈 결과로 바꾸면 기존 분석을 덮어쓸 수 있으므로 AnalysisError를 발생시킵니다.
+    """
     prompt = f"""당신은 한국어 텍스트 분석 전문가입니다. 반드시 한국어로만 응답하세요.
 
 다음 음성 녹음 텍스트를 분석해주세요.
@@ -40,15 +48,15 @@ async def analyze_transcript(full_text: str, language: str = "ko") -> dict:
                 },
             )
     except httpx.HTTPError as e:
-        logger.error(f"Ollama 연결 오류: {e}")
-        return _empty_result()
+        raise AnalysisError(f"Ollama 연결 오류: {e}") from e
 
     if resp.status_code != 200:
-        logger.error(f"Ollama 응답 오류: {resp.status_code}")
-        return _empty_result()
+        raise AnalysisError(f"Ollama 응답 오류: {resp.status_code}")
 
     try:
-        response_text = resp.json()["response"]
+        body = resp.json()
+        observe_ollama(settings.ollama_model, body)
+        response_text = body["response"]
         result = json.loads(response_text)
         return {
             "summary": result.get("summary"),
@@ -57,9 +65,9 @@ async def analyze_transcript(full_text: str, language: str = "ko") -> dict:
             "action_items": result.get("action_items", []),
         }
     except (json.JSONDecodeError, KeyError) as e:
-        logger.error(f"Ollama 응답 파싱 오류: {e}")
-        return _empty_result()
+        raise AnalysisError(f"Ollama 응답 파싱 오류: {e}") from e
 
 
-def _empty_result() -> dict:
+def empty_result() -> dict:
+    """분석 없이 완료할 때 저장하는 빈 결과"""
     return {"summary": None, "topics": [], "keywords": [], "action_items": []}
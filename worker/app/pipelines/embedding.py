@@ -0,0 +1,41 @@
+# worker/app/pipelines/embedding.py
+import logging
+
+import httpx
+
+from app.config import settings
+from app.metrics import OLLAMA_TOKENS
+
+logger = logging.getLogger(__name__)
+
+
+async def embed_texts(texts: list[str]) -> list[list[float]] | None:
+    """Ollama 임베딩 모델로 세그먼트 텍스트를 배치 임베딩합니다.
+
+    시맨틱 검색은 부가 기능이므로 실패 시 None을 반환하고 파이프라인은 계속 진행합니다.
+    """
+    embeddings = []
+    try:
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            for i in range(0, len(texts), settings.embedding_batch_size):
+                batch = texts[i : i + settings.embedding_batch_size]
+                resp = await client.post(
+                    f"{settings.ollama_url}/api/embed",
+                    json={"model": settings.embedding_model, "input": batch},
+                )
+                if resp.status_code != 200:
+                    logger.error(f"Ollama 임베딩 응답 오류: {resp.status_code}")
+                    return None
+                body = resp.json()
+                embeddings.extend(body["embeddings"])
+                if body.get("prompt_eval_count"):
+                    OLLAMA_TOKENS.labels(settings.embedding_model, "prompt").inc(body["prompt_eval_count"])
+    except (httpx.HTTPError, KeyError) as e:
+        logger.error(f"Ollama 임베딩 오류: {e}")
+        return None
+    return embeddings
+
+
+def to_pgvector(embedding: list[float]) -> str:
+    """pgvector 텍스트 입력 형식으로 변환"""
+    return "[" + ",".join(f"{x:.6g}" for x in embedding) + "]"
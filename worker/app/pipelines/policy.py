@@ -0,0 +1,163 @@
+# worker/app/pipelines/policy.py
+"""작업별 STT 설정(모델 크기/배치/연산 타입) 선택 정책.
+
+입력:
+- 디코딩된 오디오 길이
+- 앞부분(policy_probe_seconds) 사전 검사: 작은 모델의 언어 감지 + 에너지 기반 SNR 추정
+- 대기열 적체 (voice:jobs 길이)
+- 사용 가능한 메모리 (GPU는 여유 VRAM, CPU는 여유 RAM)
+
+잡음이 많은 녹음은 한 단계 큰 모델로 올리고, 대기열이 쌓이면 한두 단계 작은 모델로 내려
+정확도를 조금 양보하고 처리량을 얻습니다. 영어가 아닌 녹음은 작은 모델의 정확도 하락이 크므로
+policy_min_model 아래로 내리지 않습니다. 메모리가 부족할 때도 마찬가지로, 하한 모델조차 들어가지 않으면
+InsufficientMemoryError로 작업을 실패시켜 재시도 대기열로 돌려보냅니다 (다음 시도는 체크포인트에서 이어서 진행).
+고른 설정과 근거는 notes.processing_profile에 기록됩니다.
+"""
+
+import os
+
+from app.config import settings
+
+SAMPLE_RATE = 16000
+
+# 작은 것부터 큰 순서
+MODEL_LADDER = ("tiny", "base", "small", "medium", "large-v3")
+
+# faster-whisper float16 기준 대략적인 모델 메모리 (GB). int8 계열은 약 절반
+MODEL_MEMORY_GB = {"tiny": 0.5, "base": 0.7, "small": 1.2, "medium": 2.5, "large-v3": 4.5}
+
+# 배치 항목(30초 창) 하나당 추가 메모리 (GB)
+BATCH_MEMORY_GB = 0.25
+
+MEMINFO_PATH = "/proc/meminfo"
+
+# 작은 모델에서도 정확도 하락이 적은 언어
+SMALL_MODEL_LANGUAGES = {"en"}
+
+
+class InsufficientMemoryError(Exception):
+    """정책이 허용하는 가장 작은 모델도 여유 메모리에 들어가지 않음"""
+
+
+def estimate_snr_db(audio, frame_seconds: float = 0.03) -> float:
+    """프레임 RMS의 상위/하위 분위수 비로 SNR(dB)을 추정
+
+    말소리 구간(90%)과 바닥 잡음(10%)의 비라서 잡음이 많거나 음악이 깔린 녹음일수록 낮아집니다.
+    """
+    import numpy as np
+
+    frame = int(SAMPLE_RATE * frame_seconds)
+    usable = len(audio) // frame * frame
+    if usable == 0:
+        return 0.0
+    frames = np.asarray(audio[:usable], dtype=np.float32).reshape(-1, frame)
+    rms = np.sqrt(np.mean(frames * frames, axis=1)) + 1e-6
+    noise, speech = np.percentile(rms, [10, 90])
+    return round(float(20 * np.log10(speech / noise)), 1)
+
+
+def free_system_memory_gb() -> float:
+    """CPU 실행 시 사용 가능한 RAM (GB)
+
+    /proc/meminfo의 MemAvailable(회수 가능한 페이지 캐시 포함)을 씁니다. SC_AVPHYS_PAGES는
+    MemFree라서 캐시가 쌓인 서버에서는 실제보다 훨씬 작게 나옵니다.
+    MemAvailable을 읽을 수 없는 환경(리눅스 3.14 이전, 비리눅스)에서만 sysconf 값을 씁니다.
+    """
+    try:
+        with open(MEMINFO_PATH) as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024**2
+    except (OSError, ValueError, IndexError):
+        pass
+    return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024**3
+
+
+def _memory_gb(model: str, compute_type: str) -> float:
+    base = MODEL_MEMORY_GB.get(model, MODEL_MEMORY_GB["large-v3"])
+    return base / 2 if compute_type.startswith("int8") else base
+
+
+def fixed_profile(device: str) -> dict:
+    """정책 비활성(model_policy=fixed) 시: 설정값 그대로"""
+    return {
+        "policy": "fixed",
+        "model": settings.whisper_model,
+        "compute_type": settings.whisper_compute_type if device == "cuda" else "int8",
+        "batch_size": settings.whisper_batch_size,
+        "device": device,
+        "language": None,
+        "reasons": [],
+    }
+
+
+def choose_profile(
+    device: str,
+    duration_seconds: float,
+    language: str | None,
+    snr_db: float,
+    queue_depth: int,
+    free_memory_gb: float,
+) -> dict:
+    """입력값으로 모델/배치/연산 타입을 고르고, 근거(reasons)와 입력값을 함께 반환"""
+    profile = fixed_profile(device)
+    if settings.whisper_model not in MODEL_LADDER:
+        # 사다리에 없는 모델(예: distil 계열)은 크기를 조정하지 않음
+        return {**profile, "policy": "adaptive", "language": language}
+
+    reasons = []
+    index = MODEL_LADDER.index(settings.whisper_model)
+    pressure = queue_depth // max(settings.policy_queue_high, 1)
+
+    if pressure:
+        step = min(pressure, 2)
+        # 긴 녹음은 작은 모델로 얻는 처리량이 가장 크므로 한 단계 더
+        if duration_seconds >= settings.policy_long_seconds:
+            step += 1
+        index -= step
+        reasons.append(f"queue:{queue_depth}")
+    elif snr_db < settings.policy_noisy_snr_db:
+        index += 1
+        reasons.append(f"noisy:{snr_db}dB")
+
+    floor = MODEL_LADDER.index(settings.policy_min_model)
+    if language in SMALL_MODEL_LANGUAGES:
+        floor = min(floor, MODEL_LADDER.index("base"))
+    ceiling = MODEL_LADDER.index(settings.policy_max_model)
+    index = max(floor, min(index, ceiling))
+
+    # 메모리: GPU는 int8_float16으로 먼저 줄이고, 그래도 안 되면 모델을 내림
+    compute_type = profile["compute_type"]
+    if _memory_gb(MODEL_LADDER[index], compute_type) > free_memory_gb and device == "cuda":
+        compute_type = "int8_float16"
+        reasons.append("memory:int8")
+    while index > floor and _memory_gb(MODEL_LADDER[index], compute_type) > free_memory_gb:
+        index -= 1
+        if "memory:model" not in reasons:
+            reasons.append("memory:model")
+    model = MODEL_LADDER[index]
+    if _memory_gb(model, compute_type) > free_memory_gb:
+        raise InsufficientMemoryError(
+            f"여유 메모리 {free_memory_gb:.1f}GB로는 {model} 모델({compute_type})을 실행할 수 없습니다"
+        )
+
+    # 배치: 모델을 올리고 남는 메모리 안에서, 적체 시에는 설정값의 두 배까지
+    batch_limit = settings.whisper_batch_size * (2 if pressure else 1)
+    headroom = free_memory_gb - _memory_gb(model, compute_type)
+    batch_size = max(1, min(batch_limit, int(headroom / BATCH_MEMORY_GB)))
+
+    return {
+        "policy": "adaptive",
+        "model": model,
+        "compute_type": compute_type,
+        "batch_size": batch_size,
+        "device": device,
+        "language": language,
+        "reasons": reasons,
+        "inputs": {
+            "duration_seconds": round(duration_seconds, 1),
+            "snr_db": snr_db,
+            "queue_depth": queue_depth,
+            "free_memory_gb": round(free_memory_gb, 1),
+        },
+    }
@@ -1,14 +1,32 @@
 # worker/app/pipelines/stt.py
 import gc
 import logging
+import time
 
 import torch
 import whisperx
 
 from app.config import settings
+from app.metrics import (
+    AUDIO_SECONDS,
+    MODEL_CACHE,
+    MODEL_LOAD_DURATION,
+    MODEL_SELECTIONS,
+    REALTIME_FACTOR,
+    SPEECH_RATIO,
+)
+from app.pipelines.policy import SAMPLE_RATE, choose_profile, estimate_snr_db, fixed_profile, free_system_memory_gb
+from app.pipelines.vad import trim_silence
+from app.services.checkpoints import Checkpoints
+from app.services.word_timings import pack_word_timings
+from app.tracing import stage
 
 logger = logging.getLogger(__name__)
 
+# 작업 사이에 해제하지 않고 유지하는 모델: 사전 검사용 작은 모델,
+# keep_models_resident일 때(CPU 다중 프로세스 모드)는 인식/정렬/화자 분리 모델도. 이름별로 하나만 유지
+_resident_models: dict[str, tuple[tuple, object]] = {}
+
 
 def _clear_gpu():
     """GPU 메모리 강제 해제"""
@@ -17,14 +35,98 @@ def _clear_gpu():
         torch.cuda.empty_cache()
 
 
-def transcribe_audio(audio_path: str) -> dict:
+def _to_builtin(value):
+    """체크포인트(JSON) 저장을 위해 numpy 스칼라/배열을 파이썬 기본 타입으로 변환"""
+    if isinstance(value, dict):
+        return {k: _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return value
+
+
+def _load_timed(name: str, loader, *args, **kwargs):
+    """모델 로드 시간을 기록합니다. 작업마다 새로 로드하는 모델은 항상 miss입니다."""
+    MODEL_CACHE.labels(name, "miss").inc()
+    start = time.perf_counter()
+    with stage("model_load", model=name):
+        loaded = loader(*args, **kwargs)
+    MODEL_LOAD_DURATION.labels(name).observe(time.perf_counter() - start)
+    return loaded
+
+
+def _resident_model(name: str, loader, *args, **kwargs):
+    """한 번 로드한 뒤 계속 유지하는 모델 (같은 인자면 재사용, 캐시 hit 기록)
+
+    인자가 바뀌면(다른 모델 크기/언어) 이전 모델을 먼저 해제해 이름별로 하나만 메모리에 둡니다.
+    """
+    key = (args, tuple(sorted(kwargs.items())))
+    cached = _resident_models.get(name)
+    if cached and cached[0] == key:
+        MODEL_CACHE.labels(name, "hit").inc()
+        return cached[1]
+    if cached:
+        del _resident_models[name], cached
+        _clear_gpu()
+    model = _load_timed(name, loader, *args, **kwargs)
+    _resident_models[name] = (key, model)
+    return model
+
+
+def _job_model(name: str, loader, *args, **kwargs):
+    """작업에서 쓰는 모델: keep_models_resident면 유지, 아니면 매번 로드 (호출자가 단계 후 해제)"""
+    if settings.keep_models_resident:
+        return _resident_model(name, loader, *args, **kwargs)
+    return _load_timed(name, loader, *args, **kwargs)
+
+
+def _select_profile(audio, speech_audio, device: str, queue_depth: int) -> dict:
+    """앞부분 사전 검사(언어 감지 + SNR) 후 정책으로 이번 작업의 STT 설정을 고름
+
+    SNR은 무음이 포함된 원본으로, 언어 감지와 길이는 실제로 인식할 음성 구간(speech_audio)으로 판단합니다.
+    """
+    if settings.model_policy != "adaptive":
+        return fixed_profile(device)
+
+    with stage("probe"):
+        snr_db = estimate_snr_db(audio[: int(settings.policy_probe_seconds * SAMPLE_RATE)])
+        window = speech_audio[: int(settings.policy_probe_seconds * SAMPLE_RATE)]
+        probe_model = _resident_model(
+            "probe",
+            whisperx.load_model,
+            settings.policy_probe_model,
+            device,
+            compute_type=settings.whisper_compute_type if device == "cuda" else "int8",
+            threads=settings.cpu_threads,
+        )
+        language = probe_model.detect_language(window)
+
+    if settings.memory_budget_gb:
+        # 다중 프로세스 모드: 유지 중인 모델이 차지한 메모리와 관계없이 프로세스별 할당량 기준
+        free_memory_gb = settings.memory_budget_gb
+    elif device == "cuda":
+        free_memory_gb = torch.cuda.mem_get_info()[0] / 1024**3
+    else:
+        free_memory_gb = free_system_memory_gb()
+    return choose_profile(device, len(speech_audio) / SAMPLE_RATE, language, snr_db, queue_depth, free_memory_gb)
+
+
+def transcribe_audio(audio_path: str, checkpoints: Checkpoints | None = None, queue_depth: int = 0) -> dict:
     """WhisperX로 음성을 텍스트로 변환 + 화자 분리
 
     GPU 메모리 관리를 위해 각 단계 후 모델을 해제합니다.
     RTX 3060 6GB VRAM 기준으로 최적화되어 있습니다.
+    keep_models_resident면(app.supervisor의 CPU 다중 프로세스 모드) 모델을 프로세스에 유지합니다.
+    단계별 소요 시간과 실시간 배율(RTF)을 app.metrics에 기록합니다.
+    checkpoints가 주어지면 디코딩/인식/정렬/화자 분리 결과를 단계마다 저장하고,
+    이미 저장된 단계는 모델을 로드하지 않고 건너뜁니다.
+    인식 모델/배치/연산 타입은 app.pipelines.policy가 작업마다 고르며(queue_depth는 대기열 길이),
+    재개 시에는 처음 고른 설정을 체크포인트에서 그대로 사용합니다.
+    긴 무음/대기 구간은 app.pipelines.vad로 잘라내고 인식/화자 분리만 잘라낸 오디오로 하며,
+    결과 시간은 곧바로 원본 기준으로 되돌리므로 체크포인트와 반환값은 모두 원본 시간입니다.
     """
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    compute_type = settings.whisper_compute_type if device == "cuda" else "int8"
 
     logger.info(f"STT 시작: {audio_path} (device={device})")
 
@@ -34,50 +136,128 @@ def transcribe_audio(audio_path: str) -> dict:
     model = None
     model_a = None
     diarize_model = None
+    resumed = False
+
+    def load(stage_name: str):
+        nonlocal resumed
+        data = checkpoints.load(stage_name) if checkpoints else None
+        if data is not None:
+            logger.info(f"체크포인트에서 재개: {stage_name}")
+            resumed = True
+        return data
+
+    def save(stage_name: str, data: dict) -> None:
+        if checkpoints:
+            checkpoints.save(stage_name, data)
 
     try:
-        # Step 1: 음성 인식 (Whisper)
-        model = whisperx.load_model(
-            settings.whisper_model,
-            device,
-            compute_type=compute_type,
+        # Step 0: 오디오 디코딩 (whisperx.load_audio는 16kHz 모노로 디코딩)
+        audio = checkpoints.load_audio() if checkpoints else None
+        if audio is None:
+            with stage("decode"):
+                audio = whisperx.load_audio(audio_path)
+            if checkpoints:
+                checkpoints.save_audio(audio)
+        audio_seconds = len(audio) / SAMPLE_RATE
+
+        # Step 0-1: 무음/비음성 구간 제거 (결정적이므로 재개 시에도 다시 계산)
+        with stage("vad"):
+            speech_audio, offset_map = trim_silence(audio)
+        speech_seconds = len(speech_audio) / SAMPLE_RATE
+
+        # Step 0-2: 작업별 STT 설정 선택 (설정만 복원하는 것이므로 재개 여부에 포함하지 않음)
+        profile = checkpoints.load("profile") if checkpoints else None
+        if profile is None:
+            profile = _select_profile(audio, speech_audio, device, queue_depth)
+            profile["speech_seconds"] = round(speech_seconds, 1)
+            save("profile", profile)
+            MODEL_SELECTIONS.labels(profile["model"], profile["compute_type"]).inc()
+            if audio_seconds > 0:
+                SPEECH_RATIO.observe(speech_seconds / audio_seconds)
+        if offset_map:
+            logger.info(f"무음 제거: {audio_seconds:.1f}초 → {speech_seconds:.1f}초 ({len(offset_map.durations)}개 구간)")
+        logger.info(
+            f"STT 설정: model={profile['model']}, compute_type={profile['compute_type']}, "
+            f"batch_size={profile['batch_size']}, language={profile['language']}, reasons={profile['reasons']}"
         )
-        audio = whisperx.load_audio(audio_path)
-        result = model.transcribe(audio, batch_size=settings.whisper_batch_size)
+        stt_start = time.perf_counter()
+
+        # Step 1: 음성 인식 (Whisper)
+        result = load("asr")
+        if result is None:
+            model = _job_model(
+                "whisper",
+                whisperx.load_model,
+                profile["model"],
+                device,
+                compute_type=profile["compute_type"],
+                language=profile["language"],
+                threads=settings.cpu_threads,
+            )
+            with stage("asr"):
+                result = _to_builtin(model.transcribe(speech_audio, batch_size=profile["batch_size"]))
+            if offset_map:
+                result["segments"] = offset_map.remap_segments(result["segments"])
+            save("asr", result)
+
+            del model
+            model = None
+            _clear_gpu()
         detected_language = result["language"]
         logger.info(f"언어 감지: {detected_language}")
 
-        del model
-        model = None
-        _clear_gpu()
-
-        # Step 2: 단어 정렬 (Alignment) - 세그먼트가 있을 때만
+        # Step 2: 단어 정렬 (Alignment) - 세그먼트가 있을 때만. 원본 시간이므로 원본 오디오로 정렬
         if result["segments"]:
-            model_a, metadata = whisperx.load_align_model(
-                language_code=detected_language,
-                device=device,
-            )
-            result = whisperx.align(result["segments"], model_a, metadata, audio, device)
+            aligned = load("alignment")
+            if aligned is None:
+                model_a, metadata = _job_model(
+                    "align",
+                    whisperx.load_align_model,
+                    language_code=detected_language,
+                    device=device,
+                )
+                with stage("alignment"):
+                    aligned = _to_builtin(whisperx.align(result["segments"], model_a, metadata, audio, device))
+                save("alignment", aligned)
 
-            del model_a
-            model_a = None
-            _clear_gpu()
+                del model_a
+                model_a = None
+                _clear_gpu()
+            result = aligned
 
         # Step 3: 화자 분리 (Diarization) - 유효한 HF 토큰이 있을 때만
         hf_token = settings.hf_token
         if hf_token and not hf_token.startswith("hf_your"):
-            from whisperx.diarize import DiarizationPipeline
+            diarized = load("diarization")
+            if diarized is None:
+                from whisperx.diarize import DiarizationPipeline
 
-            diarize_model = DiarizationPipeline(
-                token=hf_token,
-                device=device,
-            )
-            diarize_segments = diarize_model(audio)
-            result = whisperx.assign_word_speakers(diarize_segments, result)
+                diarize_model = _job_model(
+                    "diarize",
+                    DiarizationPipeline,
+                    token=hf_token,
+                    device=device,
+                )
+                with stage("diarization"):
+                    diarize_segments = diarize_model(speech_audio)
+                    if offset_map:
+                        diarize_segments["start"] = offset_map.to_original(diarize_segments["start"])
+                        diarize_segments["end"] = offset_map.to_original(diarize_segments["end"], end=True)
+                    diarized = _to_builtin(whisperx.assign_word_speakers(diarize_segments, result))
+                save("diarization", diarized)
 
-            del diarize_model
-            diarize_model = None
-            _clear_gpu()
+                del diarize_model
+                diarize_model = None
+                _clear_gpu()
+            result = diarized
+
+        # 실시간 배율: 인식 시작부터 정렬/화자 분리까지의 시간 / 오디오 길이
+        # (체크포인트에서 재개한 경우 일부 단계가 빠지므로 기록하지 않음)
+        if audio_seconds > 0 and not resumed:
+            AUDIO_SECONDS.labels(profile["model"], device).inc(audio_seconds)
+            REALTIME_FACTOR.labels(profile["model"], device).observe(
+                (time.perf_counter() - stt_start) / audio_seconds
+            )
 
         # 결과 구성
         segments = []
@@ -96,6 +276,10 @@ def transcribe_audio(audio_path: str) -> dict:
             "segments": segments,
             "full_text": full_text,
             "language": detected_language,
+            "duration_seconds": round(audio_seconds, 2),
+            "profile": profile,
+            # 정렬 결과의 단어 시간 (세그먼트 순서와 같음, 정렬하지 않았으면 단어 없음)
+            "word_timings": pack_word_timings(result["segments"]),
         }
     finally:
         # 에러 발생 시에도 GPU 메모리 확실히 해제
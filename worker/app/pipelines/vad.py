@@ -0,0 +1,96 @@
+# worker/app/pipelines/vad.py
+"""인식 전 무음/비음성 구간 제거와 타임스탬프 복원.
+
+디코딩된 16kHz PCM을 프레임 단위 RMS(dB)로 한 번에 계산해, 바닥 잡음보다 vad_margin_db 이상 큰
+프레임을 음성으로 봅니다. 바닥 잡음은 하위 10% 프레임 수준으로 추정하는데, 무음이 거의 없는 녹음에서는
+이 값이 작은 말소리 수준이 되므로 판정 기준을 vad_max_threshold_db(dBFS) 이하로 제한합니다.
+vad_min_silence_seconds보다 짧은 무음은 음성에 포함하고(말 사이 쉼 유지), 남은 긴 무음/대기 구간만
+잘라낸 뒤 음성 구간마다 vad_padding_seconds를 붙입니다.
+
+잘라낸 오디오의 시간은 OffsetMap으로 원본 시간으로 되돌립니다. 인식 결과는 저장 전에 원본 시간으로
+바꾸므로 정렬(원본 오디오 사용), 화자 분리, 체크포인트, UI는 모두 원본 시간만 다룹니다.
+"""
+
+import numpy as np
+
+from app.config import settings
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.03
+
+
+class OffsetMap:
+    """잘라낸 오디오 시간 → 원본 시간 변환표 (음성 구간별 시작 시간 쌍)"""
+
+    def __init__(self, trimmed_starts: np.ndarray, original_starts: np.ndarray, durations: np.ndarray):
+        self.trimmed_starts = trimmed_starts
+        self.original_starts = original_starts
+        self.durations = durations
+
+    def to_original(self, times, end: bool = False) -> np.ndarray:
+        """시간 배열 변환. 구간 경계의 끝 시간(end=True)은 다음 구간이 아닌 앞 구간의 끝으로 보냄"""
+        times = np.asarray(times, dtype=np.float64)
+        side = "left" if end else "right"
+        index = np.clip(np.searchsorted(self.trimmed_starts, times, side=side) - 1, 0, len(self.trimmed_starts) - 1)
+        return self.original_starts[index] + (times - self.trimmed_starts[index])
+
+    def remap_segments(self, segments: list[dict]) -> list[dict]:
+        """세그먼트(와 단어)의 start/end를 원본 시간으로 변환한 새 목록"""
+        remapped = []
+        for seg in segments:
+            seg = dict(seg)
+            if "start" in seg:
+                seg["start"] = round(float(self.to_original(seg["start"])), 3)
+            if "end" in seg:
+                seg["end"] = round(float(self.to_original(seg["end"], end=True)), 3)
+            if "words" in seg:
+                seg["words"] = self.remap_segments(seg["words"])
+            remapped.append(seg)
+        return remapped
+
+
+def speech_regions(audio: np.ndarray) -> np.ndarray:
+    """음성 구간 (시작, 끝) 샘플 배열, shape (n, 2)"""
+    frame = int(SAMPLE_RATE * FRAME_SECONDS)
+    count = len(audio) // frame
+    if count == 0:
+        return np.array([[0, len(audio)]], dtype=np.int64)
+
+    frames = audio[: count * frame].astype(np.float32).reshape(count, frame)
+    db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    threshold = min(np.percentile(db, 10) + settings.vad_margin_db, settings.vad_max_threshold_db)
+    speech = db > threshold
+
+    # 음성↔무음 경계에서 구간 시작/끝 프레임 계산
+    edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # 짧은 무음은 음성에 포함 (앞 구간과 합침)
+    min_gap = int(settings.vad_min_silence_seconds / FRAME_SECONDS)
+    keep = np.concatenate(([True], starts[1:] - ends[:-1] >= min_gap))
+    starts, ends = starts[keep], ends[np.concatenate((keep[1:], [True]))]
+
+    # 여유 구간을 붙이고 샘플 단위로 변환, 겹치는 구간 병합
+    pad = int(settings.vad_padding_seconds * SAMPLE_RATE)
+    starts = np.maximum(starts * frame - pad, 0)
+    ends = np.minimum(ends * frame + pad, len(audio))
+    first = np.flatnonzero(np.concatenate(([True], starts[1:] > ends[:-1])))
+    return np.stack([starts[first], np.maximum.reduceat(ends, first)], axis=1)
+
+
+def trim_silence(audio: np.ndarray) -> tuple[np.ndarray, OffsetMap | None]:
+    """음성 구간만 이어 붙인 오디오와 변환표. 잘라낼 것이 거의 없거나 비활성이면 (원본, None)"""
+    if not settings.vad_enabled:
+        return audio, None
+    regions = speech_regions(audio)
+    if len(regions) == 0:
+        return audio, None
+    lengths = regions[:, 1] - regions[:, 0]
+    if lengths.sum() >= len(audio) * (1 - settings.vad_min_trim_ratio):
+        return audio, None
+
+    trimmed = np.concatenate([audio[start:end] for start, end in regions])
+    trimmed_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) / SAMPLE_RATE
+    return trimmed, OffsetMap(trimmed_starts, regions[:, 0] / SAMPLE_RATE, lengths / SAMPLE_RATE)
@@ -0,0 +1,77 @@
+# worker/app/services/checkpoints.py
+"""파이프라인 단계별 체크포인트.
+
+단계 출력을 업로드 볼륨의 {upload_dir}/.checkpoints/{note_id}/ 아래에 저장하고,
+파일 존재 여부를 단계 완료 표시로 사용합니다. 재시도되거나 다른 워커가 회수(reclaim)한 작업은
+완료된 단계를 건너뛰고 마지막 완료 단계 다음부터 이어서 처리합니다.
+
+- decode.npy: 디코딩된 16kHz 오디오
+- profile.json: 작업별 STT 설정 (app.pipelines.policy)
+- asr.json / alignment.json / diarization.json: STT 단계 결과
+- analysis.json: Ollama 분석 결과
+
+쓰기는 임시 파일 + os.replace로 원자적으로 처리해 중간에 죽어도 반쯤 쓴 파일이 완료로 보이지 않게 합니다.
+작업이 완료되면 clear()로 삭제합니다. API는 노트 삭제 시 같은 경로를 삭제합니다.
+"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIRNAME = ".checkpoints"
+
+# 처리 순서대로의 체크포인트 단계
+STAGES = ("decode", "profile", "asr", "alignment", "diarization", "analysis")
+
+
+class Checkpoints:
+    def __init__(self, note_id: str):
+        self.note_id = note_id
+        self.path = Path(settings.upload_dir) / CHECKPOINT_DIRNAME / note_id
+
+    def _file(self, stage: str, suffix: str = ".json") -> Path:
+        return self.path / f"{stage}{suffix}"
+
+    def _write_atomic(self, target: Path, write) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.tmp")
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, target)
+
+    def completed(self) -> list[str]:
+        """완료 표시가 있는 단계 목록 (처리 순서)"""
+        done = {p.stem for p in self.path.glob("*") if not p.name.startswith(".")}
+        return [stage for stage in STAGES if stage in done]
+
+    def load(self, stage: str) -> dict | None:
+        try:
+            return json.loads(self._file(stage).read_text())
+        except FileNotFoundError:
+            return None
+
+    def save(self, stage: str, data: dict) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode()
+        self._write_atomic(self._file(stage), lambda f: f.write(body))
+
+    def load_audio(self):
+        import numpy as np
+
+        try:
+            return np.load(self._file("decode", ".npy"))
+        except FileNotFoundError:
+            return None
+
+    def save_audio(self, audio) -> None:
+        import numpy as np
+
+        self._write_atomic(self._file("decode", ".npy"), lambda f: np.save(f, audio))
+
+    def clear(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,155 @@
+# worker/app/services/job_queue.py
+"""신뢰성 있는 작업 큐.
+
+BLPOP으로 꺼낸 작업은 워커가 처리 중에 죽으면 사라지므로, BLMOVE로 대기열에서 워커별 처리 중 목록
+(voice:jobs:processing:{worker_id})으로 옮긴 뒤 처리가 끝나면 제거(ack)합니다.
+워커는 주기적으로 하트비트 키(voice:workers:{worker_id})를 TTL과 함께 갱신하고,
+하트비트가 끊긴 워커의 처리 중 목록을 대기열 맨 앞으로 되돌립니다(reclaim).
+되돌아간 작업은 단계 체크포인트(app.services.checkpoints)에서 이어서 처리됩니다.
+
+처리 도중 워커가 죽은 것도 한 번의 실패로 보고 되돌릴 때 attempt를 올립니다. 워커를 계속 죽이는
+작업(메모리 부족을 일으키는 파일 등)이 무한히 되돌아가지 않도록, job_max_attempts에 이른 작업은
+대기열 대신 voice:jobs:dead로 옮기고 on_dead_letter로 알립니다.
+
+다시 분석 같은 저우선순위 작업(voice:jobs:low)은 일반 대기열이 비었을 때만 꺼내고,
+reanalysis_min_interval_seconds 간격으로 제한해 Ollama를 일괄 작업이 독점하지 않게 합니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUEUE_NAME = "voice:jobs"
+LOW_PRIORITY_QUEUE = "voice:jobs:low"
+DEAD_LETTER_QUEUE = "voice:jobs:dead"
+PROCESSING_PREFIX = "voice:jobs:processing:"
+HEARTBEAT_PREFIX = "voice:workers:"
+
+
+class JobQueue:
+    def __init__(
+        self,
+        r: redis.Redis,
+        worker_id: str | None = None,
+        on_dead_letter: Callable[[dict], Awaitable[None]] | None = None,
+    ):
+        self.r = r
+        self.on_dead_letter = on_dead_letter
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.processing = f"{PROCESSING_PREFIX}{self.worker_id}"
+        self._low_ready_at = 0.0
+
+    async def pop(self, timeout: float) -> str | None:
+        """대기열 맨 앞 작업을 처리 중 목록으로 옮기고 반환 (없으면 None)
+
+        일반 대기열을 먼저 보고, 비어 있으면 간격 제한 안에서 저우선순위 대기열을 봅니다.
+        둘 다 없으면 일반 대기열에서 기다리되, 저우선순위 작업이 허용되는 시점까지만 기다립니다.
+        """
+        job = await self.r.lmove(QUEUE_NAME, self.processing, "LEFT", "RIGHT")
+        if job is not None:
+            return job
+
+        wait = self._low_ready_at - time.monotonic()
+        if wait <= 0:
+            job = await self.r.lmove(LOW_PRIORITY_QUEUE, self.processing, "LEFT", "RIGHT")
+            if job is not None:
+                self._low_ready_at = time.monotonic() + settings.reanalysis_min_interval_seconds
+                return job
+            wait = timeout
+        # BLMOVE의 timeout 0은 무기한 대기이므로 최소값을 둠
+        return await self.r.blmove(QUEUE_NAME, self.processing, max(min(timeout, wait), 0.1), "LEFT", "RIGHT")
+
+    async def ack(self, job_json: str) -> None:
+        """처리가 끝난(완료 또는 최종 실패) 작업을 처리 중 목록에서 제거"""
+        await self.r.lrem(self.processing, 1, job_json)
+
+    async def retry(self, job_json: str, retry_job: dict) -> None:
+        """처리 중 작업을 제거하고 재시도 작업을 원래 대기열 끝에 추가 (원자적)"""
+        queue = LOW_PRIORITY_QUEUE if retry_job.get("type") == "reanalyze" else QUEUE_NAME
+        async with self.r.pipeline(transaction=True) as pipe:
+            pipe.lrem(self.processing, 1, job_json)
+            pipe.rpush(queue, json.dumps(retry_job))
+            await pipe.execute()
+
+    async def heartbeat(self) -> None:
+        await self.r.set(
+            f"{HEARTBEAT_PREFIX}{self.worker_id}", "1", ex=settings.worker_heartbeat_ttl_seconds
+        )
+
+    async def _requeue(self, key: str) -> int:
+        """처리 중 목록의 작업을 attempt를 올려 순서를 유지한 채 원래 대기열 맨 앞으로 되돌림
+
+        꺼내기와 다시 넣기는 WATCH 트랜잭션으로 묶어, 여러 워커가 동시에 회수해도 작업이 중복되거나
+        사라지지 않게 합니다. 재시도 횟수를 다 쓴 작업은 dead letter 목록으로 옮깁니다.
+        """
+        moved = 0
+        while True:
+            async with self.r.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(key)
+                    job_json = await pipe.lindex(key, -1)
+                    if job_json is None:
+                        return moved
+                    job = json.loads(job_json)
+                    job["attempt"] = job.get("attempt", 1) + 1
+                    dead = job["attempt"] > settings.job_max_attempts
+                    pipe.multi()
+                    pipe.rpop(key)
+                    if dead:
+                        pipe.rpush(DEAD_LETTER_QUEUE, json.dumps(job))
+                    else:
+                        queue = LOW_PRIORITY_QUEUE if job.get("type") == "reanalyze" else QUEUE_NAME
+                        pipe.lpush(queue, json.dumps(job))
+                    await pipe.execute()
+                except redis.WatchError:
+                    continue
+
+            if not dead:
+                moved += 1
+                continue
+            logger.error(f"재시도 횟수를 넘은 작업을 dead letter로 이동: note_id={job.get('note_id')}")
+            if self.on_dead_letter is not None:
+                try:
+                    await self.on_dead_letter(job)
+                except Exception as e:
+                    logger.error(f"dead letter 처리 실패: note_id={job.get('note_id')}, error={e}")
+
+    async def recover(self) -> int:
+        """시작 시 같은 worker_id로 남아 있던 처리 중 작업을 되돌림 (같은 컨테이너의 재시작)"""
+        moved = await self._requeue(self.processing)
+        if moved:
+            logger.warning(f"이전 실행의 처리 중 작업 {moved}건을 대기열로 되돌림")
+        return moved
+
+    async def reclaim(self) -> int:
+        """하트비트가 끊긴 워커의 처리 중 작업을 대기열로 되돌림"""
+        moved = 0
+        async for key in self.r.scan_iter(match=f"{PROCESSING_PREFIX}*"):
+            worker_id = key.removeprefix(PROCESSING_PREFIX)
+            if worker_id == self.worker_id or await self.r.exists(f"{HEARTBEAT_PREFIX}{worker_id}"):
+                continue
+            count = await self._requeue(key)
+            if count:
+                logger.warning(f"응답 없는 워커 {worker_id}의 작업 {count}건 회수")
+            moved += count
+        return moved
+
+    async def run_heartbeat(self) -> None:
+        """하트비트 갱신 + 죽은 워커 작업 회수를 주기적으로 실행"""
+        while True:
+            try:
+                await self.heartbeat()
+                await self.reclaim()
+            except redis.RedisError as e:
+                logger.warning(f"하트비트/회수 실패: {e}")
+            await asyncio.sleep(settings.worker_heartbeat_interval_seconds)
@@ -0,0 +1,46 @@
+# worker/app/services/note_cache.py
+"""완료 결과를 API의 Redis 노트 캐시에 기록합니다.
+
+키/필드 형식은 backend app.services.note_cache와 같아야 합니다.
+API는 없는 필드만 채우고 워커는 항상 덮어쓰므로, 재처리된 결과가 캐시에 반영됩니다.
+"""
+
+import json
+import logging
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 캐시 형식 버전 (backend note_cache.CACHE_VERSION과 같아야 함)
+CACHE_VERSION = 1
+
+# 프롬프트 컨텍스트용 트랜스크립트 앞부분 길이 (backend chat.CHAT_CONTEXT_CHARS와 동일)
+CHAT_CONTEXT_CHARS = 4000
+
+cache_client = redis.from_url(settings.redis_url)
+
+
+async def store_note_cache(note_id: str, owner_id: str, fields: dict) -> None:
+    """캐시 기록 실패는 결과 저장에 영향을 주지 않습니다 (API가 DB에서 다시 채움)."""
+    key = f"voice:note:v{CACHE_VERSION}:{note_id}"
+    try:
+        async with cache_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"owner": owner_id, **fields})
+            pipe.expire(key, settings.note_cache_ttl_seconds)
+            await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"노트 캐시 기록 실패: note_id={note_id}, error={e}")
+
+
+def chat_context(full_text: str, analysis: dict) -> str:
+    return json.dumps(
+        {
+            "full_text": full_text[:CHAT_CONTEXT_CHARS],
+            "summary": analysis["summary"],
+            "keywords": analysis["keywords"],
+        },
+        ensure_ascii=False,
+    )
@@ -0,0 +1,37 @@
+# worker/app/services/payloads.py
+"""API 응답용 미리 직렬화된 페이로드.
+
+backend app.services.payloads와 같은 형식(gzip 압축 JSON)이어야 하며,
+내용은 TranscriptResponse/AnalysisResponse 스키마와 같은 형태입니다.
+양쪽 테스트(tests/test_payloads.py, backend tests/test_transcripts.py)가 같은 골든 값을 확인합니다.
+"""
+
+import gzip
+import hashlib
+import json
+
+
+def encode_payload(data: dict) -> tuple[bytes, str]:
+    """압축 JSON과 내용 기반 ETag 값을 반환합니다."""
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+    return gzip.compress(body, compresslevel=6), hashlib.sha256(body).hexdigest()[:32]
+
+
+def transcript_payload(transcript_id: str, note_id: str, stt_result: dict) -> tuple[bytes, str]:
+    return encode_payload({
+        "id": transcript_id,
+        "note_id": note_id,
+        "segments": stt_result["segments"],
+        "full_text": stt_result["full_text"],
+    })
+
+
+def analysis_payload(analysis_id: str, note_id: str, analysis: dict) -> tuple[bytes, str]:
+    return encode_payload({
+        "id": analysis_id,
+        "note_id": note_id,
+        "summary": analysis["summary"],
+        "topics": analysis["topics"],
+        "keywords": analysis["keywords"],
+        "action_items": analysis["action_items"],
+    })
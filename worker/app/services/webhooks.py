@@ -0,0 +1,239 @@
+# worker/app/services/webhooks.py
+"""완료/실패 웹훅 전송.
+
+process_job이 노트 상태를 바꾸는 트랜잭션에서 webhook_deliveries에 행을 추가하면
+(enqueue_webhook), 디스패처가 기한이 된 행을 임대(lease)해 서명된 POST로 전송하고
+실패 시 지수 백오프로 재시도합니다. 대기열이 DB에 있으므로 워커가 재시작되어도
+전송이 유실되지 않고, 여러 워커가 SKIP LOCKED로 나눠 처리할 수 있습니다.
+서명 키(WEBHOOK_SECRET)가 없으면 서명 없이 보내지 않고 실패로 기록합니다.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import random
+import time
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.metrics import WEBHOOK_DELIVERIES
+from app.services.db import async_session
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-Voice-Signature"
+TIMESTAMP_HEADER = "X-Voice-Timestamp"
+
+
+async def enqueue_webhook(db: AsyncSession, note_id: str, event: str) -> None:
+    """노트에 웹훅 URL이 등록되어 있으면 전송 대기열에 추가 (호출자 트랜잭션에 포함)."""
+    await db.execute(
+        text("""
+            INSERT INTO webhook_deliveries
+                (id, note_id, event, url, status, attempts, next_attempt_at, created_at, updated_at)
+            SELECT gen_random_uuid(), id, :event, webhook_url, 'pending', 0, now(), now(), now()
+            FROM notes WHERE id = CAST(:note_id AS uuid) AND webhook_url IS NOT NULL
+        """),
+        {"note_id": note_id, "event": event},
+    )
+
+
+def sign_payload(body: bytes, timestamp: int) -> str:
+    """수신 측 검증용 서명: HMAC-SHA256(secret, "{timestamp}." + body)"""
+    digest = hmac.new(
+        settings.webhook_secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256
+    ).hexdigest()
+    return f"sha256={digest}"
+
+
+def retry_delay(attempts: int) -> float:
+    """attempts회 실패 후 다음 시도까지의 대기 시간 (지수 백오프 + 지터)"""
+    delay = min(settings.webhook_retry_base_seconds * 2 ** (attempts - 1), settings.webhook_retry_max_seconds)
+    return delay * random.uniform(0.5, 1.0)
+
+
+async def _claim_due(limit: int) -> list[dict]:
+    """기한이 된 전송을 임대합니다. 전송 중 워커가 죽으면 임대 만료 후 다시 시도됩니다."""
+    async with async_session() as db:
+        result = await db.execute(
+            text("""
+                UPDATE webhook_deliveries
+                SET next_attempt_at = now() + CAST(:lease AS float) * interval '1 second', updated_at = now()
+                WHERE id IN (
+                    SELECT id FROM webhook_deliveries
+                    WHERE status = 'pending' AND next_attempt_at <= now()
+                    ORDER BY next_attempt_at
+                    LIMIT :limit
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, note_id, event, url, attempts
+            """),
+            {"lease": settings.webhook_lease_seconds, "limit": limit},
+        )
+        deliveries = [dict(row._mapping) for row in result]
+        await db.commit()
+    return deliveries
+
+
+async def _load_payloads(deliveries: list[dict]) -> dict:
+    """전송 대상 노트의 결과를 한 번에 조회해 note_id별 페이로드 본문을 만듭니다."""
+    async with async_session() as db:
+        result = await db.execute(
+            text("""
+                SELECT n.id, n.title, n.status, n.language, n.duration_seconds, n.created_at,
+                       t.segments, t.full_text, a.summary, a.topics, a.keywords, a.action_items,
+                       a.id AS analysis_id, t.id AS transcript_id
+                FROM notes n
+                LEFT JOIN transcripts t ON t.note_id = n.id
+                LEFT JOIN analyses a ON a.note_id = n.id
+                WHERE n.id = ANY(:note_ids)
+            """),
+            {"note_ids": list({d["note_id"] for d in deliveries})},
+        )
+        rows = result.all()
+
+    payloads = {}
+    for row in rows:
+        payloads[row.id] = {
+            "note": {
+                "id": str(row.id),
+                "title": row.title,
+                "status": row.status,
+                "language": row.language,
+                "duration_seconds": row.duration_seconds,
+                "created_at": row.created_at.isoformat(),
+            },
+            "transcript": (
+                {"segments": row.segments, "full_text": row.full_text} if row.transcript_id else None
+            ),
+            "analysis": (
+                {
+                    "summary": row.summary,
+                    "topics": row.topics,
+                    "keywords": row.keywords,
+                    "action_items": row.action_items,
+                }
+                if row.analysis_id
+                else None
+            ),
+        }
+    return payloads
+
+
+async def _deliver(client: httpx.AsyncClient, delivery: dict, payload: dict | None) -> str | None:
+    """단일 전송. 성공 시 None, 실패 시 오류 메시지를 반환합니다."""
+    if payload is None:
+        return "노트를 찾을 수 없습니다"
+    if not settings.webhook_secret:
+        return "WEBHOOK_SECRET이 설정되지 않았습니다"
+    body = json.dumps(
+        {"event": delivery["event"], "delivery_id": str(delivery["id"]), **payload},
+        ensure_ascii=False,
+    ).encode()
+    headers = {
+        "Content-Type": "application/json",
+        "X-Voice-Event": delivery["event"],
+        "X-Voice-Delivery": str(delivery["id"]),
+    }
+    timestamp = int(time.time())
+    headers[TIMESTAMP_HEADER] = str(timestamp)
+    headers[SIGNATURE_HEADER] = sign_payload(body, timestamp)
+    try:
+        resp = await client.post(delivery["url"], content=body, headers=headers)
+    except httpx.HTTPError as e:
+        return f"{type(e).__name__}: {e}"
+    if resp.is_success:
+        return None
+    return f"HTTP {resp.status_code}"
+
+
+async def _record_results(results: list[tuple[dict, str | None]]) -> None:
+    async with async_session() as db:
+        for delivery, error in results:
+            attempts = delivery["attempts"] + 1
+            if error is None:
+                WEBHOOK_DELIVERIES.labels("delivered").inc()
+                await db.execute(
+                    text("""
+                        UPDATE webhook_deliveries
+                        SET status = 'delivered', attempts = :attempts, last_error = NULL,
+                            delivered_at = now(), updated_at = now()
+                        WHERE id = :id
+                    """),
+                    {"id": delivery["id"], "attempts": attempts},
+                )
+            elif attempts >= settings.webhook_max_attempts:
+                WEBHOOK_DELIVERIES.labels("failed").inc()
+                logger.error(f"웹훅 전송 포기: delivery_id={delivery['id']}, error={error}")
+                await db.execute(
+                    text("""
+                        UPDATE webhook_deliveries
+                        SET status = 'failed', attempts = :attempts, last_error = :error, updated_at = now()
+                        WHERE id = :id
+                    """),
+                    {"id": delivery["id"], "attempts": attempts, "error": error},
+                )
+            else:
+                WEBHOOK_DELIVERIES.labels("retry").inc()
+                logger.warning(f"웹훅 전송 실패 (재시도 예정): delivery_id={delivery['id']}, error={error}")
+                await db.execute(
+                    text("""
+                        UPDATE webhook_deliveries
+                        SET attempts = :attempts, last_error = :error, updated_at = now(),
+                            next_attempt_at = now() + CAST(:delay AS float) * interval '1 second'
+                        WHERE id = :id
+                    """),
+                    {"id": delivery["id"], "attempts": attempts, "error": error, "delay": retry_delay(attempts)},
+                )
+        await db.commit()
+
+
+class WebhookDispatcher:
+    def __init__(self):
+        self._wake = asyncio.Event()
+
+    def wake(self) -> None:
+        """새 전송이 대기열에 추가되었음을 알려 폴링 주기를 기다리지 않게 합니다."""
+        self._wake.set()
+
+    async def dispatch_once(self, client: httpx.AsyncClient) -> int:
+        """기한이 된 전송을 최대 webhook_concurrency개 동시에 보내고 처리 건수를 반환합니다."""
+        deliveries = await _claim_due(settings.webhook_concurrency)
+        if not deliveries:
+            return 0
+        payloads = await _load_payloads(deliveries)
+        errors = await asyncio.gather(
+            *(_deliver(client, d, payloads.get(d["note_id"])) for d in deliveries)
+        )
+        await _record_results(list(zip(deliveries, errors)))
+        return len(deliveries)
+
+    async def run(self) -> None:
+        if not settings.webhook_secret:
+            logger.error("WEBHOOK_SECRET이 설정되지 않아 웹훅을 전송하지 않습니다 (대기 중인 전송은 실패 처리)")
+        limits = httpx.Limits(
+            max_connections=settings.webhook_concurrency,
+            max_keepalive_connections=settings.webhook_concurrency,
+        )
+        async with httpx.AsyncClient(timeout=settings.webhook_timeout_seconds, limits=limits) as client:
+            while True:
+                try:
+                    processed = await self.dispatch_once(client)
+                except Exception as e:
+                    logger.error(f"웹훅 디스패처 오류: {e}")
+                    processed = 0
+                if processed >= settings.webhook_concurrency:
+                    continue
+                try:
+                    await asyncio.wait_for(self._wake.wait(), settings.webhook_poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+
+
+webhook_dispatcher = WebhookDispatcher()
@@ -0,0 +1,56 @@
+# worker/app/services/word_timings.py
+"""단어 단위 타이밍 압축 형식 (transcripts.word_timings).
+
+backend app.services.word_timings와 같은 형식이어야 합니다 (형식 설명은 그쪽 참고).
+단어별 JSON 객체 대신 시작/끝/신뢰도 float32 배열과 텍스트 오프셋 색인으로 저장해
+한 시간 녹음도 수백 KB 안에 들어가고, API가 구간 조회 시 전체를 풀지 않아도 됩니다.
+저장본 해시(word_timings_etag)를 함께 저장해 API가 조건부 요청에 저장본을 읽지 않고 답하게 합니다.
+두 구현이 어긋나지 않도록 양쪽 테스트가 같은 골든 값을 확인합니다.
+"""
+
+import array
+import hashlib
+import math
+import struct
+import sys
+
+MAGIC = b"VWT1"
+HEADER = struct.Struct("<4sII")
+
+
+def pack_word_timings(segments: list[dict]) -> bytes:
+    """정렬된 세그먼트(words 포함)를 압축 형식으로 변환합니다."""
+    starts, ends, scores = array.array("f"), array.array("f"), array.array("f")
+    text_offsets, segment_offsets = array.array("I", [0]), array.array("I", [0])
+    text = bytearray()
+    previous_start = previous_end = 0.0
+    for seg in segments:
+        for word in seg.get("words") or []:
+            # 정렬하지 못한 단어(숫자/기호)는 시간이 없으므로 앞 단어 끝에 붙임
+            start = max(float(word.get("start", previous_end)), previous_start)
+            end = max(float(word.get("end", start)), start)
+            starts.append(start)
+            ends.append(end)
+            scores.append(float(word.get("score", math.nan)))
+            text += str(word.get("word", "")).encode()
+            text_offsets.append(len(text))
+            previous_start, previous_end = start, end
+        segment_offsets.append(len(starts))
+
+    if sys.byteorder != "little":
+        for values in (starts, ends, scores, text_offsets, segment_offsets):
+            values.byteswap()
+    return b"".join((
+        HEADER.pack(MAGIC, len(starts), len(segment_offsets) - 1),
+        starts.tobytes(),
+        ends.tobytes(),
+        scores.tobytes(),
+        text_offsets.tobytes(),
+        segment_offsets.tobytes(),
+        bytes(text),
+    ))
+
+
+def word_timings_etag(data: bytes) -> str:
+    """저장본 해시 (backend app.services.word_timings와 같은 방식)"""
+    return hashlib.sha256(data).hexdigest()[:32]
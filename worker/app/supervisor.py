@@ -0,0 +1,184 @@
+# worker/app/supervisor.py
+"""CPU 전용 노드용 다중 프로세스 워커 감독자.
+
+CPU에서는 CTranslate2 인스턴스 하나가 큰 머신의 코어를 다 쓰지 못하므로, 워커 프로세스 N개를 띄워
+같은 대기열(voice:jobs)을 나눠 처리합니다. 각 프로세스는
+- 서로 겹치지 않는 코어 집합에 고정(sched_setaffinity)되고 스레드 수(cpu_threads, OMP/MKL)가 정해지며
+- 모델을 작업마다 다시 로드하지 않고 프로세스에 유지(keep_models_resident)하고
+- 메모리 할당량(memory_budget_gb) 안에서 모델 선택 정책을 적용합니다.
+
+프로세스 수/스레드 수는 supervisor_processes/supervisor_threads(0이면 자동)로 정하며, 자동일 때는
+코어 수와 사용 가능한 메모리(MemAvailable, int8 모델 + 프로세스 기본 사용량)로 계산합니다. 최적 조합은
+`python -m benchmarks.layout`으로 측정할 수 있습니다.
+
+프로세스가 죽으면 같은 슬롯 번호로 다시 띄우고, 슬롯별 worker_id가 같으므로 처리 중이던 작업은
+새 프로세스가 시작할 때 대기열로 되돌립니다(JobQueue.recover). 메트릭은 prometheus_client 다중 프로세스
+모드로 모아 감독자가 metrics_port에서 노출합니다.
+
+    python -m app.supervisor [--processes N] [--threads T] [--dry-run]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+
+from app.config import settings
+from app.pipelines.policy import MODEL_MEMORY_GB, free_system_memory_gb
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+# 인식 모델 외 프로세스당 메모리 (정렬 모델, 오디오 버퍼, 파이썬 런타임) GB
+PROCESS_OVERHEAD_GB = 1.5
+# 자동 결정 시 프로세스당 기본 스레드 수
+DEFAULT_THREADS = 4
+# 같은 슬롯을 다시 띄우기 전 최소 대기 시간 (시작 직후 죽는 경우의 재시작 폭주 방지)
+RESTART_BACKOFF_SECONDS = 5.0
+
+
+def process_memory_gb(model: str) -> float:
+    """CPU(int8) 워커 프로세스 하나의 예상 메모리"""
+    return MODEL_MEMORY_GB.get(model, MODEL_MEMORY_GB["large-v3"]) / 2 + PROCESS_OVERHEAD_GB
+
+
+def plan_layout(cores: int, memory_gb: float, model: str, processes: int = 0, threads: int = 0) -> tuple[int, int]:
+    """(프로세스 수, 프로세스별 스레드 수). 지정하지 않은 값은 코어 수와 메모리로 결정"""
+    if not processes:
+        by_memory = max(1, int(memory_gb // process_memory_gb(model)))
+        by_cores = max(1, cores // (threads or min(DEFAULT_THREADS, cores)))
+        processes = min(by_cores, by_memory)
+    if not threads:
+        # 메모리 때문에 프로세스가 적으면 남는 코어를 스레드로 사용
+        threads = max(1, cores // processes)
+    return processes, threads
+
+
+def process_budget_gb(memory_gb: float, processes: int) -> float:
+    """프로세스별 모델 선택 정책 메모리 (memory_budget_gb를 지정하지 않았을 때)"""
+    return settings.memory_budget_gb or round(memory_gb / processes, 1)
+
+
+def assign_cpus(cpus: list[int], processes: int, threads: int) -> list[list[int]]:
+    """프로세스별로 겹치지 않는 코어 집합 (코어가 모자라면 돌려 가며 공유)"""
+    return [[cpus[(i * threads + j) % len(cpus)] for j in range(threads)] for i in range(processes)]
+
+
+def configure_process(cpus: list[int], threads: int) -> None:
+    """torch/CTranslate2 import 전에 호출: 코어 고정 + 스레드 수 설정 + 모델 유지"""
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    os.sched_setaffinity(0, cpus)
+    settings.cpu_threads = threads
+    settings.keep_models_resident = True
+
+    import torch
+
+    torch.set_num_threads(threads)
+
+
+def _run_worker(index: int, cpus: list[int], threads: int, memory_budget_gb: float) -> None:
+    import asyncio
+
+    configure_process(cpus, threads)
+    settings.memory_budget_gb = memory_budget_gb
+    settings.worker_id = f"{socket.gethostname()}-{index}"
+
+    from app.main import main
+
+    asyncio.run(main())
+
+
+def run(processes: int, threads: int, memory_gb: float) -> None:
+    """memory_gb는 배치를 정할 때 측정한 사용 가능한 메모리 (배치와 할당량이 같은 값을 기준으로 하도록)"""
+    # 자식은 spawn으로 시작하므로 여기서 설정한 환경 변수를 이어받음
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    metrics_dir = tempfile.mkdtemp(prefix="voice-worker-metrics-")
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+
+    from prometheus_client import CollectorRegistry, multiprocess, start_http_server
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    start_http_server(settings.metrics_port, registry=registry)
+
+    budget = process_budget_gb(memory_gb, processes)
+    cpu_sets = assign_cpus(sorted(os.sched_getaffinity(0)), processes, threads)
+    context = multiprocessing.get_context("spawn")
+    slots: list[multiprocessing.Process | None] = [None] * processes
+    started_at = [0.0] * processes
+    restarting: set[int] = set()
+
+    def start(index: int) -> None:
+        proc = context.Process(
+            target=_run_worker, args=(index, cpu_sets[index], threads, budget), name=f"voice-worker-{index}"
+        )
+        proc.start()
+        slots[index] = proc
+        started_at[index] = time.monotonic()
+        logger.info(f"워커 {index} 시작: pid={proc.pid}, cpus={cpu_sets[index]}, threads={threads}")
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    logger.info(f"감독자 시작: processes={processes}, threads={threads}, memory_budget={budget}GB/프로세스")
+    try:
+        for index in range(processes):
+            start(index)
+        while not stopping:
+            time.sleep(1)
+            for index, proc in enumerate(slots):
+                if proc.is_alive():
+                    continue
+                if index not in restarting:
+                    multiprocess.mark_process_dead(proc.pid)
+                    logger.error(f"워커 {index} 종료됨: pid={proc.pid}, exitcode={proc.exitcode}")
+                    restarting.add(index)
+                if time.monotonic() - started_at[index] >= RESTART_BACKOFF_SECONDS:
+                    restarting.discard(index)
+                    start(index)
+    finally:
+        for proc in slots:
+            if proc and proc.is_alive():
+                proc.terminate()
+        for proc in slots:
+            if proc:
+                proc.join(timeout=30)
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        logger.info("감독자 종료")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CPU 다중 프로세스 워커 감독자")
+    parser.add_argument("--processes", type=int, default=settings.supervisor_processes, help="0이면 자동")
+    parser.add_argument("--threads", type=int, default=settings.supervisor_threads, help="0이면 자동")
+    parser.add_argument("--dry-run", action="store_true", help="계산된 배치만 출력")
+    args = parser.parse_args()
+
+    cpus = sorted(os.sched_getaffinity(0))
+    memory_gb = free_system_memory_gb()
+    processes, threads = plan_layout(len(cpus), memory_gb, settings.whisper_model, args.processes, args.threads)
+    if args.dry_run:
+        print(
+            f"cores={len(cpus)} memory={memory_gb:.1f}GB model={settings.whisper_model} "
+            f"→ processes={processes} threads={threads}"
+        )
+        for index, cpu_set in enumerate(assign_cpus(cpus, processes, threads)):
+            print(f"  워커 {index}: cpus={cpu_set}")
+        return
+    run(processes, threads, memory_gb)
+
+
+if __name__ == "__main__":
+    main()
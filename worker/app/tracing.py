@@ -0,0 +1,95 @@
+# worker/app/tracing.py
+"""OpenTelemetry 분산 추적.
+
+API가 작업 페이로드의 trace 필드에 담은 W3C traceparent를 이어받아
+큐 대기, 작업 처리, 단계별(stage) 스팬을 업로드 요청과 같은 트레이스에 기록합니다.
+내보내기 설정(tracing_exporter 등)은 API(backend/app/core/tracing.py)와 같습니다.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import TextIO
+
+from opentelemetry import propagate, trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+from app.config import settings
+from app.metrics import STAGE_DURATION
+
+tracer = trace.get_tracer("voice-worker")
+
+# 공급자 설정/종료 (_create_exporter, setup_tracing, shutdown_tracing)는 API와 워커가 같은 구현을
+# 씁니다. 이미지가 달라 모듈을 공유할 수 없으므로 worker/tests/test_tracing.py가 일치를 확인합니다.
+_provider: TracerProvider | None = None
+_file: TextIO | None = None
+
+
+def _create_exporter() -> SpanExporter:
+    global _file
+    if settings.tracing_exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+    if settings.tracing_exporter == "file":
+        _file = open(settings.tracing_file_path, "a", encoding="utf-8")
+        return ConsoleSpanExporter(out=_file, formatter=lambda span: span.to_json(indent=None) + "\n")
+    if settings.tracing_exporter == "console":
+        return ConsoleSpanExporter()
+    raise ValueError(f"지원하지 않는 추적 내보내기 방식입니다: {settings.tracing_exporter}")
+
+
+def setup_tracing() -> None:
+    global _provider
+    if not settings.tracing_exporter or _provider is not None:
+        return
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.tracing_service_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_ratio)),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    trace.set_tracer_provider(_provider)
+
+
+def shutdown_tracing() -> None:
+    """남은 스팬을 내보내고 파일 내보내기의 파일 핸들을 닫습니다."""
+    global _provider, _file
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+    if _file is not None:
+        _file.close()
+        _file = None
+
+
+def job_context(job_data: dict) -> Context:
+    """작업 페이로드의 추적 컨텍스트 (없으면 새 트레이스로 시작)"""
+    return propagate.extract(job_data.get("trace") or {})
+
+
+def record_queue_wait(job_data: dict, context: Context) -> None:
+    """등록 시각부터 지금까지를 queue.wait 스팬으로 기록합니다."""
+    enqueued_at = job_data.get("enqueued_at")
+    if enqueued_at is None:
+        return
+    span = tracer.start_span(
+        "queue.wait",
+        context=context,
+        start_time=int(enqueued_at * 1e9),
+        attributes={"note.id": job_data["note_id"]},
+    )
+    span.end()
+
+
+@contextmanager
+def stage(name: str, **attributes):
+    """파이프라인 단계 하나를 스팬으로 기록하고 소요 시간을 stage 메트릭에 반영합니다."""
+    start = time.perf_counter()
+    with tracer.start_as_current_span(name, attributes=attributes):
+        try:
+            yield
+        finally:
+            STAGE_DURATION.labels(name).observe(time.perf_counter() - start)
@@ -0,0 +1 @@
+"""워커 처리 경로 벤치마크 (python -m benchmarks.run)"""
@@ -0,0 +1,86 @@
+# worker/benchmarks/fake_ollama.py
+"""벤치마크용 로컬 Ollama 대체 서버.
+
+/api/generate(분석)와 /api/embed(임베딩)에 고정된 형식의 응답을 돌려줍니다.
+지연 시간을 지정해 LLM 응답 시간을 흉내 낼 수 있고, 토큰 메트릭이 기록되도록
+eval_count/eval_duration도 채웁니다.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+EMBEDDING_DIMENSIONS = 768
+
+ANALYSIS_RESPONSE = {
+    "summary": "벤치마크용 합성 음성의 요약입니다.",
+    "topics": ["벤치마크"],
+    "keywords": ["합성", "음성", "벤치마크"],
+    "action_items": [{"text": "결과 비교", "assignee": None, "deadline": None}],
+}
+
+
+class FakeOllama:
+    def __init__(self, generate_latency: float = 0.0, embed_latency: float = 0.0):
+        self.generate_latency = generate_latency
+        self.embed_latency = embed_latency
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, body: dict) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if self.path == "/api/generate":
+                    time.sleep(fake.generate_latency)
+                    self._reply({
+                        "model": request["model"],
+                        "response": json.dumps(ANALYSIS_RESPONSE, ensure_ascii=False),
+                        "done": True,
+                        "prompt_eval_count": len(request["prompt"]) // 4,
+                        "eval_count": 120,
+                        "eval_duration": int(max(fake.generate_latency, 0.001) * 1e9),
+                    })
+                elif self.path == "/api/embed":
+                    time.sleep(fake.embed_latency)
+                    texts = request["input"]
+                    rng = random.Random(len(texts))
+                    self._reply({
+                        "model": request["model"],
+                        "embeddings": [
+                            [rng.uniform(-1, 1) for _ in range(EMBEDDING_DIMENSIONS)] for _ in texts
+                        ],
+                        "prompt_eval_count": sum(len(t) // 4 for t in texts),
+                    })
+                else:
+                    self.send_error(404)
+
+        return Handler
+
+    def __enter__(self) -> "FakeOllama":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,132 @@
+# worker/benchmarks/layout.py
+"""CPU 다중 프로세스 배치(프로세스 수 × 스레드 수) 벤치마크.
+
+app.supervisor와 같은 방식(코어 고정, 스레드 수 지정, 모델 유지)으로 프로세스를 띄우고
+같은 합성 오디오 작업 묶음을 나눠 처리하게 해 배치별 처리량을 비교합니다. worker 디렉터리에서 실행합니다.
+
+    python -m benchmarks.layout --model small --lengths 60 --jobs 16
+    python -m benchmarks.layout --layouts 1x16,2x8,4x4,8x2 --output layout.json
+
+처리량은 오디오 초 / 벽시계 초(실시간 대비 배수)이며, 모델 로드와 첫 실행 예열은 측정에서 제외합니다.
+가장 좋은 배치는 SUPERVISOR_PROCESSES/SUPERVISOR_THREADS로 그대로 쓸 수 있게 출력합니다.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from pathlib import Path
+
+from app.config import settings
+from app.pipelines.policy import free_system_memory_gb
+from app.supervisor import assign_cpus, configure_process, process_memory_gb
+from benchmarks.audio import generate_speech_like, wav_duration
+from benchmarks.run import CACHE_DIR
+
+
+def candidate_layouts(cores: int, memory_gb: float, model: str) -> list[tuple[int, int]]:
+    """코어를 모두 쓰는 (프로세스 수, 스레드 수) 조합 중 메모리에 들어가는 것"""
+    max_processes = max(1, int(memory_gb // process_memory_gb(model)))
+    layouts = []
+    threads = 1
+    while threads <= cores:
+        processes = cores // threads
+        if processes <= max_processes:
+            layouts.append((processes, threads))
+        threads *= 2
+    return layouts or [(1, cores)]
+
+
+def _bench_worker(cpus: list[int], threads: int, model: str, warmup: str, jobs, ready, start) -> None:
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    configure_process(cpus, threads)
+    settings.whisper_model = model
+    settings.model_policy = "fixed"
+
+    from app.pipelines.stt import transcribe_audio
+
+    # 모델 로드 + 예열 후 다른 프로세스와 동시에 시작
+    transcribe_audio(warmup)
+    ready.wait()
+    start.wait()
+    while True:
+        try:
+            path = jobs.get_nowait()
+        except queue.Empty:
+            return
+        transcribe_audio(path)
+
+
+def run_layout(processes: int, threads: int, model: str, paths: list[str]) -> float:
+    """배치 하나의 처리 시간(초)"""
+    context = multiprocessing.get_context("spawn")
+    jobs = context.Queue()
+    for path in paths:
+        jobs.put(path)
+    ready = context.Barrier(processes + 1)
+    start = context.Barrier(processes + 1)
+    cpu_sets = assign_cpus(sorted(os.sched_getaffinity(0)), processes, threads)
+    procs = [
+        context.Process(target=_bench_worker, args=(cpus, threads, model, paths[0], jobs, ready, start))
+        for cpus in cpu_sets
+    ]
+    for proc in procs:
+        proc.start()
+    ready.wait()
+    began = time.perf_counter()
+    start.wait()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - began
+    if any(proc.exitcode for proc in procs):
+        raise RuntimeError(f"{processes}x{threads} 배치의 워커가 실패했습니다")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CPU 다중 프로세스 배치 벤치마크")
+    parser.add_argument("--model", default="small", help="whisper_model")
+    parser.add_argument("--lengths", default="60", help="합성 오디오 길이(초), 쉼표로 구분 (작업마다 돌려 가며 사용)")
+    parser.add_argument("--jobs", type=int, default=16, help="배치마다 처리할 작업 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--layouts", help="측정할 배치 (예: 1x8,2x4,4x2). 기본은 코어/메모리로 자동 생성")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    cores = len(os.sched_getaffinity(0))
+    if args.layouts:
+        layouts = [tuple(int(x) for x in layout.split("x")) for layout in args.layouts.split(",")]
+    else:
+        layouts = candidate_layouts(cores, free_system_memory_gb(), args.model)
+
+    audio = []
+    for length in (float(x) for x in args.lengths.split(",")):
+        audio.append(str(generate_speech_like(CACHE_DIR / f"speech-{length:g}s-{args.seed}.wav", length, args.seed)))
+    paths = [audio[i % len(audio)] for i in range(args.jobs)]
+    audio_seconds = sum(wav_duration(path) for path in paths)
+
+    results = []
+    for processes, threads in layouts:
+        elapsed = run_layout(processes, threads, args.model, paths)
+        results.append({
+            "processes": processes,
+            "threads": threads,
+            "wall_seconds": round(elapsed, 2),
+            "throughput": round(audio_seconds / elapsed, 2),
+        })
+        print(json.dumps(results[-1]))
+
+    best = max(results, key=lambda r: r["throughput"])
+    print(f"최적 배치: SUPERVISOR_PROCESSES={best['processes']} SUPERVISOR_THREADS={best['threads']} "
+          f"(실시간 대비 {best['throughput']}배)")
+    if args.output:
+        meta = {"cores": cores, "model": args.model, "jobs": args.jobs, "audio_seconds": round(audio_seconds, 1)}
+        args.output.write_text(json.dumps({"meta": meta, "layouts": results, "best": best}, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,369 @@
+# worker/benchmarks/run.py
+"""워커 처리 경로 벤치마크.
+
+whisperx 업그레이드나 whisper_batch_size/whisper_compute_type 같은 설정 변경의 효과를
+같은 합성 오디오로 측정하고 기준 결과(baseline)와 비교합니다. worker 디렉터리에서 실행합니다.
+
+    # STT만: CPU + tiny 모델로 transcribe_audio 측정
+    python -m benchmarks.run --mode transcribe --model tiny --device cpu --output bench.json
+
+    # 전체 process_job: STT 대체 구현 + 가짜 Ollama (DB/Redis 필요, alembic upgrade head 적용된 DB)
+    python -m benchmarks.run --mode pipeline --stt stub --baseline bench-baseline.json
+
+결과 JSON에는 케이스(모드/STT/오디오 길이)별로 실시간 배율(rtf), 단계별 평균 시간,
+최대 RSS, 분당 처리 작업 수가 기록됩니다. 최대 RSS는 프로세스 수명 동안의 값이라 앞 케이스의
+값이 뒤 케이스에 남으므로, 오디오 길이마다 새 하위 프로세스에서 실행해 케이스별로 측정합니다. --baseline을 지정하면 케이스별 변화율을 출력하고
+--max-regression(기본 10%)보다 나빠진 지표가 있으면 종료 코드 1로 끝납니다.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+import uuid
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+from prometheus_client import REGISTRY
+
+from benchmarks.audio import generate_speech_like, wav_duration
+from benchmarks.fake_ollama import FakeOllama
+
+STAGES = ("model_load", "decode", "vad", "probe", "asr", "alignment", "diarization", "embedding", "analysis", "db_write")
+
+# 지표별로 값이 클수록 좋은지 여부
+METRIC_HIGHER_IS_BETTER = {
+    "rtf": False,
+    "wall_seconds": False,
+    "jobs_per_minute": True,
+    "peak_rss_mb": False,
+}
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+def _stage_totals() -> dict[str, float]:
+    return {
+        stage: REGISTRY.get_sample_value("voice_worker_stage_duration_seconds_sum", {"stage": stage}) or 0.0
+        for stage in STAGES
+    }
+
+
+def _peak_rss_mb() -> float:
+    # 케이스마다 새 프로세스에서 호출되므로 해당 케이스의 최대값. Linux는 KB, macOS는 바이트 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _summarize(name: str, audio_seconds: float, walls: list[float], before: dict, after: dict) -> dict:
+    wall = statistics.median(walls)
+    return {
+        "name": name,
+        "audio_seconds": round(audio_seconds, 2),
+        "runs": len(walls),
+        "wall_seconds": round(wall, 4),
+        "rtf": round(wall / audio_seconds, 4),
+        "stages": {
+            stage: round((after[stage] - before[stage]) / len(walls), 4)
+            for stage in STAGES
+            if after[stage] > before[stage]
+        },
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "jobs_per_minute": round(len(walls) / sum(walls) * 60, 2),
+    }
+
+
+def _install_stub_stt(rtf: float) -> None:
+    """app.main이 import하기 전에 STT 모듈을 대체 구현으로 바꿔 torch/whisperx 없이 실행합니다."""
+    from benchmarks.stub_stt import make_stub_transcribe
+
+    module = types.ModuleType("app.pipelines.stt")
+    module.transcribe_audio = make_stub_transcribe(rtf)
+    sys.modules["app.pipelines.stt"] = module
+
+
+def run_transcribe(audio_files: list[tuple[str, Path]], repeat: int) -> list[dict]:
+    from app.pipelines.stt import transcribe_audio
+
+    # 첫 실행의 초기화 비용(CUDA/라이브러리 로드)이 결과에 섞이지 않도록 한 번 예열
+    transcribe_audio(str(audio_files[0][1]))
+
+    cases = []
+    for label, path in audio_files:
+        before = _stage_totals()
+        walls = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            transcribe_audio(str(path))
+            walls.append(time.perf_counter() - start)
+        cases.append(_summarize(f"transcribe-{label}", wav_duration(str(path)), walls, before, _stage_totals()))
+        print(json.dumps(cases[-1], ensure_ascii=False))
+    return cases
+
+
+async def _create_owner(db) -> tuple[str, str]:
+    from sqlalchemy import text
+
+    user_id, project_id = str(uuid.uuid4()), str(uuid.uuid4())
+    await db.execute(
+        text("""
+            INSERT INTO users (id, email, name, password_hash)
+            VALUES (CAST(:id AS uuid), :email, '벤치마크', '-')
+        """),
+        {"id": user_id, "email": f"bench-{user_id}@example.com"},
+    )
+    await db.execute(
+        text("INSERT INTO projects (id, user_id, name) VALUES (CAST(:id AS uuid), CAST(:user_id AS uuid), '벤치마크')"),
+        {"id": project_id, "user_id": user_id},
+    )
+    await db.commit()
+    return user_id, project_id
+
+
+async def _cleanup(db, r, user_id: str, project_id: str, note_ids: list[str]) -> None:
+    from sqlalchemy import text
+
+    from app.services.note_cache import CACHE_VERSION
+
+    params = {"note_ids": note_ids, "project_id": project_id, "user_id": user_id}
+    for statement in (
+        "DELETE FROM analyses WHERE note_id = ANY(CAST(:note_ids AS uuid[]))",
+        "DELETE FROM transcripts WHERE note_id = ANY(CAST(:note_ids AS uuid[]))",
+        "DELETE FROM notes WHERE project_id = CAST(:project_id AS uuid)",
+        "DELETE FROM projects WHERE id = CAST(:project_id AS uuid)",
+        "DELETE FROM users WHERE id = CAST(:user_id AS uuid)",
+    ):
+        await db.execute(text(statement), params)
+    await db.commit()
+    if note_ids:
+        await r.delete(*(f"voice:note:v{CACHE_VERSION}:{note_id}" for note_id in note_ids))
+
+
+async def run_pipeline(audio_files: list[tuple[str, Path]], repeat: int, stt: str) -> list[dict]:
+    import redis.asyncio as redis
+    from sqlalchemy import text
+
+    from app.config import settings
+    from app.main import process_job
+    from app.services.db import async_session, engine
+
+    r = redis.from_url(settings.redis_url, decode_responses=True)
+    note_ids: list[str] = []
+    cases = []
+    async with async_session() as db:
+        user_id, project_id = await _create_owner(db)
+        try:
+            for label, path in audio_files:
+                before = _stage_totals()
+                walls = []
+                for _ in range(repeat):
+                    note_id = str(uuid.uuid4())
+                    note_ids.append(note_id)
+                    await db.execute(
+                        text("""
+                            INSERT INTO notes (id, project_id, title, audio_path, status)
+                            VALUES (CAST(:id AS uuid), CAST(:project_id AS uuid), :title, :audio_path, 'queued')
+                        """),
+                        {"id": note_id, "project_id": project_id, "title": path.name, "audio_path": str(path)},
+                    )
+                    await db.commit()
+
+                    start = time.perf_counter()
+                    await process_job(r, {"note_id": note_id, "audio_path": str(path), "enqueued_at": time.time()})
+                    walls.append(time.perf_counter() - start)
+
+                    status = await db.scalar(
+                        text("SELECT status FROM notes WHERE id = CAST(:id AS uuid)"), {"id": note_id}
+                    )
+                    await db.commit()
+                    if status != "completed":
+                        raise RuntimeError(f"작업이 완료되지 않았습니다: note_id={note_id}, status={status}")
+                cases.append(
+                    _summarize(f"pipeline-{stt}-{label}", wav_duration(str(path)), walls, before, _stage_totals())
+                )
+                print(json.dumps(cases[-1], ensure_ascii=False))
+        finally:
+            await _cleanup(db, r, user_id, project_id, note_ids)
+            await r.aclose()
+    await engine.dispose()
+    return cases
+
+
+def _metadata(args) -> dict:
+    from app.config import settings
+
+    def version(package: str) -> str | None:
+        try:
+            return metadata.version(package)
+        except metadata.PackageNotFoundError:
+            return None
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "whisperx": version("whisperx"),
+        "torch": version("torch"),
+        "mode": args.mode,
+        "stt": args.stt,
+        "device": args.device,
+        "model_policy": settings.model_policy,
+        "whisper_model": settings.whisper_model,
+        "whisper_compute_type": settings.whisper_compute_type,
+        "whisper_batch_size": settings.whisper_batch_size,
+        "ollama_latency": args.ollama_latency,
+    }
+
+
+def compare(cases: list[dict], baseline: dict, max_regression: float) -> list[str]:
+    """기준 결과 대비 변화율을 출력하고 허용치를 넘은 회귀 목록을 반환합니다."""
+    baseline_cases = {case["name"]: case for case in baseline["cases"]}
+    regressions = []
+    for case in cases:
+        base = baseline_cases.get(case["name"])
+        if base is None:
+            print(f"{case['name']}: 기준 결과 없음")
+            continue
+        for metric, higher_is_better in METRIC_HIGHER_IS_BETTER.items():
+            old, new = base[metric], case[metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            marker = " (회귀)" if worse > max_regression else ""
+            print(f"{case['name']:<32} {metric:<16} {old:>10} → {new:>10} ({change:+.1%}){marker}")
+            if marker:
+                regressions.append(f"{case['name']} {metric} {change:+.1%}")
+    return regressions
+
+
+def _case_args(args, length: str) -> list[str]:
+    """한 오디오 길이만 실행하는 하위 프로세스의 인자를 만듭니다."""
+    command = [
+        sys.executable, "-m", "benchmarks.run", "--isolated",
+        "--mode", args.mode,
+        "--stt", args.stt,
+        "--stub-rtf", str(args.stub_rtf),
+        "--lengths", length,
+        "--repeat", str(args.repeat),
+        "--seed", str(args.seed),
+        "--policy", args.policy,
+        "--device", args.device,
+        "--ollama-latency", str(args.ollama_latency),
+    ]
+    for option, value in (
+        ("--model", args.model),
+        ("--compute-type", args.compute_type),
+        ("--batch-size", args.batch_size),
+    ):
+        if value:
+            command += [option, str(value)]
+    return command
+
+
+def run_isolated(args) -> list[dict]:
+    cases = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "case.json"
+        for length in args.lengths.split(","):
+            subprocess.run([*_case_args(args, length.strip()), "--output", str(output)], check=True)
+            cases.extend(json.loads(output.read_text())["cases"])
+    return cases
+
+
+def run_cases(args) -> list[dict]:
+    from app.config import settings
+
+    audio_files = []
+    for length in (float(x) for x in args.lengths.split(",")):
+        label = f"{length:g}s"
+        audio_files.append((label, generate_speech_like(CACHE_DIR / f"speech-{label}-{args.seed}.wav", length, args.seed)))
+
+    with FakeOllama(generate_latency=args.ollama_latency) as ollama:
+        settings.ollama_url = ollama.url
+        if args.mode == "transcribe":
+            return run_transcribe(audio_files, args.repeat)
+        return asyncio.run(run_pipeline(audio_files, args.repeat, args.stt))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="워커 처리 경로 벤치마크")
+    parser.add_argument("--mode", choices=["transcribe", "pipeline"], default="pipeline")
+    parser.add_argument("--stt", choices=["whisperx", "stub"], default="stub", help="pipeline 모드의 STT 구현")
+    parser.add_argument("--stub-rtf", type=float, default=0.05, help="STT 대체 구현의 실시간 배율")
+    parser.add_argument("--lengths", default="30,120,600", help="합성 오디오 길이(초), 쉼표로 구분")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--model", help="whisper_model 재정의 (예: tiny)")
+    parser.add_argument("--compute-type", help="whisper_compute_type 재정의")
+    parser.add_argument("--batch-size", type=int, help="whisper_batch_size 재정의")
+    parser.add_argument(
+        "--policy",
+        choices=["fixed", "adaptive"],
+        default="fixed",
+        help="모델 선택 정책 (기본 fixed: 여유 메모리/대기열에 따라 모델이 바뀌지 않게)",
+    )
+    parser.add_argument("--device", choices=["auto", "cpu"], default="auto")
+    parser.add_argument("--ollama-latency", type=float, default=0.5, help="가짜 Ollama 분석 응답 지연(초)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.10)
+    # 내부용: 하위 프로세스에서 케이스를 직접 실행
+    parser.add_argument("--isolated", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # 요청마다 남는 httpx 로그가 결과 출력을 가리지 않게 함
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if args.mode == "transcribe" and args.stt == "stub":
+        args.stt = "whisperx"
+    if args.device == "cpu":
+        # torch import 전에 설정해야 GPU가 있어도 CPU를 사용
+        os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    if args.stt == "stub":
+        _install_stub_stt(args.stub_rtf)
+
+    from app.config import settings
+
+    if args.model:
+        settings.whisper_model = args.model
+    if args.compute_type:
+        settings.whisper_compute_type = args.compute_type
+    if args.batch_size:
+        settings.whisper_batch_size = args.batch_size
+    settings.model_policy = args.policy
+
+    cases = run_cases(args) if args.isolated else run_isolated(args)
+
+    result = {"meta": _metadata(args), "cases": cases}
+    if args.output:
+        args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n")
+
+    if args.baseline:
+        regressions = compare(cases, json.loads(args.baseline.read_text()), args.max_regression)
+        if regressions:
+            print("허용치를 넘은 회귀: " + ", ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
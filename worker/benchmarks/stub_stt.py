@@ -0,0 +1,56 @@
+# worker/benchmarks/stub_stt.py
+"""GPU/WhisperX 없이 파이프라인 나머지를 측정하기 위한 STT 대체 구현.
+
+app.pipelines.stt.transcribe_audio와 같은 형식의 결과를 돌려주고,
+오디오 길이 × rtf 만큼 대기해 인식 시간을 흉내 냅니다. 단계 메트릭/스팬은
+실제 구현과 같은 stage 이름(asr, alignment)으로 기록합니다.
+체크포인트 인자는 받기만 하고 사용하지 않습니다 (매 실행이 처음부터 측정되도록).
+"""
+
+import time
+
+from app.services.word_timings import pack_word_timings
+from app.tracing import stage
+from benchmarks.audio import wav_duration
+
+SEGMENT_SECONDS = 5.0
+
+
+def make_stub_transcribe(rtf: float = 0.05):
+    def transcribe_audio(audio_path: str, checkpoints=None, queue_depth: int = 0) -> dict:
+        duration = wav_duration(audio_path)
+        with stage("asr"):
+            time.sleep(duration * rtf * 0.8)
+        with stage("alignment"):
+            time.sleep(duration * rtf * 0.2)
+
+        segments = []
+        aligned = []
+        start = 0.0
+        while start < duration:
+            end = min(start + SEGMENT_SECONDS, duration)
+            segments.append({
+                "speaker": f"SPEAKER_0{len(segments) % 2}",
+                "start": round(start, 2),
+                "end": round(end, 2),
+                "text": f"합성 음성 구간 {len(segments) + 1}번의 인식 결과입니다.",
+                "confidence": 0.9,
+            })
+            # 단어 시간은 세그먼트 안에 고르게 배치
+            words = segments[-1]["text"].split()
+            step = (end - start) / len(words)
+            aligned.append({"words": [
+                {"word": word, "start": start + i * step, "end": start + (i + 1) * step, "score": 0.9}
+                for i, word in enumerate(words)
+            ]})
+            start = end
+        return {
+            "segments": segments,
+            "full_text": " ".join(s["text"] for s in segments),
+            "language": "ko",
+            "duration_seconds": round(duration, 2),
+            "profile": {"policy": "stub", "model": "stub", "compute_type": "-", "batch_size": 0, "reasons": []},
+            "word_timings": pack_word_timings(aligned),
+        }
+
+    return transcribe_audio
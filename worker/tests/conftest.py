@@ -0,0 +1,65 @@
+"""워커 테스트 공통 픽스처.
+
+DB가 필요한 테스트는 마이그레이션이 적용된 DB(DATABASE_URL)를 사용하며,
+연결할 수 없거나 스키마가 없으면 건너뜁니다.
+"""
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.services.db import async_session
+
+
+@pytest_asyncio.fixture
+async def make_note():
+    """사용자/프로젝트/노트를 DB에 직접 만들고 테스트 후 삭제하는 팩토리"""
+    try:
+        async with async_session() as db:
+            migrated = await db.scalar(text("SELECT to_regclass('webhook_deliveries')"))
+    except (OSError, DBAPIError) as e:
+        pytest.skip(f"DB에 연결할 수 없습니다: {e}")
+    if migrated is None:
+        pytest.skip("마이그레이션이 적용된 DB가 필요합니다")
+
+    user_id, project_id = str(uuid.uuid4()), str(uuid.uuid4())
+    async with async_session() as db:
+        await db.execute(
+            text("""
+                INSERT INTO users (id, email, name, password_hash)
+                VALUES (CAST(:id AS uuid), :email, '워커 테스트', 'x')
+            """),
+            {"id": user_id, "email": f"{user_id}@example.com"},
+        )
+        await db.execute(
+            text("INSERT INTO projects (id, user_id, name) VALUES (CAST(:id AS uuid), CAST(:user_id AS uuid), '테스트')"),
+            {"id": project_id, "user_id": user_id},
+        )
+        await db.commit()
+
+    async def _make_note(status: str = "processing", webhook_url: str | None = None) -> str:
+        note_id = str(uuid.uuid4())
+        async with async_session() as db:
+            await db.execute(
+                text("""
+                    INSERT INTO notes (id, project_id, title, audio_path, status, webhook_url)
+                    VALUES (CAST(:id AS uuid), CAST(:project_id AS uuid), '테스트 노트', '/tmp/none.wav',
+                            :status, :webhook_url)
+                """),
+                {"id": note_id, "project_id": project_id, "status": status, "webhook_url": webhook_url},
+            )
+            await db.commit()
+        return note_id
+
+    yield _make_note
+
+    async with async_session() as db:
+        notes = "SELECT id FROM notes WHERE project_id = CAST(:id AS uuid)"
+        for table in ("analyses", "transcripts"):
+            await db.execute(text(f"DELETE FROM {table} WHERE note_id IN ({notes})"), {"id": project_id})
+        await db.execute(text("DELETE FROM notes WHERE project_id = CAST(:id AS uuid)"), {"id": project_id})
+        await db.execute(text("DELETE FROM projects WHERE id = CAST(:id AS uuid)"), {"id": project_id})
+        await db.execute(text("DELETE FROM users WHERE id = CAST(:id AS uuid)"), {"id": user_id})
+        await db.commit()
@@ -0,0 +1,93 @@
+"""Ollama 분석 실패 처리 테스트 (httpx MockTransport로 Ollama를 대신함)"""
+import json
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from app.pipelines import analysis
+from app.pipelines.analysis import AnalysisError, analyze_transcript
+from app.services.db import async_session
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    """analysis 모듈이 만드는 httpx 클라이언트를 handler로 응답하는 클라이언트로 바꿈"""
+    client_class = httpx.AsyncClient
+
+    def install(handler):
+        monkeypatch.setattr(
+            analysis.httpx,
+            "AsyncClient",
+            lambda **kwargs: client_class(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+    return install
+
+
+class TestAnalyzeTranscript:
+    async def test_parses_response(self, ollama):
+        result = {"summary": "회의 요약", "topics": ["일정"], "keywords": ["출시"], "action_items": []}
+        ollama(lambda request: httpx.Response(200, json={"response": json.dumps(result, ensure_ascii=False)}))
+
+        assert await analyze_transcript("회의 내용") == result
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            httpx.Response(500, text="model not loaded"),
+            httpx.Response(200, json={"response": "요약할 수 없습니다"}),
+            httpx.Response(200, json={"done": True}),
+        ],
+        ids=["server-error", "not-json", "no-response"],
+    )
+    async def test_failure_raises(self, ollama, response):
+        ollama(lambda request: response)
+
+        with pytest.raises(AnalysisError):
+            await analyze_transcript("회의 내용")
+
+    async def test_connection_error_raises(self, ollama):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("연결 거부", request=request)
+
+        ollama(handler)
+
+        with pytest.raises(AnalysisError):
+            await analyze_transcript("회의 내용")
+
+
+class TestReanalyze:
+    async def test_ollama_error_keeps_existing_analysis(self, ollama, make_note):
+        # app.main은 STT 모듈(torch/whisperx)을 불러오므로 STT 의존성이 없는 환경에서는 건너뜀
+        main = pytest.importorskip("app.main")
+        note_id = await make_note(status="completed")
+        async with async_session() as db:
+            await db.execute(
+                text("""
+                    INSERT INTO transcripts (id, note_id, segments, full_text)
+                    VALUES (CAST(:id AS uuid), CAST(:note_id AS uuid), '[]', '회의 내용')
+                """),
+                {"id": str(uuid.uuid4()), "note_id": note_id},
+            )
+            await db.execute(
+                text("""
+                    INSERT INTO analyses (id, note_id, summary, topics, keywords, action_items, payload, etag)
+                    VALUES (CAST(:id AS uuid), CAST(:note_id AS uuid), '기존 요약', '["일정"]', '["출시"]', '[]',
+                            'payload', 'etag-1')
+                """),
+                {"id": str(uuid.uuid4()), "note_id": note_id},
+            )
+            await db.commit()
+        ollama(lambda request: httpx.Response(500, text="model not loaded"))
+
+        retry_job = await main.reanalyze_job(None, {"type": "reanalyze", "note_id": note_id, "attempt": 1})
+
+        assert retry_job["attempt"] == 2
+        async with async_session() as db:
+            row = (await db.execute(
+                text("SELECT summary, keywords, payload, etag FROM analyses WHERE note_id = CAST(:id AS uuid)"),
+                {"id": note_id},
+            )).one()
+        assert (row.summary, row.keywords, row.payload, row.etag) == ("기존 요약", ["출시"], b"payload", "etag-1")
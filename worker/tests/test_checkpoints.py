@@ -0,0 +1,52 @@
+"""단계 체크포인트 저장/복원 테스트"""
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services.checkpoints import Checkpoints
+
+
+@pytest.fixture
+def checkpoints(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+    return Checkpoints("note-1")
+
+
+class TestCheckpoints:
+    def test_save_and_load(self, checkpoints):
+        data = {"segments": [{"text": "안녕하세요", "start": 0.0}]}
+        checkpoints.save("asr", data)
+
+        assert checkpoints.load("asr") == data
+        assert checkpoints.load("alignment") is None
+
+    def test_completed_in_stage_order(self, checkpoints):
+        checkpoints.save("analysis", {"summary": "요약"})
+        checkpoints.save("asr", {})
+        checkpoints.save_audio(np.zeros(16, dtype=np.float32))
+
+        assert checkpoints.completed() == ["decode", "asr", "analysis"]
+
+    def test_audio_roundtrip(self, checkpoints):
+        assert checkpoints.load_audio() is None
+        audio = np.linspace(-1, 1, 1600, dtype=np.float32)
+        checkpoints.save_audio(audio)
+
+        np.testing.assert_array_equal(checkpoints.load_audio(), audio)
+
+    def test_leftover_temp_file_is_not_completed(self, checkpoints):
+        """쓰다가 죽어 남은 임시 파일은 완료로 보지 않음"""
+        checkpoints.path.mkdir(parents=True)
+        (checkpoints.path / ".asr.json.tmp").write_text("{")
+
+        assert checkpoints.completed() == []
+        assert checkpoints.load("asr") is None
+
+    def test_clear(self, checkpoints):
+        checkpoints.save("asr", {})
+        checkpoints.save_audio(np.zeros(16, dtype=np.float32))
+        checkpoints.clear()
+
+        assert not checkpoints.path.exists()
+        assert checkpoints.completed() == []
+        checkpoints.clear()
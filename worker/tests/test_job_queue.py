@@ -0,0 +1,114 @@
+"""작업 큐 회수(recover/reclaim)와 dead letter 테스트 (Redis 필요)"""
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+
+from app.config import settings
+from app.services import job_queue
+from app.services.job_queue import JobQueue
+
+
+@pytest_asyncio.fixture
+async def r(monkeypatch):
+    """테스트마다 다른 키 이름을 쓰도록 큐 키를 바꾼 Redis 클라이언트"""
+    client = redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        await client.ping()
+    except (OSError, redis.RedisError) as e:
+        await client.aclose()
+        pytest.skip(f"Redis에 연결할 수 없습니다: {e}")
+
+    prefix = f"test:{uuid.uuid4()}:"
+    for name in ("QUEUE_NAME", "LOW_PRIORITY_QUEUE", "DEAD_LETTER_QUEUE", "PROCESSING_PREFIX", "HEARTBEAT_PREFIX"):
+        monkeypatch.setattr(job_queue, name, prefix + getattr(job_queue, name))
+    monkeypatch.setattr(settings, "job_max_attempts", 3)
+
+    yield client
+
+    keys = [key async for key in client.scan_iter(match=f"{prefix}*")]
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+
+
+def _job(note_id: str, attempt: int | None = None, **extra) -> str:
+    job = {"note_id": note_id, "audio_path": f"/uploads/{note_id}.wav", **extra}
+    if attempt is not None:
+        job["attempt"] = attempt
+    return json.dumps(job)
+
+
+async def _jobs(r, key: str) -> list[dict]:
+    return [json.loads(job) for job in await r.lrange(key, 0, -1)]
+
+
+class TestRecover:
+    async def test_requeues_in_order_with_next_attempt(self, r):
+        queue = JobQueue(r, "w1")
+        await r.rpush(job_queue.QUEUE_NAME, _job("waiting"))
+        await r.rpush(queue.processing, _job("a"), _job("b", attempt=2))
+
+        assert await queue.recover() == 2
+
+        jobs = await _jobs(r, job_queue.QUEUE_NAME)
+        assert [(j["note_id"], j.get("attempt")) for j in jobs] == [("a", 2), ("b", 3), ("waiting", None)]
+        assert await r.llen(queue.processing) == 0
+
+    async def test_reanalyze_returns_to_low_priority_queue(self, r):
+        queue = JobQueue(r, "w1")
+        await r.rpush(queue.processing, _job("a", type="reanalyze"))
+
+        await queue.recover()
+
+        assert [j["note_id"] for j in await _jobs(r, job_queue.LOW_PRIORITY_QUEUE)] == ["a"]
+        assert await r.llen(job_queue.QUEUE_NAME) == 0
+
+    async def test_dead_letters_at_max_attempts(self, r):
+        dead = []
+
+        async def on_dead_letter(job: dict) -> None:
+            dead.append(job)
+
+        queue = JobQueue(r, "w1", on_dead_letter=on_dead_letter)
+        await r.rpush(queue.processing, _job("a", attempt=3), _job("b", attempt=1))
+
+        assert await queue.recover() == 1
+
+        assert [j["note_id"] for j in await _jobs(r, job_queue.QUEUE_NAME)] == ["b"]
+        assert [(j["note_id"], j["attempt"]) for j in await _jobs(r, job_queue.DEAD_LETTER_QUEUE)] == [("a", 4)]
+        assert [j["note_id"] for j in dead] == ["a"]
+
+    async def test_dead_letter_callback_error_keeps_job(self, r):
+        async def on_dead_letter(job: dict) -> None:
+            raise RuntimeError("DB 연결 실패")
+
+        queue = JobQueue(r, "w1", on_dead_letter=on_dead_letter)
+        await r.rpush(queue.processing, _job("a", attempt=3))
+
+        assert await queue.recover() == 0
+        assert await r.llen(job_queue.DEAD_LETTER_QUEUE) == 1
+        assert await r.llen(queue.processing) == 0
+
+
+class TestReclaim:
+    async def test_reclaims_only_workers_without_heartbeat(self, r):
+        alive, dead = JobQueue(r, "alive"), JobQueue(r, "dead")
+        await alive.heartbeat()
+        await r.rpush(alive.processing, _job("running"))
+        await r.rpush(dead.processing, _job("orphan"))
+
+        assert await JobQueue(r, "me").reclaim() == 1
+
+        assert [(j["note_id"], j["attempt"]) for j in await _jobs(r, job_queue.QUEUE_NAME)] == [("orphan", 2)]
+        assert await r.llen(alive.processing) == 1
+        assert await r.llen(dead.processing) == 0
+
+    async def test_does_not_reclaim_own_jobs(self, r):
+        queue = JobQueue(r, "me")
+        await r.rpush(queue.processing, _job("mine"))
+
+        assert await queue.reclaim() == 0
+        assert await r.llen(queue.processing) == 1
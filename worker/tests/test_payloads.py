@@ -0,0 +1,26 @@
+"""API 응답 페이로드 인코딩 테스트"""
+import gzip
+
+from app.services.payloads import transcript_payload
+
+# backend tests/test_transcripts.py와 같은 골든 값: API의 재직렬화 결과와 같아야 함
+GOLDEN_BODY = (
+    '{"id":"00000000-0000-0000-0000-000000000001","note_id":"00000000-0000-0000-0000-000000000002",'
+    '"segments":[{"speaker":"SPEAKER_00","start":0.0,"end":1.5,"text":"안녕하세요 \\"인용\\"","confidence":null}],'
+    '"full_text":"안녕하세요 \\"인용\\""}'
+)
+GOLDEN_ETAG = "9e3291bc2cc412589c387d8e7189ce59"
+
+
+def test_transcript_payload_matches_api_golden():
+    stt_result = {
+        "segments": [
+            {"speaker": "SPEAKER_00", "start": 0.0, "end": 1.5, "text": '안녕하세요 "인용"', "confidence": None}
+        ],
+        "full_text": '안녕하세요 "인용"',
+    }
+    payload, etag = transcript_payload(
+        "00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000002", stt_result
+    )
+    assert gzip.decompress(payload).decode() == GOLDEN_BODY
+    assert etag == GOLDEN_ETAG
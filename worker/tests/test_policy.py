@@ -0,0 +1,126 @@
+"""작업별 STT 설정 선택 정책 테스트"""
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.pipelines import policy
+from app.pipelines.policy import (
+    SAMPLE_RATE,
+    InsufficientMemoryError,
+    choose_profile,
+    estimate_snr_db,
+    free_system_memory_gb,
+)
+
+
+@pytest.fixture(autouse=True)
+def policy_settings(monkeypatch):
+    for name, value in {
+        "whisper_model": "medium",
+        "whisper_compute_type": "float16",
+        "whisper_batch_size": 8,
+        "policy_min_model": "small",
+        "policy_max_model": "large-v3",
+        "policy_queue_high": 8,
+        "policy_long_seconds": 1800.0,
+        "policy_noisy_snr_db": 15.0,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+# (device, 길이, 언어, SNR, 대기열, 여유 메모리) → (모델, 연산 타입, 배치, 근거)
+PROFILE_CASES = {
+    "default": (("cuda", 600, "ko", 30.0, 0, 12.0), ("medium", "float16", 8, [])),
+    "noisy": (("cuda", 600, "ko", 10.0, 0, 12.0), ("large-v3", "float16", 8, ["noisy:10.0dB"])),
+    "queue": (("cuda", 600, "ko", 30.0, 8, 12.0), ("small", "float16", 16, ["queue:8"])),
+    "queue-ignores-noise": (("cuda", 600, "ko", 10.0, 8, 12.0), ("small", "float16", 16, ["queue:8"])),
+    "queue-stops-at-min-model": (("cuda", 600, "ko", 30.0, 16, 12.0), ("small", "float16", 16, ["queue:16"])),
+    "queue-long-english": (("cuda", 2400, "en", 30.0, 16, 12.0), ("base", "float16", 16, ["queue:16"])),
+    "memory-int8": (("cuda", 600, "ko", 30.0, 0, 2.0), ("medium", "int8_float16", 3, ["memory:int8"])),
+    "memory-smaller-model": (
+        ("cuda", 600, "ko", 10.0, 0, 2.0),
+        ("medium", "int8_float16", 3, ["noisy:10.0dB", "memory:int8", "memory:model"]),
+    ),
+    "memory-at-min-model": (
+        ("cuda", 600, "ko", 30.0, 0, 0.7),
+        ("small", "int8_float16", 1, ["memory:int8", "memory:model"]),
+    ),
+    "memory-cpu-english": (("cpu", 600, "en", 30.0, 0, 0.4), ("base", "int8", 1, ["memory:model"])),
+}
+
+
+@pytest.mark.parametrize("inputs,expected", PROFILE_CASES.values(), ids=PROFILE_CASES.keys())
+def test_choose_profile(inputs, expected):
+    profile = choose_profile(*inputs)
+
+    assert (profile["model"], profile["compute_type"], profile["batch_size"], profile["reasons"]) == expected
+    assert profile["policy"] == "adaptive"
+    assert profile["language"] == inputs[2]
+
+
+@pytest.mark.parametrize("device,free_memory_gb", [("cuda", 0.5), ("cpu", 0.3)])
+def test_memory_pressure_never_goes_below_min_model(device, free_memory_gb):
+    """하한 모델도 들어가지 않으면 더 작은 모델로 내리지 않고 실패 (재시도 대기열로)"""
+    with pytest.raises(InsufficientMemoryError):
+        choose_profile(device, 600, "ko", 30.0, 0, free_memory_gb)
+
+
+def test_model_outside_ladder_is_kept(monkeypatch):
+    monkeypatch.setattr(settings, "whisper_model", "distil-large-v3")
+
+    profile = choose_profile("cuda", 600, "en", 5.0, 32, 1.0)
+
+    assert profile["model"] == "distil-large-v3"
+    assert profile["reasons"] == []
+
+
+def test_free_memory_uses_mem_available(monkeypatch, tmp_path):
+    # 페이지 캐시가 많이 쌓인 서버: MemFree는 작지만 회수 가능한 메모리를 포함하면 충분함
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text(
+        "MemTotal:       16777216 kB\n"
+        "MemFree:         1048576 kB\n"
+        "MemAvailable:    5557453 kB\n"
+        "Cached:          4194304 kB\n"
+    )
+    monkeypatch.setattr(policy, "MEMINFO_PATH", str(meminfo))
+    assert free_system_memory_gb() == pytest.approx(5.3, abs=0.01)
+
+
+@pytest.mark.parametrize("content", [None, "MemTotal:       16777216 kB\nMemFree:         1048576 kB\n"])
+def test_free_memory_falls_back_to_sysconf(monkeypatch, tmp_path, content):
+    meminfo = tmp_path / "meminfo"
+    if content is not None:
+        meminfo.write_text(content)
+    monkeypatch.setattr(policy, "MEMINFO_PATH", str(meminfo))
+    sysconf = {"SC_AVPHYS_PAGES": 262144, "SC_PAGE_SIZE": 4096}
+    monkeypatch.setattr(policy.os, "sysconf", sysconf.__getitem__)
+    assert free_system_memory_gb() == 1.0
+
+
+def _audio(speech_ratio: float, speech_level: float, noise_level: float, seconds: float = 10.0):
+    rng = np.random.default_rng(0)
+    n = int(SAMPLE_RATE * seconds)
+    audio = rng.normal(0, noise_level, n)
+    speech = int(n * speech_ratio)
+    t = np.arange(speech) / SAMPLE_RATE
+    audio[:speech] += speech_level * np.sin(2 * np.pi * 220 * t)
+    return audio.astype(np.float32)
+
+
+# (음성 비율, 음성 크기, 잡음 크기) → SNR(dB) 범위
+SNR_CASES = {
+    "clean": ((0.5, 0.5, 0.001), (45, 60)),
+    "noisy": ((0.5, 0.05, 0.02), (3, 12)),
+    "noise-only": ((0.0, 0.0, 0.02), (0, 2)),
+}
+
+
+@pytest.mark.parametrize("audio_args,expected", SNR_CASES.values(), ids=SNR_CASES.keys())
+def test_estimate_snr_db(audio_args, expected):
+    low, high = expected
+    assert low <= estimate_snr_db(_audio(*audio_args)) <= high
+
+
+def test_estimate_snr_db_short_audio():
+    assert estimate_snr_db(np.zeros(100, dtype=np.float32)) == 0.0
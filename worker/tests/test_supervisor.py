@@ -0,0 +1,62 @@
+"""CPU 다중 프로세스 감독자 배치 계산 테스트"""
+import pytest
+
+from app import supervisor
+from app.config import settings
+from app.pipelines import policy
+from app.supervisor import plan_layout, process_budget_gb
+
+# 페이지 캐시가 쌓인 8GB 노드: MemFree는 1.1GB지만 회수 가능한 캐시를 포함하면 5.4GB
+MEMINFO = (
+    "MemTotal:        8388608 kB\n"
+    "MemFree:         1153434 kB\n"
+    "MemAvailable:    5662310 kB\n"
+    "Cached:          4194304 kB\n"
+)
+
+
+@pytest.fixture
+def meminfo(monkeypatch, tmp_path):
+    path = tmp_path / "meminfo"
+    path.write_text(MEMINFO)
+    monkeypatch.setattr(policy, "MEMINFO_PATH", str(path))
+    monkeypatch.setattr(settings, "memory_budget_gb", 0.0)
+
+
+@pytest.mark.parametrize(
+    "cores, memory_gb, model, expected",
+    [
+        # small(int8) 0.6GB + 프로세스 1.5GB = 2.1GB
+        (8, 5.4, "small", (2, 4)),
+        # MemFree로 계산하면 프로세스 하나에 코어를 모두 몰아줌
+        (8, 1.1, "small", (1, 8)),
+        (16, 32.0, "small", (4, 4)),
+        (8, 5.4, "large-v3", (1, 8)),
+    ],
+)
+def test_plan_layout(cores, memory_gb, model, expected):
+    assert plan_layout(cores, memory_gb, model) == expected
+
+
+def test_plan_layout_keeps_explicit_values():
+    assert plan_layout(8, 1.1, "small", processes=4) == (4, 2)
+    assert plan_layout(8, 5.4, "small", threads=8) == (1, 8)
+
+
+def test_process_budget(monkeypatch):
+    monkeypatch.setattr(settings, "memory_budget_gb", 0.0)
+    assert process_budget_gb(5.4, 2) == 2.7
+    monkeypatch.setattr(settings, "memory_budget_gb", 3.0)
+    assert process_budget_gb(5.4, 2) == 3.0
+
+
+def test_dry_run_uses_available_memory(monkeypatch, capsys, meminfo):
+    monkeypatch.setattr(supervisor.os, "sched_getaffinity", lambda pid: set(range(8)))
+    monkeypatch.setattr(settings, "whisper_model", "small")
+    monkeypatch.setattr("sys.argv", ["supervisor", "--dry-run", "--processes", "0", "--threads", "0"])
+
+    supervisor.main()
+
+    out = capsys.readouterr().out
+    assert "memory=5.4GB" in out
+    assert "processes=2 threads=4" in out
@@ -0,0 +1,29 @@
+"""추적 설정 테스트"""
+import ast
+import inspect
+from pathlib import Path
+
+import pytest
+
+from app import tracing
+
+BACKEND_TRACING = Path(__file__).resolve().parents[2] / "backend" / "app" / "core" / "tracing.py"
+SHARED_FUNCTIONS = ("_create_exporter", "setup_tracing", "shutdown_tracing")
+
+
+def _functions(source: str) -> dict[str, str]:
+    return {
+        node.name: ast.dump(node)
+        for node in ast.parse(source).body
+        if isinstance(node, ast.FunctionDef) and node.name in SHARED_FUNCTIONS
+    }
+
+
+def test_provider_setup_matches_api():
+    # API와 워커는 이미지가 달라 모듈을 공유할 수 없으므로 같은 구현인지 소스로 확인
+    if not BACKEND_TRACING.is_file():
+        pytest.skip("backend 소스가 없는 환경입니다")
+    backend = _functions(BACKEND_TRACING.read_text(encoding="utf-8"))
+    worker = _functions(inspect.getsource(tracing))
+    assert set(worker) == set(SHARED_FUNCTIONS)
+    assert worker == backend
@@ -0,0 +1,110 @@
+"""무음 구간 제거와 타임스탬프 복원 테스트"""
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.pipelines.vad import SAMPLE_RATE, OffsetMap, speech_regions, trim_silence
+
+
+@pytest.fixture(autouse=True)
+def vad_settings(monkeypatch):
+    for name, value in {
+        "vad_enabled": True,
+        "vad_margin_db": 12.0,
+        "vad_max_threshold_db": -40.0,
+        "vad_min_silence_seconds": 1.0,
+        "vad_padding_seconds": 0.2,
+        "vad_min_trim_ratio": 0.05,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+def _audio(seconds: float, tones: list[tuple[float, float, float]], noise: float = 0.001) -> np.ndarray:
+    """바닥 잡음 위에 (시작, 끝, 진폭) 톤을 얹은 오디오"""
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, noise, int(seconds * SAMPLE_RATE))
+    for start, end, amplitude in tones:
+        a, b = int(start * SAMPLE_RATE), int(end * SAMPLE_RATE)
+        audio[a:b] += amplitude * np.sin(2 * np.pi * 220 * np.arange(b - a) / SAMPLE_RATE)
+    return audio.astype(np.float32)
+
+
+def _seconds(regions: np.ndarray) -> list[list[float]]:
+    return (regions / SAMPLE_RATE).round(3).tolist()
+
+
+class TestSpeechRegions:
+    def test_long_silence_is_cut_with_padding(self):
+        audio = _audio(9.0, [(0.3, 1.8, 0.1), (4.8, 6.3, 0.1)])
+
+        assert _seconds(speech_regions(audio)) == [[0.1, 2.0], [4.6, 6.5]]
+
+    def test_short_pause_is_kept(self):
+        audio = _audio(9.0, [(0.3, 1.8, 0.1), (2.4, 3.9, 0.1)])
+
+        assert _seconds(speech_regions(audio)) == [[0.1, 4.1]]
+
+    def test_overlapping_padding_is_merged(self, monkeypatch):
+        monkeypatch.setattr(settings, "vad_padding_seconds", 0.6)
+        audio = _audio(9.0, [(0.3, 1.8, 0.1), (2.91, 4.5, 0.1)])
+
+        assert _seconds(speech_regions(audio)) == [[0.0, 5.1]]
+
+    def test_no_speech(self):
+        assert len(speech_regions(_audio(3.0, []))) == 0
+
+    def test_quiet_speech_in_speech_heavy_audio_is_kept(self):
+        """무음이 거의 없으면 하위 10%가 작은 말소리라도 음성으로 유지"""
+        audio = _audio(10.0, [(0.0, 4.0, 0.3), (4.0, 5.5, 0.03), (5.5, 10.0, 0.3)])
+
+        assert _seconds(speech_regions(audio)) == [[0.0, 10.0]]
+        trimmed, offset_map = trim_silence(audio)
+        assert offset_map is None
+        assert trimmed is audio
+
+
+class TestTrimSilence:
+    def test_trims_and_maps_back(self):
+        audio = _audio(9.0, [(0.3, 1.8, 0.1), (4.8, 6.3, 0.1)])
+
+        trimmed, offset_map = trim_silence(audio)
+
+        assert len(trimmed) == int(3.8 * SAMPLE_RATE)
+        assert offset_map.to_original([0.0, 1.0, 2.0, 3.8], end=True).round(3).tolist() == [0.1, 1.1, 4.7, 6.5]
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "vad_enabled", False)
+        audio = _audio(9.0, [(0.3, 1.8, 0.1)])
+
+        assert trim_silence(audio) == (audio, None)
+
+
+class TestOffsetMap:
+    # 잘라낸 오디오 [0, 1.9)는 원본 [0.1, 2.0), [1.9, 3.8)은 원본 [4.6, 6.5)
+    offset_map = OffsetMap(np.array([0.0, 1.9]), np.array([0.1, 4.6]), np.array([1.9, 1.9]))
+
+    @pytest.mark.parametrize(
+        "times,end,expected",
+        [
+            ([0.0, 0.5, 1.2], False, [0.1, 0.6, 1.3]),
+            ([2.0, 3.8], False, [4.7, 6.5]),
+            # 경계: 시작 시간은 다음 구간의 시작, 끝 시간은 앞 구간의 끝
+            ([1.9], False, [4.6]),
+            ([1.9], True, [2.0]),
+            ([0.0], True, [0.1]),
+        ],
+        ids=["first-region", "second-region", "boundary-start", "boundary-end", "zero-end"],
+    )
+    def test_to_original(self, times, end, expected):
+        assert self.offset_map.to_original(times, end=end).round(3).tolist() == expected
+
+    def test_remap_segments(self):
+        segments = [
+            {"start": 1.5, "end": 1.9, "text": "안녕", "words": [{"start": 1.5, "end": 1.9}]},
+            {"start": 1.9, "end": 2.4, "text": "하세요"},
+        ]
+
+        assert self.offset_map.remap_segments(segments) == [
+            {"start": 1.6, "end": 2.0, "text": "안녕", "words": [{"start": 1.6, "end": 2.0}]},
+            {"start": 4.6, "end": 5.1, "text": "하세요"},
+        ]
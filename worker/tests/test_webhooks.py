@@ -0,0 +1,95 @@
+"""웹훅 전송 테스트 (httpx MockTransport로 수신 측을 대신함)"""
+import hashlib
+import hmac
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from app.config import settings
+from app.services import webhooks
+from app.services.db import async_session
+from app.services.webhooks import SIGNATURE_HEADER, TIMESTAMP_HEADER, WebhookDispatcher, enqueue_webhook
+
+SECRET = "test-webhook-secret"
+DELIVERY = {"id": uuid.uuid4(), "note_id": uuid.uuid4(), "event": "note.completed", "url": "https://hook.test/"}
+PAYLOAD = {"note": {"id": "n", "title": "회의"}, "transcript": None, "analysis": None}
+
+
+@pytest.fixture
+def secret(monkeypatch):
+    monkeypatch.setattr(settings, "webhook_secret", SECRET)
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestDeliver:
+    async def test_signs_body_with_timestamp(self, secret):
+        received = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request)
+            return httpx.Response(204)
+
+        async with _client(handler) as client:
+            assert await webhooks._deliver(client, DELIVERY, PAYLOAD) is None
+
+        request = received[0]
+        signed = f"{request.headers[TIMESTAMP_HEADER]}.".encode() + request.content
+        expected = hmac.new(SECRET.encode(), signed, hashlib.sha256).hexdigest()
+        assert request.headers[SIGNATURE_HEADER] == f"sha256={expected}"
+
+    async def test_never_sends_unsigned(self, monkeypatch):
+        monkeypatch.setattr(settings, "webhook_secret", "")
+        received = []
+
+        async with _client(lambda request: received.append(request) or httpx.Response(204)) as client:
+            error = await webhooks._deliver(client, DELIVERY, PAYLOAD)
+
+        assert error is not None
+        assert received == []
+
+    async def test_server_error_is_reported(self, secret):
+        async with _client(lambda request: httpx.Response(503)) as client:
+            assert await webhooks._deliver(client, DELIVERY, PAYLOAD) == "HTTP 503"
+
+
+class TestDispatcher:
+    async def _delivery(self, note_id: str):
+        async with async_session() as db:
+            row = await db.execute(
+                text("""
+                    SELECT status, attempts, last_error, next_attempt_at > now() AS deferred
+                    FROM webhook_deliveries WHERE note_id = CAST(:id AS uuid)
+                """),
+                {"id": note_id},
+            )
+            return row.one()
+
+    async def test_retries_after_server_error(self, secret, make_note):
+        note_id = await make_note(status="completed", webhook_url="https://hook.test/done")
+        async with async_session() as db:
+            await enqueue_webhook(db, note_id, "note.completed")
+            await db.commit()
+
+        dispatcher = WebhookDispatcher()
+        async with _client(lambda request: httpx.Response(503)) as client:
+            assert await dispatcher.dispatch_once(client) >= 1
+        delivery = await self._delivery(note_id)
+        assert (delivery.status, delivery.attempts, delivery.last_error) == ("pending", 1, "HTTP 503")
+        assert delivery.deferred
+
+        # 백오프 기한이 지나면 다시 전송
+        async with async_session() as db:
+            await db.execute(
+                text("UPDATE webhook_deliveries SET next_attempt_at = now() WHERE note_id = CAST(:id AS uuid)"),
+                {"id": note_id},
+            )
+            await db.commit()
+        async with _client(lambda request: httpx.Response(200)) as client:
+            assert await dispatcher.dispatch_once(client) >= 1
+        delivery = await self._delivery(note_id)
+        assert (delivery.status, delivery.attempts, delivery.last_error) == ("delivered", 2, None)
@@ -0,0 +1,25 @@
+"""단어 타이밍 압축 형식 테스트"""
+from app.services.word_timings import pack_word_timings, word_timings_etag
+
+# backend tests/test_transcripts.py와 같은 골든 값: API가 워커의 저장본을 그대로 읽어야 함
+GOLDEN_WORD_SEGMENTS = [
+    {"words": [{"word": "안녕", "start": 0.5, "end": 0.75, "score": 0.5}, {"word": "2024"}]},
+    {"words": []},
+    {"words": [{"word": "하세요", "start": 1.0, "end": 1.5, "score": 0.25}]},
+]
+GOLDEN_WORD_TIMINGS = bytes.fromhex(
+    "5657543103000000030000000000003f0000403f0000803f0000403f0000403f0000c03f0000003f0000c07f0000803e"
+    "00000000060000000a0000001300000000000000020000000200000003000000ec9588eb859532303234ed9598ec84b8ec9a94"
+)
+GOLDEN_WORD_TIMINGS_ETAG = "a3765f4e51c953a6ce621912d22473d8"
+
+
+def test_pack_matches_api_golden():
+    assert pack_word_timings(GOLDEN_WORD_SEGMENTS) == GOLDEN_WORD_TIMINGS
+    assert word_timings_etag(GOLDEN_WORD_TIMINGS) == GOLDEN_WORD_TIMINGS_ETAG
+
+
+def test_segment_without_words():
+    # 헤더(단어 0, 세그먼트 1) + 텍스트 오프셋 [0] + 세그먼트 오프셋 [0, 0]
+    data = pack_word_timings([{"text": "정렬 없음"}])
+    assert data == bytes.fromhex("565754310000000001000000" "00000000" "0000000000000000")